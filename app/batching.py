@@ -0,0 +1,34 @@
+"""
+Обработка потоков кусками: нарезка итератора и пул процессов с
+ограниченным числом кусков в работе. Общие для генератора (app.generator),
+экспорта (app.export) и конвертера (app.convert_skills).
+"""
+from collections import deque
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    """Разрезать поток на списки по size элементов (последний — короче)."""
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_in_order(pool, fn: Callable, chunks: Iterable, in_flight: int) -> Iterator:
+    """
+    pool.submit(fn, chunk) для каждого куска, результаты — в порядке кусков.
+    В работе держим не больше in_flight кусков: новый отправляется, только
+    когда забран самый старый, так что память не растёт, даже если
+    потребитель медленнее пула.
+    """
+    chunks = iter(chunks)
+    pending = deque(pool.submit(fn, chunk) for chunk in islice(chunks, in_flight))
+    while pending:
+        result = pending.popleft().result()
+        for chunk in islice(chunks, 1):
+            pending.append(pool.submit(fn, chunk))
+        yield result
@@ -0,0 +1,145 @@
+"""
+Версионированный двоичный формат персонажей.
+
+Файл:
+    MAGIC (8 байт) | версия u16 | отпечаток каталогов (16 байт) | записи...
+
+Запись (little-endian):
+    длина записи без этого поля u32
+    FIXED: tl u8 | total_points i32 | points_spent i32 | ST DX IQ HT Will Per i16 x 6
+    блок (encode_block):
+        длина имени u16 | длина архетипа u8 | число преимуществ u16
+        число недостатков u16 | число навыков u16
+        имя (utf-8) | архетип (ascii)
+        индексы преимуществ u32... | индексы недостатков u32...
+        (индекс навыка u32, очки u32)...
+
+Черты и навыки хранятся индексами в каталогах (см. app.compact), поэтому
+файл читается только при совпадающем отпечатке каталогов. Индексы —
+u32: каталоги на сотни тысяч записей помещаются без смены формата
+(в версии 1 были u16, до 65 535 записей).
+"""
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Tuple
+
+from app.models import Character
+from app.compact import catalog_fingerprint, pack_character, unpack_character
+
+
+MAGIC = b"GURPSCHR"
+VERSION = 2
+
+FILE_HEADER = struct.Struct("<8sH16s")
+RECORD_LEN = struct.Struct("<I")
+# tl, total_points, points_spent, ST DX IQ HT Will Per
+FIXED = struct.Struct("<Bii6h")
+# длина имени, длина архетипа, число преимуществ, недостатков, навыков
+BLOCK_HEAD = struct.Struct("<HBHHH")
+SKILL_ENTRY = struct.Struct("<II")
+# Индекс черты в каталоге
+INDEX = "I"
+
+
+def encode_block(name: str, archetype: str, adv_ids, dis_ids, skill_pairs) -> bytes:
+    """
+    Часть записи переменной длины: BLOCK_HEAD, имя, архетип, индексы черт
+    и пары (навык, очки). Общая для файла персонажей и корпуса (app.corpus).
+    Не влезающие в поля значения дают struct.error.
+    """
+    name_b = name.encode("utf-8")
+    arch_b = archetype.encode("ascii")
+    return b"".join((
+        BLOCK_HEAD.pack(len(name_b), len(arch_b), len(adv_ids), len(dis_ids), len(skill_pairs)),
+        name_b,
+        arch_b,
+        struct.pack(f"<{len(adv_ids)}{INDEX}", *adv_ids),
+        struct.pack(f"<{len(dis_ids)}{INDEX}", *dis_ids),
+        b"".join(SKILL_ENTRY.pack(i, pts) for i, pts in skill_pairs),
+    ))
+
+
+def decode_block(buf, pos: int) -> Tuple:
+    """Разобрать блок encode_block с позиции pos: (имя, архетип, преимущества, недостатки, навыки)."""
+    name_len, arch_len, n_adv, n_dis, n_skills = BLOCK_HEAD.unpack_from(buf, pos)
+    pos += BLOCK_HEAD.size
+    name = bytes(buf[pos:pos + name_len]).decode("utf-8")
+    pos += name_len
+    archetype = bytes(buf[pos:pos + arch_len]).decode("ascii")
+    pos += arch_len
+    width = struct.calcsize(INDEX)
+    adv_ids = struct.unpack_from(f"<{n_adv}{INDEX}", buf, pos)
+    pos += width * n_adv
+    dis_ids = struct.unpack_from(f"<{n_dis}{INDEX}", buf, pos)
+    pos += width * n_dis
+    skill_pairs = tuple(SKILL_ENTRY.iter_unpack(buf[pos:pos + SKILL_ENTRY.size * n_skills]))
+    return name, archetype, adv_ids, dis_ids, skill_pairs
+
+
+def encode_character(char: Character) -> bytes:
+    """Запись одного персонажа (с префиксом длины)."""
+    (name, tl, total_points, archetype, points_spent,
+     attrs, adv_ids, dis_ids, skill_pairs) = pack_character(char)
+    try:
+        body = FIXED.pack(tl, total_points, points_spent, *attrs) + encode_block(
+            name, archetype, adv_ids, dis_ids, skill_pairs)
+    except struct.error as e:
+        raise ValueError(f"Персонаж {name!r} не помещается в формат v{VERSION}: {e}") from None
+    return RECORD_LEN.pack(len(body)) + body
+
+
+def decode_character(buf, offset: int = 0) -> Tuple[Character, int]:
+    """Прочитать запись из buf начиная с offset; вернуть (персонаж, конец записи)."""
+    (length,) = RECORD_LEN.unpack_from(buf, offset)
+    pos = offset + RECORD_LEN.size
+    end = pos + length
+
+    tl, total_points, points_spent, *attrs = FIXED.unpack_from(buf, pos)
+    name, archetype, adv_ids, dis_ids, skill_pairs = decode_block(buf, pos + FIXED.size)
+
+    char = unpack_character((
+        name, tl, total_points, archetype, points_spent,
+        tuple(attrs), adv_ids, dis_ids, skill_pairs,
+    ))
+    return char, end
+
+
+def file_header() -> bytes:
+    return FILE_HEADER.pack(MAGIC, VERSION, catalog_fingerprint())
+
+
+def check_header(buf, offset: int = 0) -> int:
+    """Проверить заголовок (магия, версия, отпечаток). Возвращает смещение первой записи."""
+    if len(buf) - offset < FILE_HEADER.size:
+        raise ValueError("Файл слишком короткий для заголовка")
+    magic, version, fingerprint = FILE_HEADER.unpack_from(buf, offset)
+    if magic != MAGIC:
+        raise ValueError("Это не файл персонажей GURPS")
+    if version != VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата: {version}")
+    if fingerprint != catalog_fingerprint():
+        raise ValueError("Файл записан для другого каталога навыков/черт")
+    return offset + FILE_HEADER.size
+
+
+def write_characters(chars: Iterable[Character], out: Path | BinaryIO) -> int:
+    """Записать персонажей в файл (путь или открытый бинарный поток)."""
+    if isinstance(out, (str, Path)):
+        with open(out, "wb", buffering=1 << 20) as f:
+            return write_characters(chars, f)
+
+    out.write(file_header())
+    count = 0
+    for char in chars:
+        out.write(encode_character(char))
+        count += 1
+    return count
+
+
+def read_characters(path: Path) -> Iterator[Character]:
+    """Прочитать всех персонажей из файла по порядку."""
+    data = Path(path).read_bytes()
+    offset = check_header(data)
+    while offset < len(data):
+        char, offset = decode_character(data, offset)
+        yield char
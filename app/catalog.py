@@ -0,0 +1,132 @@
+"""
+Битовый индекс каталогов (SKILLS / ADVANTAGES / DISADVANTAGES) для фильтра
+по TL и тегам.
+
+Для каждого TL 0..12 и каждого тега хранится одно большое целое —
+битовая маска позиций в каталоге. Запрос (tl, allow_super, allow_supernatural)
+сводится к AND/AND-NOT нескольких целых, а результат запоминается.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Tuple
+
+from app.models import TAG_BITS
+
+
+MAX_TL = 12
+
+# Позиции установленных битов для каждого байта: разбор маски идёт
+# по байтам, а не по битам
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+
+
+def _mask_from_positions(positions: List[int], size: int) -> int:
+    """Маска из списка позиций за O(n) (без n сдвигов больших целых)."""
+    bitmap = bytearray((size + 7) // 8)
+    for i in positions:
+        bitmap[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bitmap, "little")
+
+
+def mask_positions(mask: int) -> List[int]:
+    """Номера установленных битов маски по возрастанию."""
+    positions = []
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for byte_no, byte in enumerate(data):
+        if byte:
+            base = byte_no << 3
+            positions.extend(base + bit for bit in _BYTE_BITS[byte])
+    return positions
+
+
+class CatalogIndex:
+    """Битовый индекс одного каталога."""
+
+    def __init__(self, items: Sequence):
+        self.items = items
+        self.size = len(items)
+
+        by_tl: List[List[int]] = [[] for _ in range(MAX_TL + 1)]
+        by_tag: Dict[str, List[int]] = {tag: [] for tag in TAG_BITS}
+        for i, item in enumerate(items):
+            for tl in range(max(item.min_tl, 0), min(item.max_tl, MAX_TL) + 1):
+                by_tl[tl].append(i)
+            for tag, bit in TAG_BITS.items():
+                if item.tag_mask & bit:
+                    by_tag[tag].append(i)
+
+        self._tl_masks: Dict[int, int] = {
+            tl: _mask_from_positions(positions, self.size)
+            for tl, positions in enumerate(by_tl)
+        }
+        self.tag_masks: Dict[str, int] = {
+            tag: _mask_from_positions(positions, self.size)
+            for tag, positions in by_tag.items()
+        }
+        self._queries: Dict[Tuple[int, bool, bool], Tuple[int, ...]] = {}
+        self._views: Dict[Tuple[int, bool, bool], Tuple] = {}
+
+    def tl_mask(self, tl: int) -> int:
+        """Маска доступных на TL позиций; TL вне 0..12 считается по запросу."""
+        mask = self._tl_masks.get(tl)
+        if mask is None:
+            positions = [i for i, item in enumerate(self.items)
+                         if item.min_tl <= tl <= item.max_tl]
+            mask = self._tl_masks[tl] = _mask_from_positions(positions, self.size)
+        return mask
+
+    def query_mask(self, tl: int, allow_super: bool, allow_supernatural: bool) -> int:
+        mask = self.tl_mask(tl)
+        if not allow_super:
+            mask &= ~self.tag_masks["super"]
+        if not allow_supernatural:
+            mask &= ~self.tag_masks["supernatural"]
+        return mask
+
+    def query_indices(self, tl: int, allow_super: bool,
+                      allow_supernatural: bool) -> Tuple[int, ...]:
+        """Позиции подходящих записей в порядке каталога (результат запоминается)."""
+        key = (tl, allow_super, allow_supernatural)
+        indices = self._queries.get(key)
+        if indices is None:
+            indices = tuple(mask_positions(self.query_mask(*key)))
+            self._queries[key] = indices
+        return indices
+
+    def query(self, tl: int, allow_super: bool, allow_supernatural: bool) -> List:
+        """Подходящие записи в порядке каталога (новый список)."""
+        key = (tl, allow_super, allow_supernatural)
+        view = self._views.get(key)
+        if view is None:
+            items = self.items
+            view = self._views[key] = tuple(items[i] for i in self.query_indices(*key))
+        return list(view)
+
+
+# Индексы по id(каталога); держим ссылку на сам список, чтобы id не переиспользовался
+_INDEXES: "OrderedDict[int, CatalogIndex]" = OrderedDict()
+_MAX_INDEXES = 32
+
+
+def get_catalog_index(items: Sequence) -> CatalogIndex:
+    """
+    Индекс каталога из кэша. Перестраивается, если у списка поменялась длина;
+    после правки записей «на месте» нужен invalidate_catalog_indexes().
+    """
+    key = id(items)
+    index = _INDEXES.get(key)
+    if index is not None and index.items is items and index.size == len(items):
+        _INDEXES.move_to_end(key)
+        return index
+
+    index = CatalogIndex(items)
+    _INDEXES[key] = index
+    _INDEXES.move_to_end(key)
+    while len(_INDEXES) > _MAX_INDEXES:
+        _INDEXES.popitem(last=False)
+    return index
+
+
+def invalidate_catalog_indexes() -> None:
+    _INDEXES.clear()
@@ -0,0 +1,219 @@
+"""
+Колоночный двоичный каталог навыков — альтернатива сгенерированному
+data_skills_src.py, которую не нужно компилировать и исполнять.
+
+Файл (little-endian):
+    MAGIC (8 байт) | версия u16 | число навыков u32 | число категорий u16
+    таблица категорий: (длина u8, имя utf-8)... — бит i маски = i-я категория
+    смещения имён: u32 x (count + 1) | имена подряд (utf-8)
+    колонки по count значений:
+        атрибут u8 (индекс в ATTRS) | сложность u8 (индекс в DIFFICULTIES)
+        min_tl u8 | max_tl u8 | маска тегов u8 (TAG_BITS)
+        маска категорий u32 | базовый вес u16
+
+CatalogFile читает файл одним чтением и разбирает колонки целиком, а
+объекты Skill создаёт только при обращении к конкретной записи — это для
+точечного доступа (catalog[i], catalog.name(i)). SKILLS из такого файла
+(GURPS_SKILLS_CATALOG) собирается read_catalog целиком: генератор
+фильтрует весь каталог, так что все Skill создаются сразу при первом
+обращении к SKILLS. Выигрыш против data_skills_src.py — в отсутствии
+компиляции и исполнения модуля, а не в ленивости.
+"""
+import struct
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List
+
+from app.models import ATTRS, TAG_BITS, Skill
+
+
+MAGIC = b"GURPSCAT"
+VERSION = 2
+
+HEADER = struct.Struct("<8sHIH")
+
+DIFFICULTIES = ("E", "A", "H", "VH")
+MAX_CATEGORIES = 32
+
+# (формат элемента, имя колонки) в порядке записи
+COLUMNS = (
+    ("B", "attr"),
+    ("B", "difficulty"),
+    ("B", "min_tl"),
+    ("B", "max_tl"),
+    ("B", "tag_mask"),
+    ("I", "category_mask"),
+    ("H", "base_weight"),
+)
+
+
+class CatalogWriter:
+    """Копит колонки по одной записи и пишет файл целиком в конце."""
+
+    def __init__(self):
+        self.categories: Dict[str, int] = {}
+        self.names: List[bytes] = []
+        self.columns: Dict[str, List[int]] = {name: [] for _, name in COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _category_mask(self, categories: Iterable[str]) -> int:
+        mask = 0
+        for c in categories:
+            bit = self.categories.get(c)
+            if bit is None:
+                if len(self.categories) == MAX_CATEGORIES:
+                    raise ValueError(f"Больше {MAX_CATEGORIES} категорий в каталоге")
+                bit = self.categories[c] = 1 << len(self.categories)
+            mask |= bit
+        return mask
+
+    def add(self, name: str, base_attr: str, difficulty: str, tags: Iterable[str],
+            min_tl: int, max_tl: int, categories: Iterable[str],
+            base_weight: int = 1) -> None:
+        try:
+            row = {
+                "attr": ATTRS.index(base_attr),
+                "difficulty": DIFFICULTIES.index(difficulty),
+                "min_tl": min_tl,
+                "max_tl": max_tl,
+                "tag_mask": sum(TAG_BITS[t] for t in set(tags)),
+                "category_mask": self._category_mask(categories),
+                "base_weight": base_weight,
+            }
+        except (ValueError, KeyError) as e:
+            raise ValueError(f"Навык {name!r} не помещается в каталог: {e}") from None
+        self.names.append(name.encode("utf-8"))
+        for column, value in row.items():
+            self.columns[column].append(value)
+
+    def add_skill(self, skill: Skill) -> None:
+        self.add(skill.name, skill.base_attr, skill.difficulty, skill.tags,
+                 skill.min_tl, skill.max_tl, sorted(skill.categories),
+                 skill.base_weight)
+
+    def to_bytes(self) -> bytes:
+        count = len(self.names)
+        parts = [HEADER.pack(MAGIC, VERSION, count, len(self.categories))]
+        for category in self.categories:
+            encoded = category.encode("utf-8")
+            parts.append(struct.pack("<B", len(encoded)) + encoded)
+
+        offsets = [0]
+        for encoded in self.names:
+            offsets.append(offsets[-1] + len(encoded))
+        parts.append(struct.pack(f"<{count + 1}I", *offsets))
+        parts.extend(self.names)
+
+        try:
+            for fmt, column in COLUMNS:
+                parts.append(struct.pack(f"<{count}{fmt}", *self.columns[column]))
+        except struct.error as e:
+            raise ValueError(f"Значение вне диапазона колонки: {e}") from None
+        return b"".join(parts)
+
+    def write(self, path: Path) -> int:
+        Path(path).write_bytes(self.to_bytes())
+        return len(self.names)
+
+
+def write_catalog(skills: Iterable[Skill], path: Path) -> int:
+    """Записать готовые Skill в колоночный файл. Возвращает их число."""
+    writer = CatalogWriter()
+    for skill in skills:
+        writer.add_skill(skill)
+    return writer.write(path)
+
+
+class CatalogFile(Sequence):
+    """Каталог из файла: len(), catalog[i] (Skill создаётся лениво), materialize()."""
+
+    def __init__(self, data: bytes):
+        if len(data) < HEADER.size:
+            raise ValueError("Файл слишком короткий для заголовка")
+        magic, version, count, n_categories = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Это не каталог навыков GURPS")
+        if version != VERSION:
+            raise ValueError(f"Неподдерживаемая версия каталога: {version}")
+
+        try:
+            pos = HEADER.size
+            categories = []
+            for _ in range(n_categories):
+                (length,) = struct.unpack_from("<B", data, pos)
+                categories.append(data[pos + 1:pos + 1 + length].decode("utf-8"))
+                pos += 1 + length
+
+            self._offsets = struct.unpack_from(f"<{count + 1}I", data, pos)
+            pos += 4 * (count + 1)
+            self._names = data[pos:pos + self._offsets[-1]]
+            pos += self._offsets[-1]
+
+            columns = {}
+            for fmt, column in COLUMNS:
+                columns[column] = struct.unpack_from(f"<{count}{fmt}", data, pos)
+                pos += struct.calcsize(f"<{count}{fmt}")
+        except struct.error:
+            raise ValueError("Каталог обрезан или повреждён") from None
+
+        self._count = count
+        self._categories = tuple(categories)
+        self._columns = columns
+        self._items: List[Skill | None] = [None] * count
+        self._category_sets: Dict[int, FrozenSet[str]] = {}
+
+    @classmethod
+    def open(cls, path: Path) -> "CatalogFile":
+        return cls(Path(path).read_bytes())
+
+    def __len__(self) -> int:
+        return self._count
+
+    def name(self, i: int) -> str:
+        """Имя без создания Skill."""
+        return self._names[self._offsets[i]:self._offsets[i + 1]].decode("utf-8")
+
+    def _categories_of(self, mask: int) -> FrozenSet[str]:
+        cats = self._category_sets.get(mask)
+        if cats is None:
+            cats = self._category_sets[mask] = frozenset(
+                c for bit, c in enumerate(self._categories) if mask >> bit & 1
+            )
+        return cats
+
+    def _build(self, i: int) -> Skill:
+        col = self._columns
+        tag_mask = col["tag_mask"][i]
+        return Skill(
+            name=self.name(i),
+            base_attr=ATTRS[col["attr"][i]],
+            difficulty=DIFFICULTIES[col["difficulty"][i]],
+            tags=[t for t, bit in TAG_BITS.items() if tag_mask & bit],
+            min_tl=col["min_tl"][i],
+            max_tl=col["max_tl"][i],
+            categories=self._categories_of(col["category_mask"][i]),
+            base_weight=col["base_weight"][i],
+        )
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("индекс навыка вне каталога")
+        skill = self._items[i]
+        if skill is None:
+            skill = self._items[i] = self._build(i)
+        return skill
+
+    def materialize(self) -> List[Skill]:
+        """Все навыки списком (для SKILLS)."""
+        return [self[i] for i in range(self._count)]
+
+
+def read_catalog(path: Path) -> List[Skill]:
+    """Весь каталог списком Skill (создаются сразу все записи)."""
+    return CatalogFile.open(path).materialize()
@@ -0,0 +1,102 @@
+import hashlib
+from typing import Dict, List, Tuple
+
+from app.models import ATTRS, Character, CharacterSkill
+from app.data_traits import ADVANTAGES, DISADVANTAGES
+from app import data_skills
+
+
+# Компактная запись персонажа: вместо копий Skill/Advantage храним индексы
+# в каталогах. Удобно гонять между процессами и складывать на диск.
+#
+# (name, tl, total_points, archetype, points_spent,
+#  (ST, DX, IQ, HT, Will, Per),
+#  (индексы преимуществ,), (индексы недостатков,),
+#  ((индекс навыка, очки), ...))
+CompactCharacter = Tuple
+
+_INDEX_CACHE: Dict[int, Tuple[List, Dict[str, int]]] = {}
+# [ключ (id, len) каталогов, отпечаток]
+_FINGERPRINT: List = [None, b""]
+
+
+def catalog_index(items: List) -> Dict[str, int]:
+    """Имя -> позиция в каталоге (SKILLS / ADVANTAGES / DISADVANTAGES)."""
+    cached = _INDEX_CACHE.get(id(items))
+    if cached is not None and cached[0] is items and len(cached[1]) == len(items):
+        return cached[1]
+    index = {}
+    for i, item in enumerate(items):
+        index.setdefault(item.name, i)
+    _INDEX_CACHE[id(items)] = (items, index)
+    return index
+
+
+def invalidate_catalog_caches() -> None:
+    """Сбросить индексы имён и отпечаток (после подмены каталогов на месте)."""
+    _INDEX_CACHE.clear()
+    _FINGERPRINT[:] = [None, b""]
+
+
+def catalog_fingerprint() -> bytes:
+    """
+    16-байтовый отпечаток каталогов: индексы в компактной записи имеют смысл
+    только при совпадающих SKILLS / ADVANTAGES / DISADVANTAGES.
+    """
+    skills = data_skills.SKILLS
+    key = (id(skills), len(skills), id(ADVANTAGES), len(ADVANTAGES),
+           id(DISADVANTAGES), len(DISADVANTAGES))
+    if _FINGERPRINT[0] == key:
+        return _FINGERPRINT[1]
+
+    h = hashlib.blake2b(digest_size=16, person=b"gurps-catalog")
+    for s in skills:
+        h.update(f"S\x1f{s.name}\x1f{s.base_attr}\x1f{s.difficulty}\x1e".encode("utf-8"))
+    for a in ADVANTAGES:
+        h.update(f"A\x1f{a.name}\x1f{a.cost}\x1e".encode("utf-8"))
+    for d in DISADVANTAGES:
+        h.update(f"D\x1f{d.name}\x1f{d.cost}\x1e".encode("utf-8"))
+    digest = h.digest()
+    _FINGERPRINT[:] = [key, digest]
+    return digest
+
+
+def pack_character(char: Character) -> CompactCharacter:
+    skill_idx = catalog_index(data_skills.SKILLS)
+    adv_idx = catalog_index(ADVANTAGES)
+    dis_idx = catalog_index(DISADVANTAGES)
+    try:
+        return (
+            char.name,
+            char.tl,
+            char.total_points,
+            char.archetype,
+            char.points_spent,
+            tuple(getattr(char, a) for a in ATTRS),
+            tuple(adv_idx[a.name] for a in char.advantages),
+            tuple(dis_idx[d.name] for d in char.disadvantages),
+            tuple((skill_idx[s.name], s.points) for s in char.skills),
+        )
+    except KeyError as e:
+        raise ValueError(f"Черта/навык {e.args[0]!r} отсутствует в каталоге") from None
+
+
+def unpack_character(data: CompactCharacter) -> Character:
+    (name, tl, total_points, archetype, points_spent,
+     attrs, adv_ids, dis_ids, skill_pairs) = data
+
+    char = Character(
+        name=name,
+        tl=tl,
+        total_points=total_points,
+        archetype=archetype,
+        points_spent=points_spent,
+    )
+    for attr, value in zip(ATTRS, attrs):
+        setattr(char, attr, value)
+
+    char.advantages = [ADVANTAGES[i] for i in adv_ids]
+    char.disadvantages = [DISADVANTAGES[i] for i in dis_ids]
+    skills = data_skills.SKILLS
+    char.skills = [CharacterSkill(skills[i], pts) for i, pts in skill_pairs]
+    return char
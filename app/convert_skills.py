@@ -1,5 +1,14 @@
+import argparse
+import hashlib
+import marshal
+import os
 import re
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple
+
+from app.batching import chunked, map_in_order
+
+from app.skill_dedupe import DEFAULT_THRESHOLD, EXACT, POLICIES, Deduplicator
 
 
 # === Маппинги сокращений -> GURPS-атрибуты и сложности ===
@@ -27,156 +36,224 @@ ATTR_DIFF_RE = re.compile(
 )
 
 
+LATIN_RE = re.compile(r"[A-Za-z]")
+CYRILLIC_RE = re.compile(r"[А-Яа-яЁё]")
+
+# (имя, атрибут, сложность)
+RawSkill = Tuple[str, str, str]
+
+
 def is_english_token(tok: str) -> bool:
     """Признак английского токена (для отрезания оригинального имени)."""
-    return re.search(r"[A-Za-z]", tok) is not None
+    return LATIN_RE.search(tok) is not None
 
 
-def parse_skills(raw_text: str):
+def parse_line(raw_line: str) -> RawSkill | None:
     """
-    Парсим твой skills_raw.txt:
+    Разбор одной строки skills_raw.txt:
     - выдёргиваем русское имя
     - определяем базовый атрибут и сложность
+    None — строка не описывает умение (заголовок, продолжение, мусор).
     """
-    skills = []
+    line = raw_line.strip()
+    if not line:
+        return None
+    if line.startswith("умение") or line.startswith("Skill"):
+        return None
 
-    for raw_line in raw_text.splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-        if line.startswith("умение") or line.startswith("Skill"):
-            continue
+    m = ATTR_DIFF_RE.search(line)
+    if not m:
+        # Скорее всего продолжение строки "по умолчанию" — пропускаем
+        return None
 
-        m = ATTR_DIFF_RE.search(line)
-        if not m:
-            # Скорее всего продолжение строки "по умолчанию" — пропускаем
-            continue
+    attr_code = m.group(1)
+    diff_code = m.group(2)
 
-        attr_code = m.group(1)
-        diff_code = m.group(2)
+    base_attr = ATTR_MAP.get(attr_code)
+    difficulty = DIFF_MAP.get(diff_code)
+    if base_attr is None or difficulty is None:
+        return None
 
-        base_attr = ATTR_MAP.get(attr_code)
-        difficulty = DIFF_MAP.get(diff_code)
-        if base_attr is None or difficulty is None:
-            continue
+    left = line[:m.start()].strip()
+    tokens = left.split()
 
-        left = line[:m.start()].strip()
-        tokens = left.split()
+    # Убираем крестики "†"
+    tokens = [t for t in tokens if t != "†"]
 
-        # Убираем крестики "†"
-        tokens = [t for t in tokens if t != "†"]
+    # Русское имя — всё до первого английского токена
+    name_tokens = []
+    for t in tokens:
+        if is_english_token(t):
+            break
+        name_tokens.append(t)
 
-        # Русское имя — всё до первого английского токена
-        name_tokens = []
-        for t in tokens:
-            if is_english_token(t):
-                break
-            name_tokens.append(t)
+    if not name_tokens:
+        # На всякий случай — хотя бы что-то
+        name_tokens = [tokens[0]]
 
-        if not name_tokens:
-            # На всякий случай — хотя бы что-то
-            name_tokens = [tokens[0]]
+    return " ".join(name_tokens), base_attr, difficulty
 
-        name = " ".join(name_tokens)
-        skills.append((name, base_attr, difficulty))
 
-    return skills
+def iter_skills(lines: Iterable[str]) -> Iterator[RawSkill]:
+    """Потоковый разбор: строки (например, открытый файл) -> умения."""
+    for raw_line in lines:
+        parsed = parse_line(raw_line)
+        if parsed is not None:
+            yield parsed
 
 
-# === Определяем категории и TL по имени ===
+def parse_skills(raw_text: str):
+    """Разбор всего текста сразу (см. parse_line)."""
+    return list(iter_skills(raw_text.splitlines()))
 
-def classify_categories(name: str):
+
+def clean_skills(skills: Iterable[RawSkill],
+                 dedupe: Deduplicator | None = None) -> Iterator[RawSkill]:
     """
-    Присваиваем категории по ключевым словам.
-    Это приближённо, но близко к канону GURPS.
+    Минимальная чистка на лету: чисто английские записи и повторы
+    выбрасываются, остаётся первое вхождение. Что считать повтором, решает
+    dedupe (по умолчанию — совпадение имён после нормализации, см.
+    app.skill_dedupe). В памяти — только индекс имён.
+    Записи отдаются как есть (имя — первый элемент).
     """
-    n = name.lower()
-    cats = []
+    if dedupe is None:
+        dedupe = Deduplicator()
+    for skill in skills:
+        name = skill[0]
+        # убираем чисто английские имена, если у нас уже есть русская версия с тем же смыслом
+        if LATIN_RE.search(name) and not CYRILLIC_RE.search(name):
+            continue
+        if dedupe.keep(skill):
+            yield skill
 
-    # Ближний бой — клинки, топоры, булавы, посохи
-    if any(w in n for w in ["меч", "сабля", "рапира", "шпага", "палаша", "палаш",
-                            "топор", "булава", "дубина", "цеп", "посох", "копье",
-                            "пика", "тонфа", "дага", "нож", "кинжал", "smallsword",
-                            "broadsword", "rapier", "saber", "axe/mace", "staff"]):
-        cats.append("melee_blade")
 
-    # Рукопашка / борьба / единоборства
-    if any(w in n for w in ["драка", "борьба", "дзюдо", "дзитте", "сумо",
-                            "каратэ", "боевое единоборство", "combat", "boxing",
-                            "wrestling", "judo"]):
-        cats.append("melee_unarmed")
+# === Определяем категории и TL по имени ===
 
+# Ключевые слова -> категория. Порядок строк задаёт порядок категорий в выводе.
+# Это приближённо, но близко к канону GURPS.
+CATEGORY_KEYWORDS = (
+    # Ближний бой — клинки, топоры, булавы, посохи
+    ("melee_blade", ("меч", "сабля", "рапира", "шпага", "палаша", "палаш",
+                     "топор", "булава", "дубина", "цеп", "посох", "копье",
+                     "пика", "тонфа", "дага", "нож", "кинжал", "smallsword",
+                     "broadsword", "rapier", "saber", "axe/mace", "staff")),
+    # Рукопашка / борьба / единоборства
+    ("melee_unarmed", ("драка", "борьба", "дзюдо", "дзитте", "сумо",
+                       "каратэ", "боевое единоборство", "combat", "boxing",
+                       "wrestling", "judo")),
     # Метательное и дистанционное древнее оружие
-    if any(w in n for w in ["лук", "арбалет", "праща", "лассо", "копьеметалка",
-                            "духовая трубка", "blowpipe", "sling", "bow", "crossbow"]):
-        cats.append("ranged_primitive")
-
+    ("ranged_primitive", ("лук", "арбалет", "праща", "лассо", "копьеметалка",
+                          "духовая трубка", "blowpipe", "sling", "bow", "crossbow")),
     # Огнестрел и тяжёлое оружие
-    if any(w in n for w in ["огнестрельное оружие", "guns", "gunner",
-                            "тяжелое оружие", "распылители", "liquid projector"]):
-        cats.append("firearms")
-
+    ("firearms", ("огнестрельное оружие", "guns", "gunner",
+                  "тяжелое оружие", "распылители", "liquid projector")),
     # Лучевое/силовое/футуристическое оружие
-    if any(w in n for w in ["лучевое", "beam", "силовой меч", "силовой кнут",
-                            "мономолекулярный", "monowire"]):
-        cats.append("firearms_hi_tech")
-
+    ("firearms_hi_tech", ("лучевое", "beam", "силовой меч", "силовой кнут",
+                          "мономолекулярный", "monowire")),
     # Навигация, вождение, пилотирование
-    if any(w in n for w in ["вождение", "пилотирование", "полет",
-                            "подводная лодка", "подводник", "летчик", "малые корабли",
-                            "кораблевождение", "pilot", "driving", "boating",
-                            "airshipman", "submarine", "submariner"]):
-        cats.append("vehicle")
-
+    ("vehicle", ("вождение", "пилотирование", "полет",
+                 "подводная лодка", "подводник", "летчик", "малые корабли",
+                 "кораблевождение", "pilot", "driving", "boating",
+                 "airshipman", "submarine", "submariner")),
     # Suit'ы, скафандры
-    if any(w in n for w in ["скафандр", "environment suit", "vacc", "боевой скафандр",
-                            "костюм химзащиты", "подводный костюм"]):
-        cats.append("protective_suit")
-
+    ("protective_suit", ("скафандр", "environment suit", "vacc", "боевой скафандр",
+                         "костюм химзащиты", "подводный костюм")),
     # Компьютеры / IT
-    if any(w in n for w in ["компьютер", "computer", "программирование", "хакер"]):
-        cats.append("computer")
-
+    ("computer", ("компьютер", "computer", "программирование", "хакер")),
     # Электроника / электричество / техника
-    if any(w in n for w in ["электрон", "electric", "электрик", "electronics"]):
-        cats.append("electronics")
-
+    ("electronics", ("электрон", "electric", "электрик", "electronics")),
     # Медицина, биология
-    if any(w in n for w in ["врачебное дело", "диагностика", "хирургия", "ветеринария",
-                            "психология", "фармакология", "физиология", "биология",
-                            "анатомия", "алхимия", "poisons", "яд", "pharmacy"]):
-        cats.append("medicine")
-
+    ("medicine", ("врачебное дело", "диагностика", "хирургия", "ветеринария",
+                  "психология", "фармакология", "физиология", "биология",
+                  "анатомия", "алхимия", "poisons", "яд", "pharmacy")),
     # Научные / инженерные
-    if any(w in n for w in ["инженерия", "физика", "математика", "геология",
-                            "география", "астрономия", "металлургия", "chemistry",
-                            "химия"]):
-        cats.append("science")
-
+    ("science", ("инженерия", "физика", "математика", "геология",
+                 "география", "астрономия", "металлургия", "chemistry",
+                 "химия")),
     # Социальные / разговорные / влияние
-    if any(w in n for w in ["дипломатия", "политика", "заговаривание зубов",
-                            "харизма", "запугивание", "торговое дело", "sex appeal",
-                            "выступление", "публичное выступление", "лидерство",
-                            "попрошайничество", "хорошие манеры", "savoir-faire",
-                            "fast-talk", "diplomacy", "merchant"]):
-        cats.append("social")
-
+    ("social", ("дипломатия", "политика", "заговаривание зубов",
+                "харизма", "запугивание", "торговое дело", "sex appeal",
+                "выступление", "публичное выступление", "лидерство",
+                "попрошайничество", "хорошие манеры", "savoir-faire",
+                "fast-talk", "diplomacy", "merchant")),
     # Магия / эзотерика / ритуалы
-    if any(w in n for w in ["ритуальная магия", "тауматология", "оккульт",
-                            "экзорцизм", "ритуал", "заклинания"]):
-        cats.append("magic")
-
+    ("magic", ("ритуальная магия", "тауматология", "оккульт",
+               "экзорцизм", "ритуал", "заклинания")),
     # Выживание / природа
-    if any(w in n for w in ["выживание", "натуралист", "следопыт", "рыбная ловля",
-                            "охота", "falconry", "садовод", "сельское хозяйство"]):
-        cats.append("survival")
-
+    ("survival", ("выживание", "натуралист", "следопыт", "рыбная ловля",
+                  "охота", "falconry", "садовод", "сельское хозяйство")),
     # Воровство / скрытность
-    if any(w in n for w in ["кража", "карманное воровство", "ловкость рук",
-                            "скрытность", "маскировка", "замки", "взлом"]):
-        cats.append("stealth")
+    ("stealth", ("кража", "карманное воровство", "ловкость рук",
+                 "скрытность", "маскировка", "замки", "взлом")),
+)
 
-    return cats
+
+class KeywordMatcher:
+    """
+    Автомат Ахо–Корасик над таблицей (метка, ключевые слова).
+    Все вхождения всех ключевых слов находятся за один проход по строке,
+    так что время не зависит от числа ключевых слов.
+    match() возвращает битовую маску меток: бит i — i-я строка таблицы.
+    """
+
+    def __init__(self, table):
+        self.labels = tuple(label for label, _ in table)
+
+        goto = [{}]
+        out = [0]
+        for i, (_, keywords) in enumerate(table):
+            for keyword in keywords:
+                state = 0
+                for ch in keyword.lower():
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        out.append(0)
+                    state = nxt
+                out[state] |= 1 << i
+
+        # Суффиксные ссылки обходом в ширину; сразу достраиваем полную таблицу
+        # переходов (ДКА), чтобы в match() был один dict.get на символ
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = list(goto[0].values())
+        for state in queue:
+            out[state] |= out[fail[state]]
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                queue.append(nxt)
+
+        self._delta = delta
+        self._out = out
+
+    def match(self, text: str) -> int:
+        delta = self._delta
+        out = self._out
+        state = 0
+        found = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            found |= out[state]
+        return found
+
+    def labels_of(self, mask: int) -> list:
+        """Метки из маски в порядке таблицы."""
+        return [label for i, label in enumerate(self.labels) if mask >> i & 1]
+
+
+CATEGORY_MATCHER = KeywordMatcher(CATEGORY_KEYWORDS)
+
+
+def classify_categories(name: str):
+    """
+    Присваиваем категории по ключевым словам (CATEGORY_KEYWORDS).
+    Категории идут в порядке таблицы.
+    """
+    return CATEGORY_MATCHER.labels_of(CATEGORY_MATCHER.match(name.lower()))
 
 
 def guess_tl(name: str, categories):
@@ -240,27 +317,17 @@ def guess_tl(name: str, categories):
     return min_tl, max_tl
 
 
-def classify_tags(name: str) -> list[str]:
-    """
-    Возвращает список тегов для навыка:
-      - ["mundane"]         — обычный навык
-      - ["supernatural"]    — магия, оккультизм, ритуалы, странная эзотерика
-      - ["super"]           — ци-трюки, ки-ай, «супергеройские» штуки
-
-    Этого достаточно, чтобы заработали флаги allow_super / allow_supernatural.
-    """
-    n = name.lower()
-
+# Ключевые слова тегов; при нескольких совпадениях побеждает первая строка
+TAG_KEYWORDS = (
     # Явно магические / оккультные / ритуальные
-    magic_keywords = [
+    ("supernatural", (
         "магия", "тауматология", "ритуальная магия", "ритуальный обряд",
         "ритуал", "заклинан", "экзорцизм", "оккультизм",
         "fortune telling", "предсказание судьбы", "rune", "symbol drawing",
         "странная наука", "weird science",
-    ]
-
+    )),
     # Ци-приёмы, ки-ай, прочие «кино-» и сверхчеловеческие трюки
-    super_keywords = [
+    ("super", (
         "киай", "kiai",
         "мощный удар", "power blow",
         "смертельный удар", "pressure secrets",
@@ -277,25 +344,34 @@ def classify_tags(name: str) -> list[str]:
         "самогипноз", "autohypnosis",
         "ясный сон", "dreaming",
         "body sense", "чувство тела",
-    ]
+    )),
+)
 
-    # Явная магия/ритуалы
-    if any(k in n for k in magic_keywords):
-        return ["supernatural"]
+TAG_MATCHER = KeywordMatcher(TAG_KEYWORDS)
 
-    # Ци/супертрюки
-    if any(k in n for k in super_keywords):
-        return ["super"]
 
-    # Всё остальное — обычные навыки
-    return ["mundane"]
+def classify_tags(name: str) -> list[str]:
+    """
+    Возвращает список тегов для навыка:
+      - ["mundane"]         — обычный навык
+      - ["supernatural"]    — магия, оккультизм, ритуалы, странная эзотерика
+      - ["super"]           — ци-трюки, ки-ай, «супергеройские» штуки
+
+    Этого достаточно, чтобы заработали флаги allow_super / allow_supernatural.
+    """
+    mask = TAG_MATCHER.match(name.lower())
+    if not mask:
+        # Всё остальное — обычные навыки
+        return ["mundane"]
+    # Младший бит — первая строка TAG_KEYWORDS (магия важнее ци-трюков)
+    return [TAG_MATCHER.labels[(mask & -mask).bit_length() - 1]]
 
 
-# === Генерация кода для data_skills.py ===
+# === Генерация кода для data_skills_src.py ===
 
 HEADER = '''from typing import List
 
-from models import Skill
+from app.models import Skill
 
 
 # Сгенерировано convert_skills.py — дальше можно править вручную
@@ -305,71 +381,283 @@ SKILLS: List[Skill] = [
 FOOTER = ''']
 '''
 
+# Полная запись навыка:
+# (имя, атрибут, сложность, теги, min_tl, max_tl, категории, базовый вес)
+SkillRecord = Tuple[str, str, str, list, int, int, list, int]
 
-def generate_data_skills_py(skills, output_path: Path):
-    lines = [HEADER]
 
-    for name, attr, diff in skills:
-        cats = classify_categories(name)
-        min_tl, max_tl = guess_tl(name, cats)
+def skill_record(name: str, attr: str, diff: str) -> SkillRecord:
+    """Классификация умения: теги, TL, категории и базовый вес."""
+    cats = classify_categories(name)
+    min_tl, max_tl = guess_tl(name, cats)
 
-        # базовый вес
-        base_weight = 1
-        if "firearms" in cats or "melee_blade" in cats or "melee_unarmed" in cats:
-            base_weight = 3
-        if "computer" in cats or "electronics" in cats or "science" in cats:
-            base_weight = 2
+    # базовый вес
+    base_weight = 1
+    if "firearms" in cats or "melee_blade" in cats or "melee_unarmed" in cats:
+        base_weight = 3
+    if "computer" in cats or "electronics" in cats or "science" in cats:
+        base_weight = 2
 
-        cats_repr = "[" + ", ".join(f'"{c}"' for c in cats) + "]"
+    tags = classify_tags(name)
+    return name, attr, diff, tags, min_tl, max_tl, cats, base_weight
 
-        tags = classify_tags(name)
-        tags_repr = "[" + ", ".join(f'"{t}"' for t in tags) + "]"
 
-        line = (
-            f'    Skill('
-            f'name="{name}", '
-            f'base_attr="{attr}", '
-            f'difficulty="{diff}", '
-            f'tags={tags_repr}, '
-            f'min_tl={min_tl}, max_tl={max_tl}, '
-            f'points=0, '
-            f'categories={cats_repr}, '
-            f'base_weight={base_weight}'
-            f'),\n'
-        )
+def format_source_line(record: SkillRecord) -> str:
+    """Строка Skill(...) для data_skills_src.py."""
+    name, attr, diff, tags, min_tl, max_tl, cats, base_weight = record
+    cats_repr = "[" + ", ".join(f'"{c}"' for c in cats) + "]"
+    tags_repr = "[" + ", ".join(f'"{t}"' for t in tags) + "]"
 
-        lines.append(line)
+    return (
+        f'    Skill('
+        f'name="{name}", '
+        f'base_attr="{attr}", '
+        f'difficulty="{diff}", '
+        f'tags={tags_repr}, '
+        f'min_tl={min_tl}, max_tl={max_tl}, '
+        f'categories={cats_repr}, '
+        f'base_weight={base_weight}'
+        f'),\n'
+    )
 
-    lines.append(FOOTER)
-    output_path.write_text("".join(lines), encoding="utf-8")
+
+def skill_source_line(name: str, attr: str, diff: str) -> str:
+    return format_source_line(skill_record(name, attr, diff))
+
+
+def write_source_lines(source_lines: Iterable[str], output_path: Path) -> int:
+    """
+    Записать data_skills_src.py построчно, по мере поступления строк Skill(...).
+    Пишем во временный файл рядом и подменяем целиком, чтобы оборванный
+    прогон не оставил полкаталога. Возвращает число умений.
+    """
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as out:
+        out.write(HEADER)
+        for line in source_lines:
+            out.write(line)
+            count += 1
+        out.write(FOOTER)
+    os.replace(tmp_path, output_path)
     print(f"[OK] Сгенерирован {output_path}")
+    return count
 
 
-def main():
-    raw_path = Path("skills_raw.txt")
-    if not raw_path.exists():
-        print("Не найден файл skills_raw.txt. Положи туда исходный текст таблицы.")
-        return
+def write_records(records: Iterable[SkillRecord], output_path: Path,
+                  catalog_path: Path | None = None) -> int:
+    """
+    data_skills_src.py из записей; если задан catalog_path — заодно
+    колоночный двоичный каталог (app.catalog_file) с теми же навыками.
+    """
+    if catalog_path is None:
+        return write_source_lines(map(format_source_line, records), output_path)
 
-    raw_text = raw_path.read_text(encoding="utf-8")
-    skills = parse_skills(raw_text)
+    from app.catalog_file import CatalogWriter
+
+    writer = CatalogWriter()
+
+    def source_lines():
+        for record in records:
+            writer.add(*record)
+            yield format_source_line(record)
+
+    count = write_source_lines(source_lines(), output_path)
+    writer.write(catalog_path)
+    print(f"[OK] Сгенерирован {catalog_path}")
+    return count
+
+
+def generate_data_skills_py(skills: Iterable[RawSkill], output_path: Path,
+                            catalog_path: Path | None = None) -> int:
+    return write_records((skill_record(*s) for s in skills), output_path, catalog_path)
+
+
+# === Инкрементальная конвертация ===
+
+CACHE_VERSION = 3
 
-    # Можно минимально подчистить дубликаты и «чисто английские» записи
-    cleaned = []
-    seen_names = set()
-    for name, attr, diff in skills:
-        # убираем чисто английские имена, если у нас уже есть русская версия с тем же смыслом
-        if re.search(r"[A-Za-z]", name) and not re.search(r"[А-Яа-яЁё]", name):
-            continue
-        if name in seen_names:
-            continue
-        seen_names.add(name)
-        cleaned.append((name, attr, diff))
 
-    print(f"Найдено умений после очистки: {len(cleaned)}")
+def line_key(raw_line: str) -> bytes:
+    """Хэш нормализованной строки (без пробелов по краям)."""
+    return hashlib.blake2b(raw_line.strip().encode("utf-8"), digest_size=12).digest()
+
+
+def _code_stamp() -> bytes:
+    """Разбор и классификация зависят от этого файла: правка — кэш сброшен."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=12).digest()
+
+
+class LineCache:
+    """
+    Побочный кэш конвертации: хэш строки -> [имя, атрибут, сложность,
+    SkillRecord или None] либо None для строк без умения.
+    Классификация считается лениво — только для умений, переживших
+    чистку. При сохранении остаются только строки текущего входа.
+    Файл пишется через marshal, а не pickle: он лежит рядом с входными
+    данными и читается при каждом запуске, а распаковка marshal не
+    исполняет кода. Испорченный файл — просто промах кэша.
+    """
+
+    def __init__(self, entries: Dict[bytes, list | None] | None = None):
+        self.entries = entries or {}
+        self.used: Dict[bytes, list | None] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "LineCache":
+        """Кэш из файла; пустой, если файла нет или он от другой версии кода."""
+        try:
+            version, stamp, entries = marshal.loads(Path(path).read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return cls()
+        if version != CACHE_VERSION or stamp != _code_stamp() or not isinstance(entries, dict):
+            return cls()
+        return cls(entries)
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        payload = (CACHE_VERSION, _code_stamp(), self.used)
+        tmp_path.write_bytes(marshal.dumps(payload, 4))
+        os.replace(tmp_path, path)
+
+    def parse(self, raw_line: str) -> list | None:
+        key = line_key(raw_line)
+        if key in self.used:
+            self.hits += 1
+            return self.used[key]
+        if key in self.entries:
+            self.hits += 1
+            entry = self.entries[key]
+        else:
+            self.misses += 1
+            parsed = parse_line(raw_line)
+            entry = None if parsed is None else [*parsed, None]
+        self.used[key] = entry
+        return entry
+
+    @staticmethod
+    def record(entry: list) -> SkillRecord:
+        if entry[3] is None:
+            entry[3] = skill_record(entry[0], entry[1], entry[2])
+        return entry[3]
+
+
+def convert_incremental(lines: Iterable[str], output_path: Path, cache: LineCache,
+                        catalog_path: Path | None = None,
+                        dedupe: Deduplicator | None = None) -> int:
+    """
+    То же, что generate_data_skills_py(clean_skills(iter_skills(lines), dedupe)),
+    но разбор и классификация берутся из кэша для уже виденных строк.
+    Чистка (порядок важен) проходит заново — она дешёвая.
+    """
+    entries = (e for e in map(cache.parse, lines) if e is not None)
+    records = map(cache.record, clean_skills(entries, dedupe))
+    return write_records(records, output_path, catalog_path)
+
+
+# === Параллельная конвертация ===
+
+CHUNK_LINES = 20_000
+
+
+def _convert_chunk(lines: list) -> list:
+    """
+    Работа одного процесса: разбор, локальная чистка точных повторов
+    (первое вхождение внутри куска) и классификация выживших.
+    Возвращает [SkillRecord].
+    """
+    return [skill_record(*s) for s in clean_skills(iter_skills(lines), Deduplicator(EXACT))]
+
+
+def convert_parallel(lines: Iterable[str], output_path: Path, jobs: int,
+                     chunk_lines: int = CHUNK_LINES,
+                     catalog_path: Path | None = None,
+                     dedupe: Deduplicator | None = None) -> int:
+    """
+    То же, что generate_data_skills_py(clean_skills(iter_skills(lines), dedupe)),
+    но куски по chunk_lines строк обрабатываются в пуле из jobs процессов.
+    В кусках выбрасываются только точные повторы: первое вхождение внутри
+    куска — самое раннее в нём, а точный повтор отбросила бы и общая
+    чистка. Остальное (нормализация, похожие имена) решает dedupe при
+    слиянии кусков по порядку, поэтому результат и отчёт те же, что при
+    последовательной чистке. В работе держим не больше 2 * jobs кусков.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if dedupe is None:
+        dedupe = Deduplicator()
+
+    def merged(pool):
+        chunks = chunked(lines, chunk_lines)
+        for converted in map_in_order(pool, _convert_chunk, chunks, 2 * jobs):
+            for record in converted:
+                if dedupe.keep(record):
+                    yield record
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return write_records(merged(pool), output_path, catalog_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="skills_raw.txt -> data_skills_src.py")
+    parser.add_argument("--raw", type=Path, default=Path("skills_raw.txt"))
+    parser.add_argument("--out", type=Path, default=Path("data_skills_src.py"))
+    parser.add_argument("--incremental", action="store_true",
+                        help="переразбирать только новые/изменённые строки")
+    parser.add_argument("--cache", type=Path,
+                        help="файл кэша для --incremental (по умолчанию <raw>.cache)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="число процессов для разбора кусками")
+    parser.add_argument("--catalog", type=Path,
+                        help="заодно записать колоночный двоичный каталог (app.catalog_file)")
+    parser.add_argument("--dedupe", choices=POLICIES, default="normalized",
+                        help="exact — только точные повторы имён; normalized — ещё и после "
+                             "нормализации; similar — ещё и похожие с тем же атрибутом "
+                             "и сложностью")
+    parser.add_argument("--similarity", type=float, default=DEFAULT_THRESHOLD,
+                        help="порог похожести имён (Жаккар по триграммам)")
+    parser.add_argument("--report", type=Path,
+                        help="записать слитые и похожие (на проверку) имена в TSV")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs должен быть не меньше 1")
+    if not 0 < args.similarity <= 1:
+        parser.error("--similarity должен быть в (0, 1]")
+    if args.jobs > 1 and args.incremental:
+        parser.error("--jobs и --incremental не сочетаются")
+
+    raw_path = args.raw
+    if not raw_path.exists():
+        print(f"Не найден файл {raw_path}. Положи туда исходный текст таблицы.")
+        return
 
-    out_path = Path("data_skills.py")
-    generate_data_skills_py(cleaned, out_path)
+    dedupe = Deduplicator(args.dedupe, args.similarity, review=args.report is not None)
+    # Файл читается построчно: память не зависит от размера выгрузки
+    with open(raw_path, encoding="utf-8") as raw:
+        if args.incremental:
+            cache_path = args.cache or raw_path.with_name(raw_path.name + ".cache")
+            cache = LineCache.load(cache_path)
+            count = convert_incremental(raw, args.out, cache, args.catalog, dedupe)
+            cache.save(cache_path)
+            print(f"Строк из кэша: {cache.hits}, разобрано заново: {cache.misses}")
+        elif args.jobs > 1:
+            count = convert_parallel(raw, args.out, args.jobs, catalog_path=args.catalog,
+                                     dedupe=dedupe)
+        else:
+            count = generate_data_skills_py(clean_skills(iter_skills(raw), dedupe), args.out,
+                                            args.catalog)
+
+    print(f"Найдено умений после очистки: {count}")
+    merged = dedupe.merged()
+    print(f"Слито почти-дублей: {merged}, на проверку: {len(dedupe.report) - merged}")
+    if args.report:
+        dedupe.write_report(args.report)
+        print(f"[OK] Отчёт о дублях: {args.report}")
+    print("Не забудь обновить снимок каталога: python -m app.data_skills")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,160 @@
+"""
+Корпус персонажей на диске со случайным доступом за O(1) через mmap.
+
+Файл:
+    заголовок: MAGIC | версия u16 | отпечаток каталогов | число персонажей u64
+               | смещение таблицы атрибутов u64 | смещение таблицы offsets u64
+    блоки переменной длины (имя, архетип, черты, навыки) — подряд
+    таблица атрибутов: по записи фиксированной ширины на персонажа
+    таблица offsets: count + 1 значений u64 — начала блоков
+
+corpus[i] читает одну запись атрибутов и один блок, не трогая остальной файл.
+Файл открывается только на чтение, так что несколько процессов могут
+разделять одну популяцию через страничный кэш ОС без копирования.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Dict, Iterable, Iterator
+
+from app.models import ATTRS, Character
+from app.compact import catalog_fingerprint, pack_character, unpack_character
+from app.binary import FIXED, decode_block, encode_block
+
+
+MAGIC = b"GURPSCOR"
+# 2: индексы черт и навыков в блоках — u32 (см. app.binary)
+VERSION = 2
+
+HEADER = struct.Struct("<8sH16sQQQ")
+OFFSET = struct.Struct("<Q")
+
+
+def write_corpus(chars: Iterable[Character], path: Path) -> int:
+    """
+    Записать корпус. Блоки пишутся потоком; в памяти копятся только
+    таблицы фиксированной ширины (~34 байта на персонажа).
+    """
+    fixed = bytearray()
+    offsets = array("Q")
+
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(HEADER.pack(MAGIC, VERSION, catalog_fingerprint(), 0, 0, 0))
+        pos = HEADER.size
+        count = 0
+        for char in chars:
+            (name, tl, total_points, archetype, points_spent,
+             attrs, adv_ids, dis_ids, skill_pairs) = pack_character(char)
+            try:
+                fixed += FIXED.pack(tl, total_points, points_spent, *attrs)
+                block = encode_block(name, archetype, adv_ids, dis_ids, skill_pairs)
+            except struct.error as e:
+                raise ValueError(f"Персонаж {name!r} не помещается в формат v{VERSION}: {e}") from None
+            offsets.append(pos)
+            f.write(block)
+            pos += len(block)
+            count += 1
+        offsets.append(pos)
+
+        fixed_pos = pos
+        f.write(fixed)
+        offsets_pos = fixed_pos + len(fixed)
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        f.write(offsets.tobytes())
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, catalog_fingerprint(), count, fixed_pos, offsets_pos))
+    return count
+
+
+class Corpus(Sequence):
+    """
+    Только-для-чтения корпус: len(), corpus[i], срезы и потоковая итерация.
+    Объект можно передавать в дочерние процессы: там файл откроется заново.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Пустой файл корпуса") from None
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise ValueError("Файл слишком короткий для заголовка")
+
+        magic, version, fingerprint, count, fixed_pos, offsets_pos = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("Это не корпус персонажей GURPS")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Неподдерживаемая версия корпуса: {version}")
+        if fingerprint != catalog_fingerprint():
+            self.close()
+            raise ValueError("Корпус записан для другого каталога навыков/черт")
+
+        self._count = count
+        self._fixed_pos = fixed_pos
+        self._offsets_pos = offsets_pos
+
+    def __reduce__(self):
+        return (Corpus, (self.path,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _index(self, i: int) -> int:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("индекс персонажа вне корпуса")
+        return i
+
+    def attributes(self, i: int) -> Dict[str, int]:
+        """Только фиксированная часть: TL, очки и атрибуты без разбора блока."""
+        i = self._index(i)
+        tl, total_points, points_spent, *attrs = FIXED.unpack_from(
+            self._mm, self._fixed_pos + i * FIXED.size
+        )
+        result = {"tl": tl, "total_points": total_points, "points_spent": points_spent}
+        result.update(zip(ATTRS, attrs))
+        return result
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        i = self._index(i)
+
+        mm = self._mm
+        tl, total_points, points_spent, *attrs = FIXED.unpack_from(
+            mm, self._fixed_pos + i * FIXED.size
+        )
+
+        (pos,) = OFFSET.unpack_from(mm, self._offsets_pos + i * OFFSET.size)
+        name, archetype, adv_ids, dis_ids, skill_pairs = decode_block(mm, pos)
+
+        return unpack_character((
+            name, tl, total_points, archetype, points_spent,
+            tuple(attrs), adv_ids, dis_ids, skill_pairs,
+        ))
+
+    def __iter__(self) -> Iterator[Character]:
+        for i in range(self._count):
+            yield self[i]
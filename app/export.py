@@ -0,0 +1,157 @@
+"""
+Потоковый экспорт персонажей в JSONL и CSV.
+
+Персонажи идут генератором (например, generate_characters(..., stream=True))
+и пишутся кусками по chunk_size: в памяти одновременно держится только один
+кусок, поэтому объём корпуса ограничен диском, а не RAM.
+
+    python -m app.export --n 1000000 --points 150 --tl 8 --out npcs.jsonl.gz
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import lzma
+from pathlib import Path
+from typing import IO, Dict, Iterable, List
+
+from app.models import ATTRS, Character
+from app.batching import chunked
+from app.generator import compute_skill_level, generate_characters
+
+
+CSV_COLUMNS = (
+    "name", "tl", "total_points", "points_spent", "archetype",
+    *ATTRS,
+    "advantages", "disadvantages", "skills",
+)
+
+COMPRESSIONS = {
+    None: None,
+    "gzip": gzip.open,
+    "lzma": lzma.open,
+}
+_SUFFIX_COMPRESSION = {".gz": "gzip", ".xz": "lzma", ".lzma": "lzma"}
+
+# Размер буфера записи: крупные сплошные записи вместо множества мелких
+WRITE_BUFFER = 1 << 20
+
+
+def character_to_dict(char: Character) -> Dict:
+    """Машиночитаемое представление персонажа (для JSON)."""
+    return {
+        "name": char.name,
+        "tl": char.tl,
+        "total_points": char.total_points,
+        "points_spent": char.points_spent,
+        "archetype": char.archetype,
+        "attributes": {a: getattr(char, a) for a in ATTRS},
+        "advantages": [{"name": a.name, "cost": a.cost} for a in char.advantages],
+        "disadvantages": [{"name": d.name, "cost": d.cost} for d in char.disadvantages],
+        "skills": [
+            {
+                "name": s.name,
+                "base_attr": s.base_attr,
+                "difficulty": s.difficulty,
+                "points": s.points,
+                "level": compute_skill_level(s, char),
+            }
+            for s in char.skills
+        ],
+    }
+
+
+def character_to_row(char: Character) -> List:
+    """Плоская строка CSV; списки склеены через ';' (навыки — имя:очки)."""
+    return [
+        char.name, char.tl, char.total_points, char.points_spent, char.archetype,
+        *(getattr(char, a) for a in ATTRS),
+        ";".join(a.name for a in char.advantages),
+        ";".join(d.name for d in char.disadvantages),
+        ";".join(f"{s.name}:{s.points}" for s in char.skills),
+    ]
+
+
+def open_output(path: Path, compression: str | None = None) -> IO[str]:
+    """
+    Открыть текстовый файл на запись с большим буфером.
+    compression: None / "gzip" / "lzma"; если не задано — по расширению (.gz, .xz).
+    """
+    path = Path(path)
+    if compression is None:
+        compression = _SUFFIX_COMPRESSION.get(path.suffix)
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Неизвестное сжатие: {compression!r}")
+
+    opener = COMPRESSIONS[compression]
+    if opener is None:
+        return open(path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER)
+    raw = io.BufferedWriter(opener(path, "wb"), buffer_size=WRITE_BUFFER)
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+
+def write_jsonl(chars: Iterable[Character], path: Path,
+                compression: str | None = None, chunk_size: int = 1000) -> int:
+    """Записать персонажей в JSONL (по объекту на строку). Возвращает их число."""
+    count = 0
+    with open_output(path, compression) as out:
+        for chunk in chunked(chars, chunk_size):
+            out.write("".join(
+                json.dumps(character_to_dict(c), ensure_ascii=False) + "\n"
+                for c in chunk
+            ))
+            count += len(chunk)
+    return count
+
+
+def write_csv(chars: Iterable[Character], path: Path,
+              compression: str | None = None, chunk_size: int = 1000) -> int:
+    """Записать персонажей в CSV с заголовком. Возвращает их число."""
+    count = 0
+    with open_output(path, compression) as out:
+        writer = csv.writer(out)
+        writer.writerow(CSV_COLUMNS)
+        for chunk in chunked(chars, chunk_size):
+            writer.writerows(character_to_row(c) for c in chunk)
+            count += len(chunk)
+    return count
+
+
+WRITERS = {"jsonl": write_jsonl, "csv": write_csv}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Выгрузка сгенерированных персонажей")
+    parser.add_argument("--n", type=int, required=True)
+    parser.add_argument("--points", type=int, default=100)
+    parser.add_argument("--tl", type=int, default=3)
+    parser.add_argument("--archetype", default="generalist")
+    parser.add_argument("--allow-super", action="store_true")
+    parser.add_argument("--allow-supernatural", action="store_true")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--format", choices=sorted(WRITERS))
+    parser.add_argument("--compression", choices=["gzip", "lzma"])
+    parser.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args()
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "csv" if ".csv" in args.out.suffixes else "jsonl"
+
+    chars = generate_characters(
+        args.n, args.points, args.tl,
+        allow_super=args.allow_super,
+        allow_supernatural=args.allow_supernatural,
+        archetype=args.archetype,
+        workers=args.workers,
+        seed=args.seed,
+        stream=True,
+    )
+    count = WRITERS[fmt](chars, args.out, args.compression)
+    print(f"[OK] {count} персонажей -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,94 +1,211 @@
+import math
+import os
 import random
-from typing import List
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List, Tuple
 
-from app.models import Character, Skill
+from app.models import Character, CharacterSkill, Skill
 from app.data_traits import ADVANTAGES, DISADVANTAGES
-from app.data_skills import SKILLS
+from app import data_skills
 from app.archetypes import Archetype, ARCHETYPE_ATTR_WEIGHTS, ARCHETYPE_CATEGORY_WEIGHTS
+from app.catalog import get_catalog_index, invalidate_catalog_indexes
+from app.weights import SKILL_WEIGHT_RULES, SkillWeightRules
+from app.sampling import WeightedSampler, build_fenwick
+from app.knapsack import subset_sampler
+from app.compact import CompactCharacter, catalog_fingerprint, pack_character, unpack_character
+from app.seeding import SeedSequence
+from app.batching import map_in_order
+
+
+# ГСЧ для генерации: экземпляр random.Random, зерно (int) или None.
+# None — глобальный модуль random (поведение по умолчанию, как раньше).
+RandomSource = random.Random | int | None
+
+
+def resolve_rng(rng: RandomSource = None):
+    """Привести rng-параметр к объекту с API random.Random."""
+    if rng is None:
+        return random
+    if isinstance(rng, int):
+        return random.Random(rng)
+    return rng
+
+
+# Стоимость +1 к атрибуту в очках персонажа
+ATTR_COSTS: Dict[str, int] = {
+    "ST": 10, "DX": 20, "IQ": 20, "HT": 10,
+    "Will": 5, "Per": 5,
+}
 
 
 def filter_by_options(items: List, tl: int, allow_super: bool, allow_supernatural: bool):
-    """Фильтр по TL и GURPS-тегам (mundane/super/supernatural)."""
-    result = []
-    for item in items:
-        if not (item.min_tl <= tl <= item.max_tl):
-            continue
-        tags = set(item.tags)
-        if "super" in tags and not allow_super:
-            continue
-        if "supernatural" in tags and not allow_supernatural:
+    """
+    Фильтр по TL и GURPS-тегам (mundane/super/supernatural).
+    Ответ берётся из битового индекса каталога (app.catalog); возвращается
+    новый список в порядке каталога — его можно перемешивать.
+    """
+    return get_catalog_index(items).query(tl, allow_super, allow_supernatural)
+
+
+@dataclass
+class AttributeAllocation:
+    """Итог распределения очков по атрибутам."""
+    spent: int = 0
+    purchases: int = 0
+    rejected: int = 0  # выборы, отброшенные из-за нехватки бюджета
+
+
+def allocate_attributes(
+    char: Character,
+    budget: int,
+    target: int,
+    weights: Dict[str, int],
+    rng: RandomSource = None,
+    max_attr: int = 16,
+) -> AttributeAllocation:
+    """
+    Покупать +1 к атрибутам (выбор по весам), пока не потрачено target очков.
+
+    Кандидаты — атрибуты с весом > 0 ниже max_attr. Упёршийся в потолок атрибут
+    сразу выбывает. Если выбранный атрибут не влезает в budget, выбор
+    засчитывается как отброшенный и атрибут тоже выбывает: дешевле он уже
+    не станет, а потраченное только растёт.
+    Каждая итерация либо покупает, либо убирает кандидата, так что цикл
+    не может зациклиться при любых budget/target.
+    """
+    rng = resolve_rng(rng)
+    result = AttributeAllocation()
+
+    candidates = [a for a in ATTR_COSTS
+                  if weights.get(a, 0) > 0 and getattr(char, a) < max_attr]
+    cand_weights = [weights[a] for a in candidates]
+
+    while result.spent < target and candidates:
+        i = 0
+        if len(candidates) > 1:
+            attr = rng.choices(candidates, weights=cand_weights, k=1)[0]
+            i = candidates.index(attr)
+        attr = candidates[i]
+
+        cost = ATTR_COSTS[attr]
+        if result.spent + cost > budget:
+            result.rejected += 1
+            candidates.pop(i)
+            cand_weights.pop(i)
             continue
-        result.append(item)
+
+        value = getattr(char, attr) + 1
+        setattr(char, attr, value)
+        result.spent += cost
+        result.purchases += 1
+
+        if value >= max_attr:
+            candidates.pop(i)
+            cand_weights.pop(i)
+
     return result
 
 
-def increase_attribute_randomly(char: Character, budget: int, archetype: Archetype) -> int:
-    costs = {
-        "ST": 10, "DX": 20, "IQ": 20, "HT": 10,
-        "Will": 5, "Per": 5,
-    }
-    attrs = list(costs.keys())
+def increase_attribute_randomly(char: Character, budget: int, archetype: Archetype,
+                                rng: RandomSource = None) -> int:
+    """Потратить на атрибуты 30–50% бюджета с учётом весов архетипа."""
+    rng = resolve_rng(rng)
     weights_cfg = ARCHETYPE_ATTR_WEIGHTS.get(archetype, ARCHETYPE_ATTR_WEIGHTS["generalist"])
+    weights = {a: weights_cfg.get(a, 1) for a in ATTR_COSTS}
 
-    spent = 0
-    target_spend = int(budget * random.uniform(0.3, 0.5))
-
-    while spent < target_spend:
-        # выбор атрибута с учётом архетипа
-        weights = [weights_cfg.get(a, 1) for a in attrs]
-        attr = random.choices(attrs, weights=weights, k=1)[0]
+    target_spend = int(budget * rng.uniform(0.3, 0.5))
+    return allocate_attributes(char, budget, target_spend, weights, rng).spent
 
-        cost = costs[attr]
-        if spent + cost > budget:
-            break
-        if getattr(char, attr) >= 16:
-            continue
 
-        setattr(char, attr, getattr(char, attr) + 1)
-        spent += cost
 
-    return spent
+def _pick_exact_budget(pool: List, owned: set, budget: int, sign: int, rng) -> List:
+    """
+    Равномерно выбрать подмножество pool (без уже имеющихся имён и повторов),
+    сумма стоимостей которого по модулю ровно budget; если так не получается —
+    максимально близкая снизу. sign = -1 для недостатков (стоимость < 0).
+    """
+    candidates = []
+    seen = set(owned)
+    for item in pool:
+        cost = sign * item.cost
+        if item.name in seen or cost < 0:
+            continue
+        seen.add(item.name)
+        candidates.append(item)
 
+    sampler = subset_sampler(tuple(sign * item.cost for item in candidates), budget)
+    return [candidates[i] for i in sampler.sample(rng)]
 
 
 def pick_random_advantages(char: Character, tl: int, allow_super: bool,
-                           allow_supernatural: bool, budget: int) -> int:
+                           allow_supernatural: bool, budget: int,
+                           rng: RandomSource = None, exact_budget: bool = False) -> int:
+    """
+    Набираем преимуществ на сумму не больше budget.
+    exact_budget=True — равновероятно среди наборов, дающих ровно budget
+    (если такого набора нет — наибольшую сумму меньше budget).
+    """
+    rng = resolve_rng(rng)
     pool = filter_by_options(ADVANTAGES, tl, allow_super, allow_supernatural)
-    random.shuffle(pool)
+    owned = {a.name for a in char.advantages}
     spent = 0
 
+    if exact_budget:
+        for adv in _pick_exact_budget(pool, owned, budget, 1, rng):
+            char.advantages.append(adv)
+            spent += adv.cost
+        return spent
+
+    rng.shuffle(pool)
     for adv in pool:
         if spent + adv.cost > budget:
             continue
-        if adv.name in (a.name for a in char.advantages):
+        if adv.name in owned:
             continue
         char.advantages.append(adv)
+        owned.add(adv.name)
         spent += adv.cost
 
     return spent
 
 
 def pick_random_disadvantages(char: Character, tl: int, allow_super: bool,
-                              allow_supernatural: bool, min_negative_points: int) -> int:
+                              allow_supernatural: bool, min_negative_points: int,
+                              rng: RandomSource = None, exact_budget: bool = False) -> int:
     """
     Набираем недостатков до (по модулю) некоторого лимита.
     Возвращает суммарные ОТРИЦАТЕЛЬНЫЕ очки (например -40).
+    exact_budget=True — как в pick_random_advantages, лимит набирается ровно.
     """
+    rng = resolve_rng(rng)
     pool = filter_by_options(DISADVANTAGES, tl, allow_super, allow_supernatural)
-    random.shuffle(pool)
+    owned = {d.name for d in char.disadvantages}
     total_negative = 0
 
+    if exact_budget:
+        for dis in _pick_exact_budget(pool, owned, abs(min_negative_points), -1, rng):
+            char.disadvantages.append(dis)
+            total_negative += dis.cost
+        return total_negative
+
+    rng.shuffle(pool)
     for dis in pool:
         if abs(total_negative + dis.cost) > abs(min_negative_points):
             continue
-        if dis.name in (d.name for d in char.disadvantages):
+        if dis.name in owned:
             continue
         char.disadvantages.append(dis)
+        owned.add(dis.name)
         total_negative += dis.cost
 
     return total_negative
 
 
+# Правила весов навыков по категориям/TL, скомпилированные один раз
+SKILL_WEIGHTS = SkillWeightRules(SKILL_WEIGHT_RULES, ARCHETYPE_CATEGORY_WEIGHTS)
+
+
 def get_skill_weight(skill: Skill, tl: int, archetype: Archetype | None = None) -> int:
     """
     Возвращает эффективный вес навыка для данного TL.
@@ -97,167 +214,141 @@ def get_skill_weight(skill: Skill, tl: int, archetype: Archetype | None = None)
       melee_blade, melee_unarmed, ranged_primitive, firearms,
       firearms_hi_tech, vehicle, protective_suit, computer, electronics,
       medicine, science, social, magic, survival, stealth.
+    Сами правила — таблица SKILL_WEIGHT_RULES в app.weights.
     """
+    return SKILL_WEIGHTS.weight(skill, tl, archetype)
 
-    # Жёсткий срез по TL: этот навык недоступен вообще
-    if tl < skill.min_tl or tl > skill.max_tl:
-        return 0
 
-    w = skill.base_weight
-    cats = set(skill.categories)
-
-    # === БЛИЖНИЙ БОЙ ===
-    if "melee_unarmed" in cats:
-        w *= 2  # рукопашка всегда актуальна
-
-    if "melee_blade" in cats:
-        if tl <= 3:
-            w *= 3
-        elif tl <= 5:
-            w *= 2
-        else:
-            w = max(1, w // 2)
-
-    # === ДИСТАНЦИОННОЕ ОРУЖИЕ ===
-    if "ranged_primitive" in cats:
-        if tl <= 3:
-            w *= 3
-        elif tl <= 5:
-            w *= 2
-        else:
-            w = max(1, w // 2)
-
-    if "firearms" in cats:
-        if tl >= 5:
-            w *= 3
-        else:
-            w = max(1, w // 3)
-
-    if "firearms_hi_tech" in cats:
-        if tl >= 9:
-            w *= 4
-        else:
-            w = max(1, w // 4)
-
-    # === ТРАНСПОРТ / СНАРЯГА ===
-    if "vehicle" in cats:
-        if tl >= 6:
-            w *= 2
-        else:
-            w = max(1, w // 2)
-
-    if "protective_suit" in cats:
-        if tl >= 8:
-            w *= 3
-        else:
-            w = max(1, w // 3)
-
-    # === HI-TECH ===
-    if "computer" in cats:
-        if tl >= 7:
-            w *= 4
-        else:
-            w = max(1, w // 3)
-
-    if "electronics" in cats:
-        if tl >= 6:
-            w *= 3
-        else:
-            w = max(1, w // 2)
-
-    # === НАУКА / МЕД ===
-    if "science" in cats:
-        if tl >= 5:
-            w *= 2
-
-    if "medicine" in cats:
-        if tl >= 6:
-            w *= 2
-
-    # === СОЦИАЛКА / СТЕЛС / ВЫЖИВАНИЕ / МАГИЯ ===
-    if "social" in cats:
-        w *= 2
-
-    if "survival" in cats:
-        if tl <= 4:
-            w *= 2
-
-    if "stealth" in cats:
-        w *= 2
-
-    if "magic" in cats:
-        if tl <= 4:
-            w *= 3
-        else:
-            w *= 2
-
-    if archetype:
-        arch_cfg = ARCHETYPE_CATEGORY_WEIGHTS.get(archetype, {})
-        # берём максимальный множитель среди категорий навыка
-        mult = 1
-        for c in cats:
-            mult = max(mult, arch_cfg.get(c, 1))
-        w *= mult
-
-
-    return max(w, 0)
+# === Скомпилированные таблицы весов навыков ===
 
+@dataclass(frozen=True)
+class SkillTable:
+    """
+    Отфильтрованный пул навыков с готовыми весами для одного ключа
+    (TL, архетип, allow_super, allow_supernatural).
+    В пул попадают только навыки с весом > 0.
+    """
+    pool: Tuple[Skill, ...]
+    weights: Tuple[int, ...]
+    cum_weights: Tuple[int, ...]
+    fenwick: Tuple[int, ...]  # готовое дерево для WeightedSampler
+
+    @property
+    def total_weight(self) -> int:
+        return self.cum_weights[-1] if self.cum_weights else 0
+
+
+SkillTableKey = Tuple[int, Archetype, bool, bool]
+
+_SKILL_TABLES: Dict[SkillTableKey, SkillTable] = {}
+# (id, len) каталога, для которого построены таблицы
+_SKILL_TABLES_CATALOG: Tuple[int, int] | None = None
+# Пробовать ли ещё подхватить таблицы с диска (app.table_cache)
+_WARM_CACHE_PENDING = True
+# Каталог дискового кэша таблиц; не задан — кэш выключен
+TABLE_CACHE_ENV = "GURPS_CACHE_DIR"
+
+
+def invalidate_skill_tables() -> None:
+    """Сбросить все скомпилированные таблицы (например, после правки SKILLS)."""
+    global _SKILL_TABLES_CATALOG, _WARM_CACHE_PENDING
+    _SKILL_TABLES.clear()
+    _SKILL_TABLES_CATALOG = None
+    # После правки каталога дисковый кэш описывает уже не тот SKILLS
+    _WARM_CACHE_PENDING = False
+    invalidate_catalog_indexes()
+    SKILL_WEIGHTS.clear()
+
+
+def install_skill_tables(tables: Dict[SkillTableKey, SkillTable]) -> None:
+    """Положить готовые таблицы (например, прочитанные с диска) в кэш."""
+    global _SKILL_TABLES_CATALOG
+    _SKILL_TABLES.update(tables)
+    skills = data_skills.SKILLS
+    _SKILL_TABLES_CATALOG = (id(skills), len(skills))
+
+
+def _load_warm_cache() -> None:
+    global _WARM_CACHE_PENDING
+    _WARM_CACHE_PENDING = False
+    # Кэш выключен — не тянем app.table_cache (pickle, pathlib) на холодном старте
+    if not os.environ.get(TABLE_CACHE_ENV):
+        return
+    from app.table_cache import load_table_cache
+    load_table_cache()
+
+
+def build_skill_table(skills: List[Skill], tl: int, archetype: Archetype,
+                      allow_super: bool, allow_supernatural: bool) -> SkillTable:
+    """Собрать таблицу с нуля: фильтр по TL/тегам + веса навыков."""
+    candidates = filter_by_options(skills, tl, allow_super, allow_supernatural)
+    pool = []
+    weights = []
+    for s, w in zip(candidates, SKILL_WEIGHTS.weights(candidates, tl, archetype)):
+        if w > 0:
+            pool.append(s)
+            weights.append(w)
+    return SkillTable(
+        pool=tuple(pool),
+        weights=tuple(weights),
+        cum_weights=tuple(accumulate(weights)),
+        fenwick=tuple(build_fenwick(weights)),
+    )
 
 
-def pick_random_skills(char: Character, tl: int, allow_super: bool,
-                       allow_supernatural: bool, budget: int,
-                       archetype: Archetype) -> int:
-    pool = filter_by_options(SKILLS, tl, allow_super, allow_supernatural)
-    if not pool:
-        return 0
+def get_skill_table(tl: int, archetype: Archetype, allow_super: bool,
+                    allow_supernatural: bool) -> SkillTable:
+    """
+    Таблица для ключа из кэша; строится лениво при первом обращении.
+    При первом промахе процесс один раз пробует прочитать дисковый кэш
+    (app.table_cache). Если каталог SKILLS подменили или изменили его длину,
+    кэш сбрасывается сам; после правки навыков «на месте» нужно вызвать
+    invalidate_skill_tables().
+    """
+    global _SKILL_TABLES_CATALOG
+    skills = data_skills.SKILLS
+    catalog = (id(skills), len(skills))
+    if _SKILL_TABLES_CATALOG != catalog:
+        _SKILL_TABLES.clear()
+        _SKILL_TABLES_CATALOG = catalog
+
+    key = (tl, archetype, allow_super, allow_supernatural)
+    table = _SKILL_TABLES.get(key)
+    if table is None and _WARM_CACHE_PENDING:
+        _load_warm_cache()
+        table = _SKILL_TABLES.get(key)
+    if table is None:
+        table = build_skill_table(skills, tl, archetype, allow_super, allow_supernatural)
+        _SKILL_TABLES[key] = table
+    return table
 
-    weights = [get_skill_weight(s, tl, archetype) for s in pool]
-    pool = [s for s, w in zip(pool, weights) if w > 0]
-    weights = [w for w in weights if w > 0]
 
-    if not pool:
+def pick_random_skills(char: Character, tl: int, allow_super: bool,
+                       allow_supernatural: bool, budget: int,
+                       archetype: Archetype, rng: RandomSource = None) -> int:
+    rng = resolve_rng(rng)
+    table = get_skill_table(tl, archetype, allow_super, allow_supernatural)
+    if not table.pool:
         return 0
 
+    sampler = WeightedSampler(table.weights, table.fenwick)
+    owned = {s.name for s in char.skills}
     spent = 0
-    max_iterations = len(pool) * 3
-
-    for _ in range(max_iterations):
-        if spent >= budget or not pool:
-            break
-
-        skill_template = random.choices(pool, weights=weights, k=1)[0]
-        idx = pool.index(skill_template)
-
-        skill = Skill(
-            name=skill_template.name,
-            base_attr=skill_template.base_attr,
-            difficulty=skill_template.difficulty,
-            tags=skill_template.tags,
-            min_tl=skill_template.min_tl,
-            max_tl=skill_template.max_tl,
-            points=0,
-            categories=list(skill_template.categories),
-            base_weight=skill_template.base_weight,
-        )
 
-        pts = random.choice([1, 2, 4])
+    # Каждый выбор убирает навык из выборки, так что цикл конечен
+    while spent < budget and sampler:
+        skill_template = table.pool[sampler.pop(rng)]
+
+        pts = rng.choice([1, 2, 4])
         if spent + pts > budget:
-            pool.pop(idx)
-            weights.pop(idx)
             continue
-
-        if any(s.name == skill.name for s in char.skills):
-            pool.pop(idx)
-            weights.pop(idx)
+        if skill_template.name in owned:
             continue
 
-        skill.points = pts
-        char.skills.append(skill)
+        char.skills.append(CharacterSkill(skill_template, pts))
+        owned.add(skill_template.name)
         spent += pts
 
-        pool.pop(idx)
-        weights.pop(idx)
-
     return spent
 
 
@@ -268,7 +359,16 @@ def generate_character(
     allow_supernatural: bool,
     name: str = "Безымянный",
     archetype: Archetype = "generalist",
+    rng: RandomSource = None,
+    exact_budget: bool = False,
 ) -> Character:
+    """
+    Сгенерировать одного персонажа.
+    rng — random.Random или зерно: один и тот же (зерно, параметры)
+    всегда даёт одного и того же персонажа.
+    exact_budget — набирать преимущества/недостатки ровно на свой бюджет.
+    """
+    rng = resolve_rng(rng)
     char = Character(name=name, tl=tl, total_points=total_points, archetype=archetype)
 
     # Will и Per базово равны IQ
@@ -277,38 +377,152 @@ def generate_character(
 
     # 1. Атрибуты
     attr_budget = int(total_points * 0.4)
-    spent_attrs = increase_attribute_randomly(char, attr_budget, archetype)
+    spent_attrs = increase_attribute_randomly(char, attr_budget, archetype, rng)
     char.points_spent += spent_attrs
 
     # 2. Недостатки
     max_disads = int(-total_points * 0.4)
     negative_from_disads = pick_random_disadvantages(
-        char, tl, allow_super, allow_supernatural, max_disads
+        char, tl, allow_super, allow_supernatural, max_disads, rng, exact_budget
     )
     char.points_spent += negative_from_disads
 
     # 3. Преимущества
     adv_budget = int(total_points * 0.3)
     spent_adv = pick_random_advantages(
-        char, tl, allow_super, allow_supernatural, adv_budget
+        char, tl, allow_super, allow_supernatural, adv_budget, rng, exact_budget
     )
     char.points_spent += spent_adv
 
     # 4. Навыки
     skills_budget = max(0, int((total_points - char.points_spent) * 0.7))
     spent_skills = pick_random_skills(
-        char, tl, allow_super, allow_supernatural, skills_budget, archetype
+        char, tl, allow_super, allow_supernatural, skills_budget, archetype, rng
     )
     char.points_spent += spent_skills
 
     # 5. Дожиг очков (можно при желании тоже адаптировать под архетип)
-    spend_remaining_points(char, tl, allow_super, allow_supernatural)
+    spend_remaining_points(char, tl, allow_super, allow_supernatural, rng=rng)
 
     return char
 
 
+# === Пакетная генерация ===
+
+def _generate_chunk(args) -> List[CompactCharacter]:
+    """
+    Рабочая функция пула процессов: генерирует кусок персонажей и
+    возвращает их в компактном виде (индексы каталогов вместо dataclass'ов).
+    """
+    master_seed, start, count, params, fingerprint = args
+    if catalog_fingerprint() != fingerprint:
+        # Иначе индексы навыков распакуются в родителе в чужие навыки
+        raise ValueError(
+            "Каталог навыков/черт в процессе пула не совпадает с каталогом "
+            "родителя: меняйте SKILLS через data_skills.replace_skills()"
+        )
+    return [
+        pack_character(_generate_nth(master_seed, i, params))
+        for i in range(start, start + count)
+    ]
+
+
+def _generate_nth(master_seed: int, index: int, params: dict) -> Character:
+    """i-й персонаж пакета: его ГСЧ зависит только от (master_seed, i)."""
+    rng = SeedSequence(master_seed).child(index).rng()
+    return generate_character(**params, rng=rng)
+
+
+def generate_characters(
+    n: int,
+    total_points: int,
+    tl: int,
+    allow_super: bool,
+    allow_supernatural: bool,
+    name: str = "Безымянный",
+    archetype: Archetype = "generalist",
+    workers: int = 1,
+    chunk_size: int | None = None,
+    stream: bool = False,
+    seed: int | None = None,
+    rng: RandomSource = None,
+    exact_budget: bool = False,
+) -> List[Character] | Iterator[Character]:
+    """
+    Сгенерировать n персонажей с одинаковыми параметрами.
+
+    workers > 1 — генерация в ProcessPoolExecutor кусками по chunk_size;
+    из процессов возвращаются компактные кортежи, а не графы dataclass'ов.
+    Порядок результатов всегда совпадает с порядком кусков.
+    stream=True — вернуть итератор, который отдаёт персонажей по мере готовности.
+
+    Персонаж i строится из ГСЧ SeedSequence(seed).child(i), поэтому при заданном
+    seed результат не зависит ни от workers, ни от chunk_size.
+    Без seed главное зерно берётся из rng (или глобального random).
+    """
+    params = dict(
+        total_points=total_points,
+        tl=tl,
+        allow_super=allow_super,
+        allow_supernatural=allow_supernatural,
+        name=name,
+        archetype=archetype,
+        exact_budget=exact_budget,
+    )
+
+    if seed is None:
+        seed = resolve_rng(rng).getrandbits(64)
+
+    if workers <= 1:
+        chars = (_generate_nth(seed, i, params) for i in range(n))
+        return chars if stream else list(chars)
+
+    if chunk_size is None:
+        # ~4 куска на процесс: баланс нагрузки без лишних пересылок
+        chunk_size = max(1, min(1000, math.ceil(n / (workers * 4))))
+
+    fingerprint = catalog_fingerprint()
+    chunks = (
+        (seed, start, min(chunk_size, n - start), params, fingerprint)
+        for start in range(0, n, chunk_size)
+    )
+    chars = _iter_parallel(chunks, workers)
+    return chars if stream else list(chars)
+
+
+def _iter_parallel(chunks: Iterable, workers: int) -> Iterator[Character]:
+    """
+    Раздать куски пулу и отдавать результаты по порядку.
+    В работе держим не больше 2 * workers кусков: при потоковой выгрузке
+    (app.export) память не растёт, даже если потребитель медленнее пула.
+    """
+    # multiprocessing тянет за собой десятки модулей: импортируем только
+    # когда пул действительно нужен, чтобы не замедлять старт CLI
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Воркеры spawn/forkserver собирают каталог заново и не видят подмену
+    # replace_skills(): передаём им подменённый каталог при старте
+    initializer, initargs = None, ()
+    if data_skills.catalog_origin() == "runtime":
+        initializer, initargs = data_skills.replace_skills, (list(data_skills.SKILLS),)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                             initargs=initargs) as pool:
+        for packed in map_in_order(pool, _generate_chunk, chunks, 2 * workers):
+            for data in packed:
+                yield unpack_character(data)
+
+
+def _require_character_skill(skill) -> CharacterSkill:
+    if isinstance(skill, Skill):
+        raise TypeError(
+            f"Навык каталога {skill.name!r} неизменяем и не хранит очков — "
+            f"оберните его в CharacterSkill"
+        )
+    return skill
 
-def compute_skill_level(skill: Skill, char: Character) -> int:
+
+def compute_skill_level(skill: CharacterSkill, char: Character) -> int:
     """
     Считает уровень навыка по GURPS-подобной схеме с плато:
 
@@ -344,44 +558,87 @@ def compute_skill_level(skill: Skill, char: Character) -> int:
         12–15 -> Attr+1
         дальше: +1 за каждые 4 очка
     """
+    _require_character_skill(skill)
     attr_value = getattr(char, skill.base_attr)
-    pts = skill.points
+    return attr_value + relative_skill_level(skill.difficulty, skill.points)
+
 
-    # На случай, если навыок есть, но очков 0
-    if pts <= 0:
-        # Очень грубое приближение "по умолчанию"
-        return attr_value - 4
+# Таблица порогов: {кол-во очков: относительный уровень к атрибуту}
+SKILL_LEVEL_THRESHOLDS: Dict[str, Dict[int, int]] = {
+    "E": {1: 0, 2: 1, 4: 2, 8: 3, 12: 4},
+    "A": {1: -1, 2: 0, 4: 1, 8: 2, 12: 3},
+    "H": {1: -2, 2: -1, 4: 0, 8: 1, 12: 2},
+    "VH": {1: -3, 2: -2, 4: -1, 8: 0, 12: 1},
+}
+# Свыше этого порога каждые полные 4 очка дают +1 уровень
+_MAX_THRESHOLD = 12
+# Уровень навыка без очков («по умолчанию», очень грубо): Attr-4
+DEFAULT_RELATIVE_LEVEL = -4
 
-    # Таблица порогов: {кол-во очков: относительный уровень к атрибуту}
-    tables = {
-        "E": {1: 0, 2: 1, 4: 2, 8: 3, 12: 4},
-        "A": {1: -1, 2: 0, 4: 1, 8: 2, 12: 3},
-        "H": {1: -2, 2: -1, 4: 0, 8: 1, 12: 2},
-        "VH": {1: -3, 2: -2, 4: -1, 8: 0, 12: 1},
-    }
 
-    diff = skill.difficulty
-    if diff not in tables:
-        # На всякий случай, если вдруг что-то странное
-        diff = "A"
+def _build_level_tables():
+    """
+    Развернуть пороги в прямые таблицы:
+      levels[diff][pts]  — относительный уровень для 0..12 очков;
+      costs[diff][rel]   — минимум очков для уровня rel (от -4 до уровня на 12 очках).
+    """
+    levels = {}
+    costs = {}
+    for diff, tbl in SKILL_LEVEL_THRESHOLDS.items():
+        row = [DEFAULT_RELATIVE_LEVEL]
+        for pts in range(1, _MAX_THRESHOLD + 1):
+            row.append(tbl[max(t for t in tbl if t <= pts)])
+        levels[diff] = tuple(row)
+
+        inverse = {}
+        for pts in range(_MAX_THRESHOLD, -1, -1):
+            for rel in range(DEFAULT_RELATIVE_LEVEL, row[pts] + 1):
+                inverse[rel] = pts
+        costs[diff] = inverse
+    return levels, costs
 
-    tbl = tables[diff]
-    thresholds = sorted(tbl.keys())
 
-    # Находим наибольший порог, который не превышает pts
-    effective_threshold = max(t for t in thresholds if t <= pts)
-    rel = tbl[effective_threshold]
+_SKILL_LEVELS, _SKILL_LEVEL_COSTS = _build_level_tables()
 
-    max_threshold = thresholds[-1]
 
-    # Если ещё не достигли максимального порога (12 очков) — дополнительных уровней нет
-    if effective_threshold < max_threshold:
-        return attr_value + rel
+def relative_skill_level(difficulty: str, points: int) -> int:
+    """Уровень навыка относительно атрибута за O(1); неизвестная сложность считается как A."""
+    row = _SKILL_LEVELS.get(difficulty) or _SKILL_LEVELS["A"]
+    if points <= 0:
+        return DEFAULT_RELATIVE_LEVEL
+    if points <= _MAX_THRESHOLD:
+        return row[points]
+    return row[_MAX_THRESHOLD] + (points - _MAX_THRESHOLD) // 4
+
+
+def points_for_level(difficulty: str, relative_level: int) -> int:
+    """
+    Минимум очков, при котором навык сложности difficulty имеет уровень
+    не ниже Attr + relative_level. Обратная к relative_skill_level.
+    """
+    if relative_level <= DEFAULT_RELATIVE_LEVEL:
+        return 0
+    costs = _SKILL_LEVEL_COSTS.get(difficulty) or _SKILL_LEVEL_COSTS["A"]
+    pts = costs.get(relative_level)
+    if pts is not None:
+        return pts
+    top = _SKILL_LEVELS.get(difficulty, _SKILL_LEVELS["A"])[_MAX_THRESHOLD]
+    return _MAX_THRESHOLD + 4 * (relative_level - top)
+
 
-    # Свыше 12 очков: каждые полные 4 дают +1 уровень
-    extra_pts = pts - max_threshold
-    extra_lvls = extra_pts // 4
-    return attr_value + rel + extra_lvls
+def buy_skill_level(char: Character, skill: CharacterSkill, level: int) -> int:
+    """
+    Докупить навык до абсолютного уровня level (если он ещё ниже).
+    Очки списываются с персонажа; возвращает, сколько потрачено.
+    Навык каталога (Skill) не принимается — очки живут в CharacterSkill.
+    """
+    _require_character_skill(skill)
+    attr_value = getattr(char, skill.base_attr)
+    needed = points_for_level(skill.difficulty, level - attr_value)
+    extra = max(0, needed - skill.points)
+    skill.points += extra
+    char.points_spent += extra
+    return extra
 
 
 def spend_remaining_points(
@@ -390,68 +647,56 @@ def spend_remaining_points(
     allow_super: bool,
     allow_supernatural: bool,
     max_attr: int = 16,
+    rng: RandomSource = None,
 ):
     """
-    Пытается максимально потратить оставшиеся очки.
+    Тратит все оставшиеся очки за один проход.
     Алгоритм:
-    1) Пока можем, поднимаем характеристики (ST/HT/DX/IQ) в разумных пределах.
-    2) Иначе вливаем очки в навыки:
-       - если навыков нет — создаём новый из доступных SKILLS с 1 очком
-       - иначе добавляем по 1 очку в случайный навык.
-    """
-    attr_costs = {
-        "ST": 10, "DX": 20, "IQ": 20, "HT": 10,
-        "Will": 5, "Per": 5,
-    }
-
-    safety = 0
-    while char.remaining_points() > 0 and safety < 1000:
-        safety += 1
-        rem = char.remaining_points()
-
-        # 1. Пытаемся поднять какой-нибудь атрибут
-        viable_attrs = [
-            attr_name
-            for attr_name, cost in attr_costs.items()
-            if cost <= rem and getattr(char, attr_name) < max_attr
-        ]
-        if viable_attrs:
-            attr = random.choice(viable_attrs)
-            cost = attr_costs[attr]
-            setattr(char, attr, getattr(char, attr) + 1)
-            char.points_spent += cost
-            continue
-
-        # 2. Если атрибуты поднять нельзя, работаем с навыками
-        if not char.skills:
-            # Навыков пока нет — создаём хотя бы один
-            pool = filter_by_options(SKILLS, tl, allow_super, allow_supernatural)
-            if not pool:
-                # Совсем нечего взять — выходим
-                break
-            tmpl = random.choice(pool)
-            new_skill = Skill(
-                name=tmpl.name,
-                base_attr=tmpl.base_attr,
-                difficulty=tmpl.difficulty,
-                tags=tmpl.tags,
-                min_tl=tmpl.min_tl,
-                max_tl=tmpl.max_tl,
-                points=0,
-                categories=list(tmpl.categories),
-                base_weight=tmpl.base_weight,
-            )
-            char.skills.append(new_skill)
-
-        # Теперь точно есть хотя бы один навык
-        if rem < 1:
-            break
-
-        skill = random.choice(char.skills)
-        skill.points += 1
-        char.points_spent += 1
+    1) Поднимаем характеристики, равновероятно выбирая среди тех, что ещё
+       по карману и ниже max_attr, пока такие есть (allocate_attributes).
+    2) Остаток целиком уходит в навыки одним мультиномиальным разбиением:
+       - если навыков нет — создаём новый из доступных SKILLS
+       - каждое очко остатка достаётся случайному навыку.
+    Перерасхода не бывает: тратится ровно remaining_points().
+    """
+    rng = resolve_rng(rng)
+    rem = char.remaining_points()
+    if rem <= 0:
+        return
 
-    # На выходе либо очков нет, либо мы упёрлись в какие-то жёсткие ограничения
+    # 1. Атрибуты
+    weights = {a: 1 for a in ATTR_COSTS}
+    spent = allocate_attributes(char, rem, rem, weights, rng, max_attr).spent
+    char.points_spent += spent
+    rem -= spent
+    if rem <= 0:
+        return
+
+    # 2. Навыки
+    if not char.skills:
+        # Навыков пока нет — создаём хотя бы один
+        pool = filter_by_options(data_skills.SKILLS, tl, allow_super, allow_supernatural)
+        if not pool:
+            # Совсем нечего взять — выходим
+            return
+        tmpl = rng.choice(pool)
+        char.skills.append(CharacterSkill(tmpl, 0))
+
+    skills = char.skills
+    # Шаблоны каталога в листе (так его могли собрать вручную) неизменяемы:
+    # заменяем их записями CharacterSkill с нулём очков
+    for i, skill in enumerate(skills):
+        if isinstance(skill, Skill):
+            skills[i] = CharacterSkill(skill, 0)
+    if len(skills) == 1:
+        skills[0].points += rem
+    else:
+        counts = [0] * len(skills)
+        for i in rng.choices(range(len(skills)), k=rem):
+            counts[i] += 1
+        for skill, extra in zip(skills, counts):
+            skill.points += extra
+    char.points_spent += rem
 
 
 def format_character(char: Character) -> str:
@@ -495,3 +740,11 @@ def format_character(char: Character) -> str:
 
     lines.append("=" * 40)
     return "\n".join(lines)
+
+
+def __getattr__(name: str):
+    # Каталог читается из app.data_skills в момент обращения: импорт
+    # генератора не собирает SKILLS (и видит подмену data_skills.SKILLS)
+    if name == "SKILLS":
+        return data_skills.SKILLS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,84 @@
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+
+class SubsetSampler:
+    """
+    Равномерная выборка подмножеств предметов с суммой стоимостей ровно total.
+
+    counts[i][b] — число подмножеств первых i предметов с суммой b (0 <= b <= budget).
+    По таблице один раз за O(n * budget) считаются вероятности
+    take[i][b] = counts[i-1][b - cost_i] / counts[i][b], дальше каждая выборка —
+    обратный проход за O(n) по float-сравнениям: это даёт равномерное
+    распределение по всем подходящим подмножествам. Сами counts — большие
+    целые, поэтому при выборке с ними не работаем.
+    Стоимости должны быть неотрицательными.
+    """
+
+    def __init__(self, costs: Sequence[int], budget: int):
+        if any(c < 0 for c in costs):
+            raise ValueError("стоимости должны быть неотрицательными")
+        self.costs = tuple(costs)
+        self.budget = max(0, budget)
+
+        width = self.budget + 1
+        row = [1] + [0] * self.budget
+        take = []
+        for c in self.costs:
+            if c > self.budget:
+                take.append(None)
+                continue
+            new_row = row[:c] + [row[b] + row[b - c] for b in range(c, width)]
+            take.append([0.0] * c + [
+                row[b - c] / new_row[b] if new_row[b] else 0.0
+                for b in range(c, width)
+            ])
+            row = new_row
+        self._take = take
+        self._last = row
+
+    def count(self, total: int) -> int:
+        """Сколько подмножеств дают ровно total."""
+        if not 0 <= total <= self.budget:
+            return 0
+        return self._last[total]
+
+    def best_total(self) -> int:
+        """Наибольшая достижимая сумма, не превышающая budget."""
+        last = self._last
+        for total in range(self.budget, -1, -1):
+            if last[total]:
+                return total
+        return 0
+
+    def sample(self, rng, total: int | None = None) -> List[int]:
+        """
+        Индексы случайного подмножества с суммой total (по умолчанию — budget,
+        а если он недостижим — best_total()). rng — random.Random или модуль random.
+        """
+        if total is None:
+            total = self.budget if self.count(self.budget) else self.best_total()
+        if not self.count(total):
+            raise ValueError(f"нет подмножества с суммой {total}")
+
+        chosen = []
+        b = total
+        costs = self.costs
+        take = self._take
+        random = rng.random
+        for i in range(len(costs) - 1, -1, -1):
+            c = costs[i]
+            if c > b:
+                continue
+            p = take[i][b]
+            if p and (p >= 1.0 or random() < p):
+                chosen.append(i)
+                b -= c
+        chosen.reverse()
+        return chosen
+
+
+@lru_cache(maxsize=256)
+def subset_sampler(costs: Tuple[int, ...], budget: int) -> SubsetSampler:
+    """SubsetSampler из кэша: таблица строится один раз на (пул, бюджет)."""
+    return SubsetSampler(costs, budget)
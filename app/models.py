@@ -1,44 +1,181 @@
-import random
+import sys
 from dataclasses import dataclass, field
-from typing import List, Literal
+from typing import Dict, FrozenSet, Iterable, List, Literal
 
 
 # Тип для "сеттинговых" тегов
 Tag = Literal["mundane", "super", "supernatural"]
 
+# Атрибуты персонажа в каноническом порядке: по нему идут колонки и поля
+# во всех форматах (app.compact, app.export, app.catalog_file)
+ATTRS = ("ST", "DX", "IQ", "HT", "Will", "Per")
 
-@dataclass
+# Битовые маски тегов: фильтр по тегам — одно AND
+TAG_BITS: Dict[str, int] = {"mundane": 1, "super": 2, "supernatural": 4}
+
+# Битовые маски категорий навыков; новые категории получают следующий бит
+CATEGORY_BITS: Dict[str, int] = {}
+
+# Интернированные множества: одинаковые наборы тегов/категорий — один объект
+_INTERNED_SETS: Dict[FrozenSet[str], FrozenSet[str]] = {}
+
+
+def intern_set(values: Iterable[str]) -> FrozenSet[str]:
+    """Общий frozenset интернированных строк для данного набора значений."""
+    frozen = frozenset(sys.intern(v) for v in values)
+    return _INTERNED_SETS.setdefault(frozen, frozen)
+
+
+def category_bit(category: str) -> int:
+    """Бит категории (выделяется при первом обращении)."""
+    bit = CATEGORY_BITS.get(category)
+    if bit is None:
+        bit = CATEGORY_BITS[sys.intern(category)] = 1 << len(CATEGORY_BITS)
+    return bit
+
+
+def tag_mask(tags: Iterable[str]) -> int:
+    mask = 0
+    for t in tags:
+        try:
+            mask |= TAG_BITS[t]
+        except KeyError:
+            raise ValueError(f"Неизвестный тег: {t!r}") from None
+    return mask
+
+
+def category_mask(categories: Iterable[str]) -> int:
+    mask = 0
+    for c in categories:
+        mask |= category_bit(c)
+    return mask
+
+
+def _freeze_record(record) -> None:
+    """
+    Общая часть __post_init__ записей каталога: имя и теги интернируются,
+    теги превращаются в frozenset, считается маска тегов.
+    """
+    tags = intern_set(record.tags)
+    object.__setattr__(record, "name", sys.intern(record.name))
+    object.__setattr__(record, "tags", tags)
+    object.__setattr__(record, "tag_mask", tag_mask(tags))
+
+
+# Записи каталогов неизменяемы и без __dict__; списки на входе
+# (tags=["mundane"], categories=[...]) превращаются в общие frozenset'ы.
+
+@dataclass(frozen=True, slots=True)
 class Advantage:
     name: str
     cost: int
-    tags: List[Tag]
+    tags: FrozenSet[Tag]
     min_tl: int = 0
     max_tl: int = 12
+    tag_mask: int = field(default=0, init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        _freeze_record(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Disadvantage:
     name: str
     cost: int  # отрицательное число
-    tags: List[Tag]
+    tags: FrozenSet[Tag]
     min_tl: int = 0
     max_tl: int = 12
+    tag_mask: int = field(default=0, init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        _freeze_record(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Skill:
     name: str
     base_attr: str  # "ST", "DX", "IQ", "HT"
     difficulty: Literal["E", "A", "H", "VH"]
-    tags: List[Tag]
+    tags: FrozenSet[Tag]
     min_tl: int = 0
     max_tl: int = 12
-    points: int = 0
 
     # Добавляем "умный" слой:
-    categories: List[str] = field(default_factory=list)  # тип навыка (melee_blade_old, etc.)
+    categories: FrozenSet[str] = frozenset()  # тип навыка (melee_blade, etc.)
     base_weight: int = 1  # базовый вес для рандомайзера
 
+    tag_mask: int = field(default=0, init=False, repr=False, compare=False)
+    category_mask: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        _freeze_record(self)
+        categories = intern_set(self.categories)
+        object.__setattr__(self, "categories", categories)
+        object.__setattr__(self, "category_mask", category_mask(categories))
+
+
+class CharacterSkill:
+    """
+    Навык в листе персонажа: ссылка на общий шаблон Skill из каталога
+    плюс вложенные очки. Остальные поля читаются из шаблона, так что
+    s.name / s.base_attr / s.difficulty работают как у Skill, а копии
+    строк и списков категорий на каждого персонажа не создаются.
+    """
+
+    __slots__ = ("template", "points")
+
+    def __init__(self, template: Skill, points: int = 0):
+        self.template = template
+        self.points = points
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    @property
+    def base_attr(self) -> str:
+        return self.template.base_attr
+
+    @property
+    def difficulty(self) -> str:
+        return self.template.difficulty
+
+    @property
+    def tags(self) -> FrozenSet[Tag]:
+        return self.template.tags
+
+    @property
+    def min_tl(self) -> int:
+        return self.template.min_tl
+
+    @property
+    def max_tl(self) -> int:
+        return self.template.max_tl
+
+    @property
+    def categories(self) -> FrozenSet[str]:
+        return self.template.categories
+
+    @property
+    def base_weight(self) -> int:
+        return self.template.base_weight
+
+    @property
+    def category_mask(self) -> int:
+        return self.template.category_mask
+
+    def __eq__(self, other):
+        if not isinstance(other, CharacterSkill):
+            return NotImplemented
+        return self.points == other.points and (
+            self.template is other.template or self.template == other.template
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"CharacterSkill(name={self.name!r}, points={self.points})"
+
 
 @dataclass
 class Character:
@@ -58,7 +195,7 @@ class Character:
 
     advantages: List[Advantage] = field(default_factory=list)
     disadvantages: List[Disadvantage] = field(default_factory=list)
-    skills: List[Skill] = field(default_factory=list)
+    skills: List[CharacterSkill] = field(default_factory=list)
 
     points_spent: int = 0
 
@@ -0,0 +1,94 @@
+from typing import List, Sequence
+
+
+def build_fenwick(weights: Sequence[int]) -> List[int]:
+    """
+    Дерево Фенвика (1-based) над весами за O(n).
+    tree[i] хранит сумму весов на отрезке (i - lowbit(i), i].
+    """
+    n = len(weights)
+    tree = [0] * (n + 1)
+    for i in range(1, n + 1):
+        tree[i] += weights[i - 1]
+        parent = i + (i & -i)
+        if parent <= n:
+            tree[parent] += tree[i]
+    return tree
+
+
+class WeightedSampler:
+    """
+    Взвешенная выборка без возвращения: выбор и удаление элемента за O(log n).
+
+    Распределение совпадает с последовательными вызовами
+    random.choices(pool, weights=weights) с удалением выбранного элемента
+    из pool/weights: на каждый выбор тратится ровно один rng.random(),
+    и при одинаковом состоянии ГСЧ выбирается тот же самый индекс.
+    """
+
+    __slots__ = ("_tree", "_weights", "_total", "_remaining", "_top")
+
+    def __init__(self, weights: Sequence[int], tree: Sequence[int] | None = None):
+        self._weights = list(weights)
+        self._tree = list(tree) if tree is not None else build_fenwick(self._weights)
+        self._total = sum(self._weights)
+        self._remaining = sum(1 for w in self._weights if w > 0)
+        top = 1
+        while top * 2 <= len(self._weights):
+            top *= 2
+        self._top = top
+
+    def __len__(self) -> int:
+        """Сколько элементов с положительным весом ещё можно выбрать."""
+        return self._remaining
+
+    @property
+    def total_weight(self) -> int:
+        return self._total
+
+    def sample(self, rng) -> int:
+        """Индекс случайного элемента (без удаления). rng — random.Random или модуль random."""
+        if self._remaining == 0:
+            raise IndexError("в выборке не осталось элементов")
+
+        u = rng.random() * self._total
+        tree = self._tree
+        n = len(self._weights)
+
+        # Спуск по дереву: ищем первый индекс, у которого префиксная сумма > u
+        pos = 0
+        bit = self._top
+        while bit:
+            nxt = pos + bit
+            if nxt <= n and tree[nxt] <= u:
+                pos = nxt
+                u -= tree[nxt]
+            bit >>= 1
+
+        if pos >= n:
+            # Округление u до total: как и random.choices, берём последний
+            # ещё доступный элемент
+            pos = max(i for i, w in enumerate(self._weights) if w > 0)
+        return pos
+
+    def remove(self, index: int) -> None:
+        """Убрать элемент из выборки (повторное удаление ничего не делает)."""
+        w = self._weights[index]
+        if w <= 0:
+            return
+        self._weights[index] = 0
+        self._total -= w
+        self._remaining -= 1
+
+        tree = self._tree
+        n = len(self._weights)
+        i = index + 1
+        while i <= n:
+            tree[i] -= w
+            i += i & -i
+
+    def pop(self, rng) -> int:
+        """Выбрать случайный элемент и сразу убрать его из выборки."""
+        index = self.sample(rng)
+        self.remove(index)
+        return index
@@ -0,0 +1,45 @@
+import hashlib
+import random
+from typing import List, Tuple
+
+
+class SeedSequence:
+    """
+    Дерево зёрен в духе numpy.random.SeedSequence, только на hashlib.
+
+    Зерно узла — хэш (исходное зерно, путь от корня), поэтому
+    SeedSequence(master).spawn(i) зависит только от master и i, а не от того,
+    сколько процессов работает и как поделены куски.
+    Хэш стабилен между версиями Python и платформами.
+    """
+
+    __slots__ = ("entropy", "spawn_key")
+
+    def __init__(self, entropy: int, spawn_key: Tuple[int, ...] = ()):
+        self.entropy = int(entropy)
+        self.spawn_key = tuple(spawn_key)
+
+    def __repr__(self) -> str:
+        return f"SeedSequence(entropy={self.entropy}, spawn_key={self.spawn_key})"
+
+    def child(self, index: int) -> "SeedSequence":
+        """Потомок с номером index."""
+        return SeedSequence(self.entropy, self.spawn_key + (index,))
+
+    def spawn(self, n: int, start: int = 0) -> List["SeedSequence"]:
+        """Потомки с номерами start .. start + n - 1."""
+        return [self.child(i) for i in range(start, start + n)]
+
+    def seed(self) -> int:
+        """128-битное зерно этого узла."""
+        path = "/".join(str(k) for k in self.spawn_key)
+        digest = hashlib.blake2b(
+            f"{self.entropy}:{path}".encode("ascii"),
+            digest_size=16,
+            person=b"gurps-seedseq",
+        ).digest()
+        return int.from_bytes(digest, "little")
+
+    def rng(self) -> random.Random:
+        """Независимый ГСЧ для этого узла."""
+        return random.Random(self.seed())
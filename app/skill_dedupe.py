@@ -0,0 +1,241 @@
+"""
+Поиск почти-дублей умений при конвертации skills_raw.txt.
+
+Выгрузки из разных книг дают одно и то же умение в чуть разном
+написании: "Боевой скафандр/ ТУ" и "Боевой скафандр/ТУ", "ё" и "е",
+лишние пробелы вокруг скобок. Точная проверка имён такие пары
+пропускает, и в SKILLS умение оказывается дважды (двойной вес при
+выборе).
+
+Deduplicator смотрит на каждое новое умение в порядке поступления:
+    - имя уже было буква в букву — выбрасываем молча (как раньше);
+    - совпадает нормализованное имя (normalize_name) — сливаем
+      с первым вхождением и пишем в отчёт;
+    - похоже на уже принятое имя (Жаккар по триграммам >= threshold) —
+      при политике similar сливаем, если совпадают атрибут и сложность,
+      иначе пишем в отчёт на проверку.
+
+Похожие имена ищутся по инвертированному индексу триграмм (TrigramIndex)
+без попарного сравнения. Поиск включается политикой similar или
+review=True (отчёт); по умолчанию сравниваются только нормализованные
+имена — это словарь и ничего не стоит.
+"""
+import csv
+import math
+import re
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+
+# Политики слияния
+EXACT = "exact"             # только точные повторы имён (прежнее поведение)
+NORMALIZED = "normalized"   # + совпадение после normalize_name
+SIMILAR = "similar"         # + похожие с тем же атрибутом и сложностью
+POLICIES = (EXACT, NORMALIZED, SIMILAR)
+
+# Одна опечатка меняет 3 триграммы из n: (n - 3) / (n + 3) >= 0.8 с ~25 символов
+DEFAULT_THRESHOLD = 0.8
+_EPS = 1e-9
+
+_SPACED_PUNCT_RE = re.compile(r"\s*([/()\[\],.:;\-])\s*")
+_SPACES_RE = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Ключ сравнения: нижний регистр, "ё" -> "е", без "†", без пробелов
+    вокруг знаков препинания и с одиночными пробелами между словами.
+    """
+    n = name.lower().replace("ё", "е").replace("†", " ")
+    n = _SPACED_PUNCT_RE.sub(r"\1", n)
+    return _SPACES_RE.sub(" ", n).strip()
+
+
+def trigrams(normalized: str) -> frozenset:
+    """Множество триграмм имени с отбивкой по краям (короткие имена тоже дают триграммы)."""
+    padded = f"  {normalized} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class DuplicatePair(NamedTuple):
+    action: str     # "merged" — второе выброшено, "review" — оба оставлены
+    score: float    # 1.0 для совпадения после нормализации
+    kept: str
+    other: str
+
+
+class TrigramIndex:
+    """
+    Инвертированный индекс триграмм принятых имён для порога threshold.
+
+    Все имена упорядочивают свои триграммы одинаково — от редких к частым.
+    Если Жаккар двух имён >= t, у них не меньше t * max(|A|, |B|) общих
+    триграмм, и тогда начала длиной |X| - ceil(t * |X|) + 1 у A и у B
+    обязательно пересекаются. Поэтому в индекс кладём только начало
+    каждого имени и ищем только по началу нового: длинные списки частых
+    триграмм не просматриваются вовсе.
+
+    Порядок должен быть общим для всех имён в индексе, поэтому частоты
+    замораживаются, а индекс перестраивается по свежим частотам каждый
+    раз, когда число имён удваивается (в среднем O(1) на имя). Триграммы,
+    появившиеся после перестройки, считаются самыми редкими.
+    """
+
+    REBUILD_FROM = 1024
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self.gram_ids: Dict[str, int] = {}
+        self.frequency: List[int] = []
+        # Замороженный порядок триграмм: rank[gid] (меньше — реже)
+        self.rank: List[int] = []
+        self.postings: List[List[int]] = []
+        # Триграммы каждого имени — кортежем номеров (компактнее frozenset)
+        self.grams: List[Tuple[int, ...]] = []
+        self.next_rebuild = self.REBUILD_FROM
+
+    def __len__(self) -> int:
+        return len(self.grams)
+
+    def _prefix(self, size: int) -> int:
+        # Допуск на погрешность float, чтобы не потерять пары ровно на пороге
+        return size - math.ceil(self.threshold * size - _EPS) + 1
+
+    def _ordered(self, ids: List[int]) -> List[int]:
+        rank = self.rank
+        frozen = len(rank)
+        # Новые триграммы (gid >= frozen) идут первыми
+        return sorted(ids, key=lambda gid: rank[gid] if gid < frozen else frozen - gid - 1)
+
+    def _index(self, item: int, ids: List[int]) -> None:
+        for gid in self._ordered(ids)[:self._prefix(len(ids))]:
+            self.postings[gid].append(item)
+
+    def _rebuild(self) -> None:
+        frequency = self.frequency
+        self.rank = sorted(range(len(frequency)), key=frequency.__getitem__)
+        rank = [0] * len(frequency)
+        for position, gid in enumerate(self.rank):
+            rank[gid] = position
+        self.rank = rank
+        self.postings = [[] for _ in frequency]
+        for item, ids in enumerate(self.grams):
+            self._index(item, list(ids))
+        self.next_rebuild = 2 * len(self.grams)
+
+    def add(self, grams: frozenset) -> int:
+        ids = []
+        for g in grams:
+            gid = self.gram_ids.get(g)
+            if gid is None:
+                gid = self.gram_ids[g] = len(self.frequency)
+                self.frequency.append(0)
+                self.postings.append([])
+            self.frequency[gid] += 1
+            ids.append(gid)
+        item = len(self.grams)
+        self.grams.append(tuple(ids))
+        if len(self.grams) >= self.next_rebuild:
+            self._rebuild()
+        else:
+            self._index(item, ids)
+        return item
+
+    def search(self, grams: frozenset) -> List[Tuple[int, float]]:
+        """(номер имени, Жаккар) для всех принятых имён с Жаккаром >= threshold."""
+        known = [gid for gid in map(self.gram_ids.get, grams) if gid is not None]
+        size = len(grams)
+        # Неизвестные триграммы стоят в начале порядка, но ни в одном имени их нет
+        probe = self._prefix(size) - (size - len(known))
+        if probe <= 0:
+            return []
+
+        candidates = set()
+        for gid in self._ordered(known)[:probe]:
+            candidates.update(self.postings[gid])
+
+        threshold = self.threshold - _EPS
+        min_len = threshold * size
+        max_len = size / threshold
+        probe_set = set(known)
+        found = []
+        for item in candidates:
+            other = self.grams[item]
+            if not min_len <= len(other) <= max_len:
+                continue
+            common = len(probe_set.intersection(other))
+            score = common / (size + len(other) - common)
+            if score >= threshold:
+                found.append((item, score))
+        return found
+
+
+class Deduplicator:
+    """
+    Потоковый фильтр повторов: keep(item) решает, оставить ли запись
+    (имя — item[0], атрибут и сложность — item[1], item[2]).
+    Всё найденное, кроме точных повторов, копится в report; review=True
+    добавляет туда похожие имена, оставленные обоими.
+    """
+
+    def __init__(self, policy: str = NORMALIZED, threshold: float = DEFAULT_THRESHOLD,
+                 review: bool = False):
+        if policy not in POLICIES:
+            raise ValueError(f"Неизвестная политика слияния: {policy!r}")
+        if not 0 < threshold <= 1:
+            raise ValueError("Порог похожести должен быть в (0, 1]")
+        self.policy = policy
+        self.threshold = threshold
+        self.names = set()
+        # нормализованное имя -> имя первого вхождения
+        self.normalized: Dict[str, str] = {}
+        self.index = TrigramIndex(threshold) if policy == SIMILAR or review else None
+        # (имя, (атрибут, сложность)) принятых записей по номеру в индексе
+        self.kept: List[Tuple[str, Tuple]] = []
+        self.report: List[DuplicatePair] = []
+
+    def merged(self) -> int:
+        return sum(1 for p in self.report if p.action == "merged")
+
+    def keep(self, item: Sequence) -> bool:
+        name = item[0]
+        if name in self.names:
+            return False
+        if self.policy == EXACT:
+            self.names.add(name)
+            return True
+
+        key = normalize_name(name)
+        first = self.normalized.get(key)
+        if first is not None:
+            self.names.add(name)
+            self.report.append(DuplicatePair("merged", 1.0, first, name))
+            return False
+
+        if self.index is not None:
+            signature = (item[1], item[2])
+            grams = trigrams(key)
+            similar = self.index.search(grams)
+            similar.sort(key=lambda found: (-found[1], found[0]))
+            if self.policy == SIMILAR:
+                for i, score in similar:
+                    kept_name, kept_signature = self.kept[i]
+                    if kept_signature == signature:
+                        self.names.add(name)
+                        self.report.append(DuplicatePair("merged", score, kept_name, name))
+                        return False
+            for i, score in similar:
+                self.report.append(DuplicatePair("review", score, self.kept[i][0], name))
+            self.index.add(grams)
+            self.kept.append((name, signature))
+
+        self.names.add(name)
+        self.normalized[key] = name
+        return True
+
+    def write_report(self, path) -> None:
+        """Отчёт TSV: действие, похожесть, оставленное имя, второе имя."""
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            out = csv.writer(f, delimiter="\t", lineterminator="\n")
+            out.writerow(DuplicatePair._fields)
+            for pair in self.report:
+                out.writerow((pair.action, f"{pair.score:.3f}", pair.kept, pair.other))
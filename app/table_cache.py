@@ -0,0 +1,159 @@
+"""
+Дисковый кэш скомпилированных таблиц навыков (SkillTable).
+
+Таблицы для всех 260 ключей (TL 0..12 × 5 архетипов × allow_super ×
+allow_supernatural) пишутся в один файл; навыки хранятся индексами в SKILLS.
+Имя файла содержит хэш исходников каталогов и кода, от которого зависят
+таблицы, так что после правки данных старый файл просто не подхватится.
+
+Новый процесс читает файл одним чтением при первом обращении к
+get_skill_table — короткоживущим воркерам и обработчикам не нужно
+пересобирать пулы и веса.
+
+Кэш включается только явно, через GURPS_CACHE_DIR: файл читается
+pickle.loads, а распаковка pickle может исполнить произвольный код.
+Каталог кэша должен быть доступен на запись только вам.
+
+    GURPS_CACHE_DIR=~/.cache/gurps-generator python -m app.table_cache   # собрать кэш
+    GURPS_CACHE_DIR=~/.cache/gurps-generator ...                         # и читать его
+    без GURPS_CACHE_DIR (или с пустым значением) кэш не пишется и не читается
+"""
+import hashlib
+import importlib.util
+import os
+import pickle
+from itertools import accumulate, product
+from pathlib import Path
+from typing import Dict, Tuple, get_args
+
+from app import data_skills
+from app.data_skills import SNAPSHOT_PATH, builtin_catalog
+from app.archetypes import Archetype
+from app.catalog import MAX_TL
+from app import generator
+
+
+CACHE_VERSION = 1
+
+# Модули, от содержимого которых зависят таблицы
+SOURCE_MODULES = (
+    "app.models",
+    "app.data_skills",
+    "app.data_skills_src",
+    "app.data_traits",
+    "app.archetypes",
+    "app.weights",
+    "app.catalog",
+    "app.generator",
+)
+
+_SOURCE_HASH: list = [None]
+
+
+def all_table_keys():
+    """Все ключи (tl, archetype, allow_super, allow_supernatural)."""
+    return list(product(range(MAX_TL + 1), get_args(Archetype), (False, True), (False, True)))
+
+
+def source_hash() -> str:
+    """Хэш исходников SOURCE_MODULES и версии формата (считается один раз)."""
+    if _SOURCE_HASH[0] is None:
+        h = hashlib.blake2b(digest_size=12, person=b"gurps-tables")
+        h.update(str(CACHE_VERSION).encode())
+        for name in SOURCE_MODULES:
+            h.update(name.encode())
+            spec = importlib.util.find_spec(name)
+            if spec is not None and spec.origin:
+                h.update(Path(spec.origin).read_bytes())
+        # Снимок каталога навыков (исходника при поставке может и не быть)
+        snapshot = Path(SNAPSHOT_PATH)
+        h.update(snapshot.read_bytes() if snapshot.exists() else b"")
+        _SOURCE_HASH[0] = h.hexdigest()
+    return _SOURCE_HASH[0]
+
+
+def cache_dir() -> Path | None:
+    """Каталог кэша из GURPS_CACHE_DIR; не задан или пуст — кэш отключён."""
+    value = os.environ.get(generator.TABLE_CACHE_ENV)
+    return Path(value).expanduser() if value else None
+
+
+def cache_path() -> Path | None:
+    directory = cache_dir()
+    if directory is None:
+        return None
+    return directory / f"skill_tables-v{CACHE_VERSION}-{source_hash()}.pickle"
+
+
+def save_table_cache(path: Path | None = None) -> Path:
+    """Собрать таблицы для всех ключей и записать файл (атомарно)."""
+    skills = data_skills.SKILLS
+    if not builtin_catalog():
+        raise ValueError("SKILLS изменён во время работы: кэш описывал бы не тот каталог")
+    path = Path(path) if path is not None else cache_path()
+    if path is None:
+        raise ValueError("Кэш таблиц отключён: задайте каталог в GURPS_CACHE_DIR")
+
+    positions = {id(s): i for i, s in enumerate(skills)}
+    tables: Dict[Tuple, Tuple] = {}
+    for key in all_table_keys():
+        table = generator.get_skill_table(*key)
+        tables[key] = (
+            tuple(positions[id(s)] for s in table.pool),
+            table.weights,
+            table.fenwick,
+        )
+
+    payload = {
+        "version": CACHE_VERSION,
+        "source": source_hash(),
+        "skills": len(skills),
+        "tables": tables,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp, path)
+    return path
+
+
+def load_table_cache(path: Path | None = None) -> int:
+    """
+    Прочитать файл и положить таблицы в кэш генератора.
+    Возвращает число загруженных таблиц; 0 — файла нет или он не подходит.
+    """
+    skills = data_skills.SKILLS
+    if not builtin_catalog():
+        return 0
+    path = Path(path) if path is not None else cache_path()
+    if path is None:
+        return 0
+    try:
+        payload = pickle.loads(path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return 0
+    if (not isinstance(payload, dict)
+            or payload.get("version") != CACHE_VERSION
+            or payload.get("source") != source_hash()
+            or payload.get("skills") != len(skills)):
+        return 0
+
+    loaded = {}
+    for key, (indices, weights, fenwick) in payload["tables"].items():
+        loaded[key] = generator.SkillTable(
+            pool=tuple(skills[i] for i in indices),
+            weights=weights,
+            cum_weights=tuple(accumulate(weights)),
+            fenwick=fenwick,
+        )
+    generator.install_skill_tables(loaded)
+    return len(loaded)
+
+
+def main():
+    path = save_table_cache()
+    print(f"[OK] {len(all_table_keys())} таблиц -> {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Векторизованный (NumPy) движок распределения атрибутов для пакетной генерации.
+
+NumPy — необязательная зависимость: модуль импортируется и без неё,
+но allocate_attributes_batch тогда бросает ImportError.
+"""
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None
+
+from app.archetypes import Archetype, ARCHETYPE_ATTR_WEIGHTS
+from app.generator import ATTR_COSTS
+from app.models import Character
+
+
+ATTR_COLUMNS: Tuple[str, ...] = tuple(ATTR_COSTS)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "Для пакетного движка нужен NumPy: python -m pip install numpy"
+        )
+
+
+def allocate_attributes_batch(
+    n: int,
+    budget: int,
+    archetype: Archetype,
+    rng=None,
+    base: int = 10,
+    max_attr: int = 16,
+):
+    """
+    Распределить атрибуты сразу для n персонажей — аналог
+    increase_attribute_randomly, но массивами.
+
+    Для каждого персонажа: цель = int(budget * U(0.3, 0.5)); пока потрачено
+    меньше цели, покупается +1 к атрибуту, выбранному по весам архетипа среди
+    ещё не упёршихся в max_attr. Выбранный атрибут, который не влезает в budget,
+    выбывает (как в allocate_attributes); когда кандидатов не осталось,
+    персонаж останавливается.
+    Каждая итерация делает одну покупку сразу для всех активных персонажей,
+    поэтому число шагов ограничено target / min(cost), а не n.
+
+    rng — numpy.random.Generator или зерно.
+    Возвращает (values[n, 6] в порядке ATTR_COLUMNS, spent[n]).
+    """
+    _require_numpy()
+    if not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng)
+
+    weights_cfg = ARCHETYPE_ATTR_WEIGHTS.get(archetype, ARCHETYPE_ATTR_WEIGHTS["generalist"])
+    costs = np.array([ATTR_COSTS[a] for a in ATTR_COLUMNS], dtype=np.int64)
+    weights = np.array([weights_cfg.get(a, 1) for a in ATTR_COLUMNS], dtype=np.float64)
+    last_col = len(ATTR_COLUMNS) - 1
+
+    values = np.full((n, len(ATTR_COLUMNS)), base, dtype=np.int64)
+    spent = np.zeros(n, dtype=np.int64)
+    rejected = np.zeros((n, len(ATTR_COLUMNS)), dtype=bool)
+    target = (budget * rng.uniform(0.3, 0.5, size=n)).astype(np.int64)
+
+    active = spent < target
+    while active.any():
+        idx = np.flatnonzero(active)
+
+        # Упёршиеся в потолок и не влезшие в бюджет атрибуты больше не выбираются
+        open_mask = (values[idx] < max_attr) & (weights > 0) & ~rejected[idx]
+        masked = open_mask * weights
+        cum = masked.cumsum(axis=1)
+        total = cum[:, -1]
+        stuck = total <= 0
+
+        # Первый столбец, у которого накопленный вес > u (как random.choices)
+        u = rng.random(len(idx)) * total
+        choice = (cum <= u[:, None]).sum(axis=1)
+        # Защита от округления u до total: последний открытый столбец
+        last_open = last_col - np.argmax(open_mask[:, ::-1], axis=1)
+        choice = np.minimum(choice, last_open)
+
+        cost = costs[choice]
+        over = spent[idx] + cost > budget
+        buy = ~(over | stuck)
+
+        rows = idx[buy]
+        values[rows, choice[buy]] += 1
+        spent[rows] += cost[buy]
+
+        rejected[idx[over], choice[over]] = True
+        active[idx[stuck]] = False
+        active[idx] &= spent[idx] < target[idx]
+
+    return values, spent
+
+
+def apply_attributes(chars: List[Character], values) -> None:
+    """Записать результат allocate_attributes_batch в персонажей."""
+    for char, row in zip(chars, values.tolist()):
+        for attr, value in zip(ATTR_COLUMNS, row):
+            setattr(char, attr, value)
@@ -0,0 +1,165 @@
+"""
+Правила весов навыков по категориям и TL в виде таблицы.
+
+Каждое правило — (категория, TL от, TL до, операция, k); None в границе
+означает открытый диапазон. Операции:
+    "mul": w *= k
+    "div": w = max(1, w // k)
+Правила применяются в порядке таблицы (порядок важен: деление округляет вниз).
+
+Таблица один раз компилируется в плотную матрицу [TL][категория] -> (операция, k),
+а вес навыка запоминается по (TL, маска категорий, базовый вес): навыков
+с одинаковым набором категорий много, так что пул целиком считается
+почти одними обращениями к словарю.
+"""
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from app.models import category_bit
+from app.catalog import MAX_TL
+
+
+WeightRule = Tuple[str, int | None, int | None, str, int]
+
+SKILL_WEIGHT_RULES: Tuple[WeightRule, ...] = (
+    # === БЛИЖНИЙ БОЙ ===
+    ("melee_unarmed", None, None, "mul", 2),  # рукопашка всегда актуальна
+    ("melee_blade", None, 3, "mul", 3),
+    ("melee_blade", 4, 5, "mul", 2),
+    ("melee_blade", 6, None, "div", 2),
+    # === ДИСТАНЦИОННОЕ ОРУЖИЕ ===
+    ("ranged_primitive", None, 3, "mul", 3),
+    ("ranged_primitive", 4, 5, "mul", 2),
+    ("ranged_primitive", 6, None, "div", 2),
+    ("firearms", 5, None, "mul", 3),
+    ("firearms", None, 4, "div", 3),
+    ("firearms_hi_tech", 9, None, "mul", 4),
+    ("firearms_hi_tech", None, 8, "div", 4),
+    # === ТРАНСПОРТ / СНАРЯГА ===
+    ("vehicle", 6, None, "mul", 2),
+    ("vehicle", None, 5, "div", 2),
+    ("protective_suit", 8, None, "mul", 3),
+    ("protective_suit", None, 7, "div", 3),
+    # === HI-TECH ===
+    ("computer", 7, None, "mul", 4),
+    ("computer", None, 6, "div", 3),
+    ("electronics", 6, None, "mul", 3),
+    ("electronics", None, 5, "div", 2),
+    # === НАУКА / МЕД ===
+    ("science", 5, None, "mul", 2),
+    ("medicine", 6, None, "mul", 2),
+    # === СОЦИАЛКА / СТЕЛС / ВЫЖИВАНИЕ / МАГИЯ ===
+    ("social", None, None, "mul", 2),
+    ("survival", None, 4, "mul", 2),
+    ("stealth", None, None, "mul", 2),
+    ("magic", None, 4, "mul", 3),
+    ("magic", 5, None, "mul", 2),
+)
+
+OPERATIONS = ("mul", "div")
+
+# Операция в ячейке матрицы: (операция, k) или None — вес не меняется
+Cell = Tuple[str, int] | None
+
+
+def _in_band(tl: int, lo: int | None, hi: int | None) -> bool:
+    return (lo is None or lo <= tl) and (hi is None or tl <= hi)
+
+
+class SkillWeightRules:
+    """Скомпилированная таблица правил плюс множители архетипов."""
+
+    def __init__(self, rules: Sequence[WeightRule],
+                 archetype_weights: Mapping[str, Mapping[str, int]]):
+        for category, lo, hi, op, k in rules:
+            if op not in OPERATIONS:
+                raise ValueError(f"Неизвестная операция {op!r} в правиле для {category!r}")
+            if op == "div" and k <= 0:
+                raise ValueError(f"Делитель должен быть положительным: {category!r}")
+
+        self.rules = tuple(rules)
+        self.archetype_weights = archetype_weights
+        # Столбцы матрицы — категории в порядке первого появления в таблице
+        self.categories: Tuple[str, ...] = tuple(dict.fromkeys(r[0] for r in self.rules))
+        self.matrix: List[Tuple[Cell, ...]] = [self._row(tl) for tl in range(MAX_TL + 1)]
+
+        self._ops: Dict[int, Tuple[Tuple[int, bool, int], ...]] = {}
+        self._tl_weights: Dict[Tuple[int, int, int], int] = {}
+        self._multipliers: Dict[Tuple[str, int], int] = {}
+
+    def _row(self, tl: int) -> Tuple[Cell, ...]:
+        cells: Dict[str, Cell] = dict.fromkeys(self.categories)
+        for category, lo, hi, op, k in self.rules:
+            if _in_band(tl, lo, hi):
+                if cells[category] is not None:
+                    raise ValueError(f"Полосы TL для {category!r} пересекаются на TL {tl}")
+                cells[category] = (op, k)
+        return tuple(cells.values())
+
+    def row(self, tl: int) -> Tuple[Cell, ...]:
+        """Строка матрицы для TL; TL вне 0..12 считается по таблице на лету."""
+        if 0 <= tl <= MAX_TL:
+            return self.matrix[tl]
+        return self._row(tl)
+
+    def _row_ops(self, tl: int) -> Tuple[Tuple[int, bool, int], ...]:
+        """Непустые ячейки строки как (бит категории, деление?, k)."""
+        ops = self._ops.get(tl)
+        if ops is None:
+            ops = self._ops[tl] = tuple(
+                (category_bit(category), cell[0] == "div", cell[1])
+                for category, cell in zip(self.categories, self.row(tl))
+                if cell is not None
+            )
+        return ops
+
+    def tl_weight(self, mask: int, base_weight: int, tl: int) -> int:
+        """Вес по категориям (маска) и TL, без архетипа."""
+        key = (tl, mask, base_weight)
+        w = self._tl_weights.get(key)
+        if w is None:
+            w = base_weight
+            for bit, divide, k in self._row_ops(tl):
+                if mask & bit:
+                    w = max(1, w // k) if divide else w * k
+            self._tl_weights[key] = w
+        return w
+
+    def archetype_multiplier(self, mask: int, archetype: str | None) -> int:
+        """Максимальный множитель архетипа среди категорий навыка (не меньше 1)."""
+        if not archetype:
+            return 1
+        key = (archetype, mask)
+        mult = self._multipliers.get(key)
+        if mult is None:
+            mult = 1
+            for category, m in self.archetype_weights.get(archetype, {}).items():
+                if mask & category_bit(category):
+                    mult = max(mult, m)
+            self._multipliers[key] = mult
+        return mult
+
+    def weight(self, skill, tl: int, archetype: str | None = None) -> int:
+        if tl < skill.min_tl or tl > skill.max_tl:
+            return 0
+        mask = skill.category_mask
+        w = self.tl_weight(mask, skill.base_weight, tl)
+        return max(w * self.archetype_multiplier(mask, archetype), 0)
+
+    def weights(self, skills: Iterable, tl: int, archetype: str | None = None) -> List[int]:
+        """Веса целого пула за один проход."""
+        tl_weight = self.tl_weight
+        multiplier = self.archetype_multiplier
+        result = []
+        for s in skills:
+            if tl < s.min_tl or tl > s.max_tl:
+                result.append(0)
+                continue
+            mask = s.category_mask
+            w = tl_weight(mask, s.base_weight, tl) * multiplier(mask, archetype)
+            result.append(max(w, 0))
+        return result
+
+    def clear(self) -> None:
+        """Сбросить запомненные веса (после правки множителей архетипов)."""
+        self._tl_weights.clear()
+        self._multipliers.clear()
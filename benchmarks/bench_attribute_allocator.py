@@ -0,0 +1,42 @@
+"""
+Худший случай распределения атрибутов: огромные total_points.
+
+Старый цикл increase_attribute_randomly на таких бюджетах не завершался
+(все атрибуты упирались в 16, а цель не была достигнута).
+
+    python -m benchmarks.bench_attribute_allocator
+"""
+import argparse
+import random
+import time
+
+from app.models import Character
+from app.generator import ATTR_COSTS, allocate_attributes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--points", type=int, nargs="+",
+                        default=[100, 1000, 10_000, 1_000_000])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    weights = {a: 1 for a in ATTR_COSTS}
+    for total_points in args.points:
+        budget = int(total_points * 0.4)
+        rejected = 0
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            result = allocate_attributes(Character(), budget, budget, weights, rng)
+            rejected += result.rejected
+        elapsed = time.perf_counter() - start
+        print(
+            f"total_points={total_points:<9} "
+            f"{elapsed / args.repeat * 1e6:8.1f} мкс/перс.  "
+            f"отброшено выборов в среднем: {rejected / args.repeat:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
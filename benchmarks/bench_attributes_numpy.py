@@ -0,0 +1,37 @@
+"""
+Скалярное распределение атрибутов против NumPy-движка.
+
+    python -m benchmarks.bench_attributes_numpy --n 100000
+"""
+import argparse
+import random
+import time
+
+from app.models import Character
+from app.generator import increase_attribute_randomly
+from app.vectorized import allocate_attributes_batch
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--budget", type=int, default=200)
+    parser.add_argument("--archetype", default="warrior")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(args.n):
+        increase_attribute_randomly(Character(), args.budget, args.archetype, rng)
+    scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    allocate_attributes_batch(args.n, args.budget, args.archetype, rng=0)
+    batch = time.perf_counter() - start
+
+    print(f"скалярно: {scalar:.3f} с")
+    print(f"NumPy:    {batch:.3f} с  (x{scalar / batch:.1f})")
+
+
+if __name__ == "__main__":
+    main()
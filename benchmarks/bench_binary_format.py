@@ -0,0 +1,50 @@
+"""
+Размер и скорость загрузки корпуса: двоичный формат против JSONL.
+
+    python -m benchmarks.bench_binary_format --n 1000000
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from app.binary import read_characters, write_characters
+from app.export import write_jsonl
+from app.generator import generate_characters
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--points", type=int, default=150)
+    args = parser.parse_args()
+
+    chars = generate_characters(args.n, args.points, 8, True, True, seed=0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bin_path = Path(tmp) / "npcs.bin"
+        json_path = Path(tmp) / "npcs.jsonl"
+        write_characters(chars, bin_path)
+        write_jsonl(chars, json_path)
+
+        start = time.perf_counter()
+        n_bin = sum(1 for _ in read_characters(bin_path))
+        t_bin = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(json_path, encoding="utf-8") as f:
+            n_json = sum(1 for line in f if json.loads(line))
+        t_json = time.perf_counter() - start
+
+        size_bin = bin_path.stat().st_size
+        size_json = json_path.stat().st_size
+
+    assert n_bin == n_json == args.n
+    print(f"JSONL:    {size_json / 2**20:8.1f} МиБ  загрузка {t_json:.2f} с")
+    print(f"двоичный: {size_bin / 2**20:8.1f} МиБ  загрузка {t_bin:.2f} с  "
+          f"(в {size_json / size_bin:.1f} раза меньше)")
+
+
+if __name__ == "__main__":
+    main()
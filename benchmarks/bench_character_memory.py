@@ -0,0 +1,57 @@
+"""
+Память на навыки персонажей: CharacterSkill (ссылка на шаблон + очки)
+против полной копии Skill на каждый навык, как было раньше.
+
+    python -m benchmarks.bench_character_memory --n 100000
+"""
+import argparse
+import tracemalloc
+
+from app.models import Skill
+from app.generator import generate_characters
+
+
+def copy_skill(s) -> Skill:
+    tmpl = s.template
+    return Skill(
+        name=tmpl.name,
+        base_attr=tmpl.base_attr,
+        difficulty=tmpl.difficulty,
+        tags=tmpl.tags,
+        min_tl=tmpl.min_tl,
+        max_tl=tmpl.max_tl,
+        categories=list(tmpl.categories),
+        base_weight=tmpl.base_weight,
+    )
+
+
+def measure(build) -> int:
+    tracemalloc.start()
+    data = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--points", type=int, default=150)
+    args = parser.parse_args()
+
+    chars = generate_characters(args.n, args.points, 8, True, True, seed=0)
+    n_skills = sum(len(c.skills) for c in chars)
+
+    flyweight = measure(lambda: [[type(s)(s.template, s.points) for s in c.skills] for c in chars])
+    copies = measure(lambda: [[copy_skill(s) for s in c.skills] for c in chars])
+
+    scale = 100000 / args.n
+    print(f"навыков: {n_skills} ({n_skills / args.n:.1f} на персонажа)")
+    print(f"копии Skill:     {copies * scale / 2**20:8.1f} МиБ на 100k персонажей")
+    print(f"CharacterSkill:  {flyweight * scale / 2**20:8.1f} МиБ на 100k персонажей "
+          f"(в {copies / flyweight:.1f} раза меньше)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Конвертация большой синтетической выгрузки skills_raw.txt.
+
+Сравнивает прежний путь (весь файл в память, список умений, список
+строк вывода) с потоковым iter_skills -> clean_skills -> запись по строкам:
+время и пик памяти Python (tracemalloc).
+
+    python -m benchmarks.bench_convert_skills --lines 200000
+    python -m benchmarks.bench_convert_skills --lines 1000000 --jobs 4
+
+С --jobs сравнивается только время: последовательная потоковая
+конвертация против convert_parallel (--jobs N в convert_skills).
+"""
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from app.data_skills import SKILLS
+from app.convert_skills import (
+    FOOTER, HEADER, clean_skills, convert_parallel, generate_data_skills_py,
+    iter_skills, parse_skills, skill_source_line,
+)
+
+
+ATTR_CODES = {"DX": "ЛВ", "IQ": "ИН", "HT": "ЗД", "Will": "Воля", "Per": "Восп"}
+DIFF_CODES = {"E": "Л", "A": "С", "H": "Т", "VH": "ОТ"}
+
+
+def synthetic_lines(n: int, seed: int = 0):
+    """Строки в формате skills_raw.txt: имена из каталога, повторы, мусор."""
+    rng = random.Random(seed)
+    yield "умение Skill атрибут сложность по умолчанию\n"
+    for i in range(n):
+        s = rng.choice(SKILLS)
+        attr = ATTR_CODES.get(s.base_attr, "ИН")
+        diff = DIFF_CODES[s.difficulty]
+        r = rng.random()
+        if r < 0.1:
+            yield "ИН-5 или Ловкость-4\n"  # продолжение строки
+        elif r < 0.15:
+            yield f"English Only {i} {attr} {diff} ИН-5\n"
+        else:
+            suffix = f" {rng.randrange(n // 3 + 1)}" if rng.random() < 0.9 else ""
+            yield f"{s.name}{suffix} Skill{i} {attr} {diff} ИН-5\n"
+
+
+def write_synthetic(path: Path, n: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(synthetic_lines(n))
+
+
+def convert_in_memory(raw_path: Path, out_path: Path) -> int:
+    """Прежняя схема: read_text, список умений, "".join всего вывода."""
+    skills = list(clean_skills(parse_skills(raw_path.read_text(encoding="utf-8"))))
+    lines = [HEADER]
+    lines.extend(skill_source_line(*s) for s in skills)
+    lines.append(FOOTER)
+    out_path.write_text("".join(lines), encoding="utf-8")
+    return len(skills)
+
+
+def convert_streaming(raw_path: Path, out_path: Path) -> int:
+    with open(raw_path, encoding="utf-8") as raw:
+        return generate_data_skills_py(clean_skills(iter_skills(raw)), out_path)
+
+
+def convert_jobs(raw_path: Path, out_path: Path, jobs: int) -> int:
+    with open(raw_path, encoding="utf-8") as raw:
+        return convert_parallel(raw, out_path, jobs)
+
+
+def measure(fn, *args):
+    """Время — отдельным прогоном без tracemalloc (он сильно замедляет код)."""
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--jobs", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = Path(tmp) / "skills_raw.txt"
+        write_synthetic(raw_path, args.lines)
+        size = raw_path.stat().st_size
+        print(f"вход: {args.lines} строк, {size / 2**20:.0f} МиБ")
+
+        if args.jobs > 1:
+            serial_out = Path(tmp) / "serial.py"
+            parallel_out = Path(tmp) / "parallel.py"
+            start = time.perf_counter()
+            convert_streaming(raw_path, serial_out)
+            serial = time.perf_counter() - start
+            start = time.perf_counter()
+            convert_jobs(raw_path, parallel_out, args.jobs)
+            parallel = time.perf_counter() - start
+            same = serial_out.read_bytes() == parallel_out.read_bytes()
+            print(f"1 процесс:      {serial:6.1f} с")
+            print(f"{args.jobs} процессов:   {parallel:6.1f} с  "
+                  f"(ускорение {serial / parallel:.2f}x, вывод совпадает: {same})")
+            return
+
+        for label, fn in (("в памяти", convert_in_memory), ("потоково", convert_streaming)):
+            count, elapsed, peak = measure(fn, raw_path, Path(tmp) / f"{fn.__name__}.py")
+            print(f"{label:10} {elapsed:6.1f} с  пик памяти {peak / 2**20:7.1f} МиБ  ({count} умений)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+filter_by_options на каталоге в N раз больше SKILLS: битовый индекс
+против прохода по списку.
+
+    python -m benchmarks.bench_filter_by_options --scale 100
+"""
+import argparse
+import time
+
+from app.data_skills import SKILLS
+from app.catalog import CatalogIndex
+from app.generator import filter_by_options
+
+
+def linear_filter(items, tl, allow_super, allow_supernatural):
+    return [
+        item for item in items
+        if item.min_tl <= tl <= item.max_tl
+        and (allow_super or "super" not in item.tags)
+        and (allow_supernatural or "supernatural" not in item.tags)
+    ]
+
+
+QUERIES = [(tl, s, m) for tl in range(13) for s in (False, True) for m in (False, True)]
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for q in QUERIES:
+            fn(*q)
+    return (time.perf_counter() - start) / (repeat * len(QUERIES))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    items = SKILLS * args.scale
+
+    start = time.perf_counter()
+    index = CatalogIndex(items)
+    build = time.perf_counter() - start
+
+    linear = timed(lambda *q: linear_filter(items, *q), args.repeat)
+    cold = timed(lambda *q: index.query_mask(*q).bit_count(), 1)
+    timed(lambda *q: filter_by_options(items, *q), 1)  # прогрев: ответы запоминаются
+    wrapper = timed(lambda *q: filter_by_options(items, *q), args.repeat)
+
+    print(f"каталог: {len(items)} записей, построение индекса {build * 1e3:.1f} мс")
+    print(f"проход по списку:      {linear * 1e3:8.3f} мс/запрос")
+    print(f"маска запроса (AND):   {cold * 1e3:8.3f} мс/запрос")
+    print(f"filter_by_options:     {wrapper * 1e3:8.3f} мс/запрос "
+          f"(в {linear / wrapper:.1f} раза быстрее)")
+
+
+if __name__ == "__main__":
+    main()
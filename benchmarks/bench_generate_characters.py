@@ -0,0 +1,37 @@
+"""
+Скорость пакетной генерации: персонажей в секунду при 1, 2, 4 и 8 процессах.
+
+    python -m benchmarks.bench_generate_characters --n 20000
+"""
+import argparse
+import time
+
+from app.generator import generate_characters
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=20000)
+    parser.add_argument("--points", type=int, default=150)
+    parser.add_argument("--tl", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    base = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        chars = generate_characters(
+            args.n, args.points, args.tl,
+            allow_super=True, allow_supernatural=True,
+            archetype="warrior", workers=workers,
+        )
+        elapsed = time.perf_counter() - start
+        assert len(chars) == args.n
+
+        rate = args.n / elapsed
+        base = base or rate
+        print(f"workers={workers:<2}  {rate:10.0f} перс./с  x{rate / base:.2f}")
+
+
+if __name__ == "__main__":
+    main()
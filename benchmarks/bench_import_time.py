@@ -0,0 +1,82 @@
+"""
+Холодный старт: время `import app.generator` по `python -X importtime`
+(медиана по нескольким запускам) и самые дорогие модули.
+
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --module app.export --runs 20
+
+Сравнение со старым способом загрузки каталога (компиляция и исполнение
+data_skills_src.py) — строка «исходник каталога».
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def importtime(statement: str) -> dict:
+    """Собственное и суммарное время (мкс) каждого модуля за один запуск."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env, cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    result = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        result[name.strip()] = (int(self_us), int(cumulative_us))
+    return result
+
+
+def walltime(setup: str, statement: str) -> float:
+    """Время (с) выполнения statement в свежем процессе после setup."""
+    code = (
+        f"{setup}\nimport time\nt = time.perf_counter()\n{statement}\n"
+        "print(time.perf_counter() - t)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    return float(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="app.generator")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    totals = []
+    self_times = defaultdict(list)
+    for _ in range(args.runs):
+        times = importtime(f"import {args.module}")
+        totals.append(times[args.module][1])
+        for name, (self_us, _) in times.items():
+            self_times[name].append(self_us)
+
+    # Каталог навыков целиком (с созданием объектов Skill), models уже загружен
+    source = [walltime("import app.models", "from app.data_skills_src import SKILLS")
+              for _ in range(args.runs)]
+    snapshot = [walltime("import app.models", "from app.data_skills import SKILLS")
+                for _ in range(args.runs)]
+
+    print(f"import {args.module}: {statistics.median(totals) / 1000:.1f} мс (медиана из {args.runs})")
+    print(f"SKILLS из исходника: {statistics.median(source) * 1000:.1f} мс")
+    print(f"SKILLS из снимка:    {statistics.median(snapshot) * 1000:.1f} мс")
+    print("самые дорогие модули (собственное время):")
+    ranked = sorted(self_times.items(), key=lambda kv: statistics.median(kv[1]), reverse=True)
+    for name, values in ranked[:args.top]:
+        print(f"  {statistics.median(values) / 1000:6.2f} мс  {name}")
+
+
+if __name__ == "__main__":
+    main()
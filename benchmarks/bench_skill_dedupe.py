@@ -0,0 +1,86 @@
+"""
+Поиск почти-дублей в большом каталоге, сведённом из нескольких книг.
+
+Синтетика (synthetic_names): одни и те же умения из разных книг с
+разными пробелами вокруг "/", "ё"/"е", регистром и опечатками. Сравнивает индекс триграмм
+(Deduplicator) с попарным сравнением: попарное меряется на --pairwise
+именах и пересчитывается на весь объём (оно квадратичное).
+
+    python -m benchmarks.bench_skill_dedupe --names 100000
+"""
+import argparse
+import random
+import time
+
+from app.data_skills import SKILLS
+from app.skill_dedupe import SIMILAR, Deduplicator, normalize_name, trigrams
+
+
+SYLLABLES = [c + v for c in "бвгджзклмнпрстфхцчш" for v in "аеиоуыя"]
+
+
+def synthetic_names(n: int, seed: int = 0):
+    """
+    n записей из ~n/3 разных умений (каждое — в ~3 книгах): имя каталога,
+    часто с уточнением в скобках. В книгах встречаются разные пробелы
+    вокруг "/", "ё"/"е", регистр и опечатки.
+    """
+    rng = random.Random(seed)
+    base = [s.name for s in SKILLS]
+    distinct = []
+    for _ in range(max(1, n // 3)):
+        name = rng.choice(base)
+        if rng.random() < 0.8:
+            word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+            name = f"{name} ({word})"
+        distinct.append((name, rng.choice(("DX", "IQ")), "A"))
+
+    for _ in range(n):
+        name, attr, diff = rng.choice(distinct)
+        if rng.random() < 0.1:
+            name = name.replace("/", "/ ").replace("е", "ё", 1)
+        if rng.random() < 0.1:
+            i = rng.randrange(len(name))
+            name = name[:i] + rng.choice("аеио ") + name[i + 1:]
+        if rng.random() < 0.05:
+            name = name.upper()
+        yield name, attr, diff
+
+
+def pairwise(items, threshold: float) -> int:
+    """Попарная проверка по тем же триграммам: сколько похожих пар."""
+    accepted = []
+    pairs = 0
+    for name, _, _ in items:
+        grams = trigrams(normalize_name(name))
+        pairs += sum(1 for g in accepted if len(g & grams) >= threshold * len(g | grams))
+        accepted.append(grams)
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--names", type=int, default=100_000)
+    parser.add_argument("--pairwise", type=int, default=3_000)
+    args = parser.parse_args()
+
+    items = list(synthetic_names(args.names))
+    dedupe = Deduplicator(SIMILAR)
+    start = time.perf_counter()
+    kept = sum(1 for item in items if dedupe.keep(item))
+    elapsed = time.perf_counter() - start
+    merged = dedupe.merged()
+    print(f"индекс:    {elapsed:6.1f} с  на {args.names} имён "
+          f"(осталось {kept}, слито {merged}, на проверку {len(dedupe.report) - merged})")
+
+    sample = items[:args.pairwise]
+    start = time.perf_counter()
+    pairwise(sample, dedupe.threshold)
+    sample_time = time.perf_counter() - start
+    estimate = sample_time * (args.names / len(sample)) ** 2
+    print(f"попарно:   {sample_time:6.1f} с  на {len(sample)} имён, "
+          f"на {args.names} ≈ {estimate / 60:.0f} мин")
+
+
+if __name__ == "__main__":
+    main()
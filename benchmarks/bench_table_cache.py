@@ -0,0 +1,46 @@
+"""
+Прогрев таблиц навыков: сборка всех 260 таблиц с нуля против чтения
+дискового кэша (app.table_cache).
+
+    python -m benchmarks.bench_table_cache
+"""
+import argparse
+import tempfile
+import time
+
+from app import table_cache
+from app.generator import get_skill_table, invalidate_skill_tables
+
+
+def build_all() -> None:
+    for key in table_cache.all_table_keys():
+        get_skill_table(*key)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = table_cache.save_table_cache(f"{tmp}/tables.pickle")
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            invalidate_skill_tables()
+            build_all()
+        cold = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            invalidate_skill_tables()
+            table_cache.load_table_cache(path)
+        warm = (time.perf_counter() - start) / args.repeat
+
+        print(f"файл кэша: {path.stat().st_size / 1024:.0f} КиБ")
+        print(f"сборка 260 таблиц:  {cold * 1e3:7.1f} мс")
+        print(f"чтение кэша:        {warm * 1e3:7.1f} мс (в {cold / warm:.1f} раза быстрее)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,21 @@
+import random
+
 import pytest
-import app.generator as generator
 from app.models import Character
-from app.generator import increase_attribute_randomly
-from app.archetypes import ARCHETYPE_ATTR_WEIGHTS
+from app.generator import ATTR_COSTS, allocate_attributes, increase_attribute_randomly
 
 
+class MaxWeightRandom(random.Random):
+    """Детерминированный ГСЧ: choices всегда выбирает элемент с максимальным весом."""
 
-def test_increase_attribute_randomly_prefers_warrior_stats(monkeypatch):
-    # Заменяем random.choices внутри generator на детерминированную версию,
-    # которая всегда выбирает атрибут с максимальным весом.
-    def fake_choices(population, weights, k=1):
+    def choices(self, population, weights=None, *, cum_weights=None, k=1):
         max_w = max(weights)
         idx = weights.index(max_w)
         return [population[idx]]
 
-    monkeypatch.setattr(generator.random, "choices", fake_choices)
+
+def test_increase_attribute_randomly_prefers_warrior_stats():
+    rng = MaxWeightRandom(0)
 
     # Базовый персонаж
     char = Character(total_points=100)
@@ -22,7 +23,7 @@ def test_increase_attribute_randomly_prefers_warrior_stats(monkeypatch):
     char.Per = char.IQ
 
     # Выделим небольшой бюджет
-    spent = increase_attribute_randomly(char, budget=40, archetype="warrior")
+    spent = increase_attribute_randomly(char, budget=40, archetype="warrior", rng=rng)
 
     # Для архетипа "warrior" главное — ST и DX
     assert char.ST > 10 or char.DX > 10
@@ -31,20 +32,41 @@ def test_increase_attribute_randomly_prefers_warrior_stats(monkeypatch):
     assert spent > 0
 
 
-def test_increase_attribute_randomly_prefers_scholar_stats(monkeypatch):
-    def fake_choices(population, weights, k=1):
-        max_w = max(weights)
-        idx = weights.index(max_w)
-        return [population[idx]]
-
-    monkeypatch.setattr(generator.random, "choices", fake_choices)
+def test_increase_attribute_randomly_prefers_scholar_stats():
+    rng = MaxWeightRandom(0)
 
     char = Character(total_points=100)
     char.Will = char.IQ
     char.Per = char.IQ
 
-    spent = increase_attribute_randomly(char, budget=40, archetype="scholar")
+    spent = increase_attribute_randomly(char, budget=40, archetype="scholar", rng=rng)
 
     # Учёный должен качать IQ/Will/Per
     assert char.IQ > 10 or char.Will > 10 or char.Per > 10
     assert spent > 0
+
+
+def test_allocate_attributes_stops_when_everything_is_capped():
+    char = Character()
+    weights = {a: 1 for a in ATTR_COSTS}
+
+    # Раньше такой бюджет зацикливал распределение
+    result = allocate_attributes(char, budget=10**6, target=10**6,
+                                 weights=weights, rng=random.Random(1))
+
+    assert all(getattr(char, a) == 16 for a in ATTR_COSTS)
+    assert result.purchases == 6 * len(ATTR_COSTS)
+    assert result.spent == sum(6 * c for c in ATTR_COSTS.values())
+    assert result.rejected == 0
+
+
+def test_allocate_attributes_rejects_unaffordable_and_never_overspends():
+    char = Character()
+    weights = {a: 1 for a in ATTR_COSTS}
+
+    result = allocate_attributes(char, budget=25, target=25,
+                                 weights=weights, rng=random.Random(3))
+
+    assert result.spent <= 25
+    # При таком бюджете часть выборов (DX/IQ по 20 очков) не влезает
+    assert result.rejected >= 1
@@ -13,7 +13,6 @@ def make_skill(categories, base_weight=1):
         tags=["mundane"],
         min_tl=0,
         max_tl=12,
-        points=0,
         categories=categories,
         base_weight=base_weight,
     )
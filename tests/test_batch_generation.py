@@ -0,0 +1,106 @@
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+from app.compact import pack_character, unpack_character
+from app.generator import generate_character, generate_characters
+from app.seeding import SeedSequence
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_pack_unpack_roundtrip():
+    char = generate_character(200, 8, True, True, name="Тест", archetype="scout",
+                              rng=random.Random(7))
+
+    restored = unpack_character(pack_character(char))
+
+    assert restored == char
+
+
+def test_generate_characters_parallel_keeps_count_and_params():
+    chars = generate_characters(
+        25, 120, 3, allow_super=False, allow_supernatural=False,
+        archetype="warrior", workers=2, chunk_size=4,
+    )
+
+    assert len(chars) == 25
+    for char in chars:
+        assert char.tl == 3
+        assert char.archetype == "warrior"
+        assert char.points_spent <= char.total_points
+        assert all("super" not in s.tags for s in char.skills)
+
+
+def test_generate_character_is_reproducible_from_seed():
+    params = dict(total_points=150, tl=8, allow_super=True,
+                  allow_supernatural=True, archetype="scholar")
+
+    first = generate_character(**params, rng=42)
+    state = random.getstate()
+    try:
+        random.seed(0)  # глобальный random не должен влиять
+        second = generate_character(**params, rng=random.Random(42))
+    finally:
+        random.setstate(state)
+
+    assert first == second
+
+
+def test_batch_output_does_not_depend_on_workers_or_chunks():
+    params = dict(n=30, total_points=150, tl=5, allow_super=True,
+                  allow_supernatural=True, archetype="negotiator", seed=2024)
+
+    serial = [pack_character(c) for c in generate_characters(**params)]
+    sharded = [pack_character(c) for c in
+               generate_characters(**params, workers=3, chunk_size=7)]
+    streamed = [pack_character(c) for c in
+                generate_characters(**params, workers=2, chunk_size=4, stream=True)]
+
+    assert serial == sharded == streamed
+
+
+def test_seed_sequence_is_stable():
+    # Зерно зафиксировано: его смена ломает сравнение корпусов между релизами
+    assert SeedSequence(2024).child(3).seed() == 226920003478227421407230434470799242798
+    assert SeedSequence(2024).child(3).seed() != SeedSequence(2024).child(4).seed()
+
+
+def run_spawned(body: str) -> list:
+    # spawn: воркеры собирают каталог заново, а не наследуют память родителя
+    code = (
+        "import multiprocessing as mp\n"
+        "from app import data_skills\n"
+        "from app.generator import generate_characters\n"
+        "mp.set_start_method('spawn')\n"
+        "params = dict(n=6, total_points=150, tl=5, allow_super=False,\n"
+        "              allow_supernatural=False, seed=5)\n"
+    ) + body
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    return out.stdout.split()
+
+
+def test_spawned_workers_use_replaced_catalog():
+    assert run_spawned(
+        "subset = [s for s in data_skills.SKILLS if 'melee_unarmed' in s.categories]\n"
+        "data_skills.replace_skills(subset)\n"
+        "serial = generate_characters(**params)\n"
+        "parallel = generate_characters(**params, workers=2, chunk_size=2)\n"
+        "print(serial == parallel)\n"
+    ) == ["True"]
+
+
+def test_spawned_workers_reject_foreign_catalog():
+    # Правка на месте мимо replace_skills: воркеры её не видят
+    assert run_spawned(
+        "data_skills.SKILLS.append(data_skills.SKILLS[0])\n"
+        "try:\n"
+        "    generate_characters(**params, workers=2, chunk_size=2)\n"
+        "except ValueError as e:\n"
+        "    print('не совпадает' in str(e))\n"
+    ) == ["True"]
@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app.batching import chunked, map_in_order
+
+
+def test_chunked():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunked([], 3)) == []
+
+
+class CountingPool:
+    """Обёртка над пулом, запоминающая наибольшее число кусков в работе."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.in_flight = 0
+        self.peak = 0
+
+    def submit(self, fn, chunk):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        return CountingFuture(self, self.pool.submit(fn, chunk))
+
+
+class CountingFuture:
+    def __init__(self, owner, future):
+        self.owner = owner
+        self.future = future
+
+    def result(self):
+        self.owner.in_flight -= 1
+        return self.future.result()
+
+
+def test_map_in_order_keeps_order_and_bounds_in_flight():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pool = CountingPool(executor)
+        results = list(map_in_order(pool, sum, chunked(range(100), 10), 3))
+    assert results == [sum(range(i, i + 10)) for i in range(0, 100, 10)]
+    assert pool.peak == 3
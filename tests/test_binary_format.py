@@ -0,0 +1,56 @@
+from dataclasses import replace
+
+import pytest
+
+import app.binary as binary
+from app import data_skills
+from app.models import Character, CharacterSkill
+from app.binary import decode_character, encode_character, read_characters, write_characters
+from app.generator import generate_characters
+
+
+def make_chars(n=20):
+    return generate_characters(n, 250, 9, True, True, archetype="scholar", seed=11)
+
+
+def test_record_roundtrip():
+    for char in make_chars():
+        data = encode_character(char)
+        restored, end = decode_character(data)
+        assert end == len(data)
+        assert restored == char
+
+
+def test_file_roundtrip(tmp_path):
+    chars = make_chars()
+    path = tmp_path / "npcs.bin"
+
+    assert write_characters(chars, path) == len(chars)
+    assert list(read_characters(path)) == chars
+
+
+def test_rejects_foreign_catalog(tmp_path, monkeypatch):
+    path = tmp_path / "npcs.bin"
+    write_characters(make_chars(2), path)
+
+    monkeypatch.setattr(binary, "catalog_fingerprint", lambda: b"\0" * 16)
+
+    with pytest.raises(ValueError):
+        list(read_characters(path))
+
+
+def big_catalog(size=70_000):
+    """Каталог больше 65 535 навыков: индексы не влезают в u16."""
+    skills = data_skills.SKILLS
+    return [replace(skills[i % len(skills)], name=f"Навык {i}") for i in range(size)]
+
+
+def test_indices_above_u16(tmp_path, monkeypatch):
+    skills = big_catalog()
+    monkeypatch.setattr(data_skills, "SKILLS", skills)
+    char = Character(name="Тест", skills=[CharacterSkill(skills[0], 1),
+                                          CharacterSkill(skills[-1], 4)])
+
+    restored, _ = decode_character(encode_character(char))
+    assert restored == char
+    assert restored.skills[1].template is skills[-1]
@@ -0,0 +1,102 @@
+import os
+import runpy
+import subprocess
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from app import data_skills
+from app.data_skills import SKILLS, replace_skills
+from app.catalog_file import CatalogFile, read_catalog, write_catalog
+from app.convert_skills import clean_skills, generate_data_skills_py, parse_skills
+from app.generator import generate_character
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+RAW = """Борьба Wrestling ЛВ С ЛВ-5
+Компьютерное программирование Computer Programming ИН Т нет
+Ритуальная магия Ritual Magic ИН ОТ нет
+Киай Kiai ЗД ОТ нет
+"""
+
+
+def test_roundtrip(tmp_path):
+    path = tmp_path / "skills.gcat"
+    assert write_catalog(SKILLS, path) == len(SKILLS)
+    assert read_catalog(path) == SKILLS
+
+
+def test_lazy_access(tmp_path):
+    path = tmp_path / "skills.gcat"
+    write_catalog(SKILLS, path)
+    catalog = CatalogFile.open(path)
+    assert len(catalog) == len(SKILLS)
+    assert catalog.name(5) == SKILLS[5].name
+    assert catalog[-1] == SKILLS[-1]
+    assert catalog[3] is catalog[3]
+    assert catalog[2:4] == SKILLS[2:4]
+
+
+def test_rejects_foreign_or_truncated(tmp_path):
+    path = tmp_path / "skills.gcat"
+    write_catalog(SKILLS, path)
+    data = path.read_bytes()
+    with pytest.raises(ValueError):
+        CatalogFile(b"NOTACATL" + data[8:])
+    with pytest.raises(ValueError):
+        CatalogFile(data[:len(data) // 2])
+
+
+def test_converter_emits_same_skills(tmp_path):
+    out = tmp_path / "data_skills_src.py"
+    catalog = tmp_path / "skills.gcat"
+    count = generate_data_skills_py(clean_skills(parse_skills(RAW)), out, catalog)
+    assert count == 4
+    assert read_catalog(catalog) == runpy.run_path(str(out))["SKILLS"]
+
+
+@pytest.fixture
+def restore_catalog():
+    """Вернуть SKILLS, его источник и отметку сборки после подмены каталога."""
+    original = list(SKILLS)
+    origin = list(data_skills._ORIGIN)
+    loaded = list(data_skills._LOADED)
+    yield original
+    replace_skills(original)
+    data_skills._ORIGIN[:] = origin
+    data_skills._LOADED[:] = loaded
+
+
+def test_replace_skills_at_runtime(restore_catalog):
+    subset = [s for s in restore_catalog if "melee_unarmed" in s.categories]
+    replace_skills(subset)
+    assert data_skills.catalog_origin() == "runtime"
+    assert not data_skills.builtin_catalog()
+    char = generate_character(200, 5, False, False, rng=1)
+    assert char.skills
+    assert all("melee_unarmed" in s.categories for s in char.skills)
+
+
+def test_load_skills_keeps_runtime_origin(restore_catalog):
+    # Подмена той же длины: перечитывание каталога не должно вернуть ей статус встроенного
+    replace_skills([replace(s, name=s.name + "X") for s in restore_catalog])
+    assert data_skills.load_skills() == restore_catalog
+    assert data_skills.catalog_origin() == "runtime"
+    assert not data_skills.builtin_catalog()
+
+
+def test_catalog_from_env(tmp_path):
+    path = tmp_path / "skills.gcat"
+    write_catalog(SKILLS[:10], path)
+    code = (
+        "from app import data_skills\n"
+        "from app.generator import SKILLS\n"
+        "print(len(SKILLS), data_skills.builtin_catalog())\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(ROOT), GURPS_SKILLS_CATALOG=str(path))
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["10", "False"]
@@ -0,0 +1,59 @@
+import pytest
+
+from app.models import Skill
+from app.data_skills import SKILLS
+from app.data_traits import ADVANTAGES, DISADVANTAGES
+from app.catalog import CatalogIndex, get_catalog_index, mask_positions
+from app.generator import filter_by_options
+
+
+def linear_filter(items, tl, allow_super, allow_supernatural):
+    """Старый фильтр: проход по всему списку."""
+    result = []
+    for item in items:
+        if not (item.min_tl <= tl <= item.max_tl):
+            continue
+        if "super" in item.tags and not allow_super:
+            continue
+        if "supernatural" in item.tags and not allow_supernatural:
+            continue
+        result.append(item)
+    return result
+
+
+@pytest.mark.parametrize("items", [SKILLS, ADVANTAGES, DISADVANTAGES])
+def test_index_matches_linear_filter(items):
+    for tl in range(-1, 15):
+        for allow_super in (False, True):
+            for allow_supernatural in (False, True):
+                assert filter_by_options(items, tl, allow_super, allow_supernatural) == \
+                    linear_filter(items, tl, allow_super, allow_supernatural)
+
+
+def test_filter_returns_fresh_list():
+    first = filter_by_options(SKILLS, 8, True, True)
+    first.clear()
+    assert filter_by_options(SKILLS, 8, True, True)
+
+
+def test_index_rebuilt_when_catalog_grows():
+    items = list(SKILLS[:10])
+    index = get_catalog_index(items)
+    assert get_catalog_index(items) is index
+
+    items.append(Skill("Новый навык", "IQ", "A", ["mundane"], 5, 6))
+    assert get_catalog_index(items) is not index
+    assert items[-1] in filter_by_options(items, 5, False, False)
+    assert items[-1] not in filter_by_options(items, 7, False, False)
+
+
+def test_mask_positions():
+    assert mask_positions(0) == []
+    assert mask_positions(0b1011) == [0, 1, 3]
+    assert mask_positions(1 << 100 | 1 << 9) == [9, 100]
+
+
+def test_large_catalog():
+    items = SKILLS * 100
+    index = CatalogIndex(items)
+    assert index.query(6, False, True) == linear_filter(items, 6, False, True)
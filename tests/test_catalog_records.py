@@ -0,0 +1,40 @@
+import dataclasses
+
+import pytest
+
+from app.data_skills import SKILLS
+from app.data_traits import ADVANTAGES
+from app.models import CATEGORY_BITS, TAG_BITS, Skill, category_bit
+
+
+def test_records_are_immutable():
+    skill = SKILLS[0]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        skill.min_tl = 5
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ADVANTAGES[0].cost = 1
+    assert not hasattr(skill, "__dict__")
+    assert not hasattr(skill, "points")
+
+
+def test_tags_and_categories_are_shared_frozensets():
+    a = Skill("Навык А", "DX", "A", ["mundane"], categories=["melee_blade", "social"])
+    b = Skill("Навык Б", "IQ", "H", ("mundane",), categories={"social", "melee_blade"})
+    assert isinstance(a.tags, frozenset) and isinstance(a.categories, frozenset)
+    assert a.tags is b.tags
+    assert a.categories is b.categories
+
+    mundane = [s.tags for s in SKILLS if s.tags == {"mundane"}]
+    assert all(t is mundane[0] for t in mundane)
+
+
+def test_masks():
+    skill = Skill("Навык", "DX", "A", ["mundane", "super"], categories=["melee_blade", "vehicle"])
+    assert skill.tag_mask == TAG_BITS["mundane"] | TAG_BITS["super"]
+    assert skill.category_mask == category_bit("melee_blade") | category_bit("vehicle")
+    assert Skill("Без категорий", "IQ", "E", ["supernatural"]).category_mask == 0
+    for s in SKILLS:
+        assert s.category_mask == sum(CATEGORY_BITS[c] for c in s.categories)
+
+    with pytest.raises(ValueError):
+        Skill("Плохой тег", "IQ", "E", ["weird"])
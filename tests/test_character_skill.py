@@ -0,0 +1,69 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from app.data_skills import SKILLS
+from app.generator import generate_characters
+from app.models import CharacterSkill
+
+
+TEMPLATE = SKILLS[0]
+
+
+def test_fields_are_read_from_template():
+    s = CharacterSkill(TEMPLATE, 4)
+    for field in ("name", "base_attr", "difficulty", "tags", "min_tl", "max_tl",
+                  "categories", "base_weight", "category_mask"):
+        assert getattr(s, field) is getattr(TEMPLATE, field)
+    assert s.points == 4
+
+
+def test_no_per_instance_dict():
+    s = CharacterSkill(TEMPLATE)
+    assert s.points == 0
+    with pytest.raises(AttributeError):
+        s.note = "лишнее поле"
+
+
+def test_equality():
+    same = CharacterSkill(TEMPLATE, 2)
+    assert CharacterSkill(TEMPLATE, 2) == same
+    # Равный, но не тот же самый шаблон (например, после распаковки)
+    copy = replace(TEMPLATE)
+    assert copy is not TEMPLATE
+    assert CharacterSkill(copy, 2) == same
+    assert CharacterSkill(TEMPLATE, 1) != same
+    assert CharacterSkill(SKILLS[1], 2) != same
+    assert same != TEMPLATE
+
+
+def test_unhashable():
+    assert CharacterSkill.__hash__ is None
+    with pytest.raises(TypeError):
+        hash(CharacterSkill(TEMPLATE, 1))
+
+
+def test_pickle_roundtrip():
+    s = CharacterSkill(TEMPLATE, 8)
+    restored = pickle.loads(pickle.dumps(s, protocol=pickle.HIGHEST_PROTOCOL))
+    assert restored == s
+    assert restored.template == TEMPLATE
+
+
+def test_pickles_through_process_pool():
+    sent = [CharacterSkill(SKILLS[i], i) for i in range(5)]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        # list туда и обратно: аргумент и результат проходят через pickle
+        received = pool.submit(list, sent).result()
+    assert received == sent
+    assert all(isinstance(s, CharacterSkill) for s in received)
+
+
+def test_parallel_generation_shares_catalog_templates():
+    chars = generate_characters(6, 150, 5, False, False, workers=2, chunk_size=2, seed=3)
+    skills = [s for char in chars for s in char.skills]
+    assert skills
+    catalog = {id(s) for s in SKILLS}
+    assert all(isinstance(s, CharacterSkill) and id(s.template) in catalog for s in skills)
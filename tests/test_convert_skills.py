@@ -0,0 +1,298 @@
+import pickle
+import random
+
+import pytest
+
+from app import convert_skills
+from app.data_skills import SKILLS
+from app.convert_skills import (
+    CATEGORY_KEYWORDS, TAG_KEYWORDS, KeywordMatcher, classify_categories, classify_tags,
+    LineCache, clean_skills, convert_incremental, convert_parallel, generate_data_skills_py, iter_skills,
+    parse_line, parse_skills,
+)
+
+
+RAW = """умение Skill атрибут сложность по умолчанию
+Борьба Wrestling ЛВ С ЛВ-5
+ИН-5 или Ловкость-4
+Фехтование † Smallsword ЛВ С ЛВ-5
+Acrobatics ЛВ Т ЛВ-6
+Борьба Judo ЛВ Т нет
+
+Ритуальная магия Ritual Magic ИН ОТ нет
+"""
+
+
+# Прежние версии классификаторов (цепочки any(w in n ...)) — эталон для автомата
+def reference_categories(name: str):
+    """
+    Присваиваем категории по ключевым словам.
+    Это приближённо, но близко к канону GURPS.
+    """
+    n = name.lower()
+    cats = []
+
+    # Ближний бой — клинки, топоры, булавы, посохи
+    if any(w in n for w in ["меч", "сабля", "рапира", "шпага", "палаша", "палаш",
+                            "топор", "булава", "дубина", "цеп", "посох", "копье",
+                            "пика", "тонфа", "дага", "нож", "кинжал", "smallsword",
+                            "broadsword", "rapier", "saber", "axe/mace", "staff"]):
+        cats.append("melee_blade")
+
+    # Рукопашка / борьба / единоборства
+    if any(w in n for w in ["драка", "борьба", "дзюдо", "дзитте", "сумо",
+                            "каратэ", "боевое единоборство", "combat", "boxing",
+                            "wrestling", "judo"]):
+        cats.append("melee_unarmed")
+
+    # Метательное и дистанционное древнее оружие
+    if any(w in n for w in ["лук", "арбалет", "праща", "лассо", "копьеметалка",
+                            "духовая трубка", "blowpipe", "sling", "bow", "crossbow"]):
+        cats.append("ranged_primitive")
+
+    # Огнестрел и тяжёлое оружие
+    if any(w in n for w in ["огнестрельное оружие", "guns", "gunner",
+                            "тяжелое оружие", "распылители", "liquid projector"]):
+        cats.append("firearms")
+
+    # Лучевое/силовое/футуристическое оружие
+    if any(w in n for w in ["лучевое", "beam", "силовой меч", "силовой кнут",
+                            "мономолекулярный", "monowire"]):
+        cats.append("firearms_hi_tech")
+
+    # Навигация, вождение, пилотирование
+    if any(w in n for w in ["вождение", "пилотирование", "полет",
+                            "подводная лодка", "подводник", "летчик", "малые корабли",
+                            "кораблевождение", "pilot", "driving", "boating",
+                            "airshipman", "submarine", "submariner"]):
+        cats.append("vehicle")
+
+    # Suit'ы, скафандры
+    if any(w in n for w in ["скафандр", "environment suit", "vacc", "боевой скафандр",
+                            "костюм химзащиты", "подводный костюм"]):
+        cats.append("protective_suit")
+
+    # Компьютеры / IT
+    if any(w in n for w in ["компьютер", "computer", "программирование", "хакер"]):
+        cats.append("computer")
+
+    # Электроника / электричество / техника
+    if any(w in n for w in ["электрон", "electric", "электрик", "electronics"]):
+        cats.append("electronics")
+
+    # Медицина, биология
+    if any(w in n for w in ["врачебное дело", "диагностика", "хирургия", "ветеринария",
+                            "психология", "фармакология", "физиология", "биология",
+                            "анатомия", "алхимия", "poisons", "яд", "pharmacy"]):
+        cats.append("medicine")
+
+    # Научные / инженерные
+    if any(w in n for w in ["инженерия", "физика", "математика", "геология",
+                            "география", "астрономия", "металлургия", "chemistry",
+                            "химия"]):
+        cats.append("science")
+
+    # Социальные / разговорные / влияние
+    if any(w in n for w in ["дипломатия", "политика", "заговаривание зубов",
+                            "харизма", "запугивание", "торговое дело", "sex appeal",
+                            "выступление", "публичное выступление", "лидерство",
+                            "попрошайничество", "хорошие манеры", "savoir-faire",
+                            "fast-talk", "diplomacy", "merchant"]):
+        cats.append("social")
+
+    # Магия / эзотерика / ритуалы
+    if any(w in n for w in ["ритуальная магия", "тауматология", "оккульт",
+                            "экзорцизм", "ритуал", "заклинания"]):
+        cats.append("magic")
+
+    # Выживание / природа
+    if any(w in n for w in ["выживание", "натуралист", "следопыт", "рыбная ловля",
+                            "охота", "falconry", "садовод", "сельское хозяйство"]):
+        cats.append("survival")
+
+    # Воровство / скрытность
+    if any(w in n for w in ["кража", "карманное воровство", "ловкость рук",
+                            "скрытность", "маскировка", "замки", "взлом"]):
+        cats.append("stealth")
+
+    return cats
+
+
+def reference_tags(name: str) -> list[str]:
+    """
+    Возвращает список тегов для навыка:
+      - ["mundane"]         — обычный навык
+      - ["supernatural"]    — магия, оккультизм, ритуалы, странная эзотерика
+      - ["super"]           — ци-трюки, ки-ай, «супергеройские» штуки
+
+    Этого достаточно, чтобы заработали флаги allow_super / allow_supernatural.
+    """
+    n = name.lower()
+
+    # Явно магические / оккультные / ритуальные
+    magic_keywords = [
+        "магия", "тауматология", "ритуальная магия", "ритуальный обряд",
+        "ритуал", "заклинан", "экзорцизм", "оккультизм",
+        "fortune telling", "предсказание судьбы", "rune", "symbol drawing",
+        "странная наука", "weird science",
+    ]
+
+    # Ци-приёмы, ки-ай, прочие «кино-» и сверхчеловеческие трюки
+    super_keywords = [
+        "киай", "kiai",
+        "мощный удар", "power blow",
+        "смертельный удар", "pressure secrets",
+        "парализующий удар", "pressure points",
+        "сокрушительный удар", "breaking blow",
+        "парящий прыжок", "flying leap",
+        "легкий шаг", "light walk",
+        "недвижимая стойка", "immovable stance",
+        "искусство невидимости", "invisibility art",
+        "искусство метания", "throwing art",
+        "контроль тела", "body control",
+        "управление дыханием", "breath control",
+        "ментальная сила", "mental strength",
+        "самогипноз", "autohypnosis",
+        "ясный сон", "dreaming",
+        "body sense", "чувство тела",
+    ]
+
+    # Явная магия/ритуалы
+    if any(k in n for k in magic_keywords):
+        return ["supernatural"]
+
+    # Ци/супертрюки
+    if any(k in n for k in super_keywords):
+        return ["super"]
+
+    # Всё остальное — обычные навыки
+    return ["mundane"]
+
+
+def sample_names(n, seed=0):
+    """Имена каталога плюс склейки ключевых слов и их обрывков."""
+    keywords = [k for _, ks in CATEGORY_KEYWORDS + TAG_KEYWORDS for k in ks]
+    rng = random.Random(seed)
+    names = [s.name for s in SKILLS]
+    for _ in range(n):
+        parts = []
+        for _ in range(rng.randint(1, 4)):
+            k = rng.choice(keywords)
+            a = rng.randint(0, len(k))
+            parts.append(k if rng.random() < 0.5 else k[a:rng.randint(a, len(k))])
+        name = rng.choice(["", " ", "/"]).join(parts)
+        names.append(name.upper() if rng.random() < 0.2 else name)
+    return names
+
+
+def test_categories_match_reference():
+    for name in sample_names(5000):
+        assert classify_categories(name) == reference_categories(name), name
+
+
+def test_tags_match_reference():
+    for name in sample_names(5000, seed=1):
+        assert classify_tags(name) == reference_tags(name), name
+
+
+def test_matcher_overlapping_keywords():
+    matcher = KeywordMatcher([("a", ("he", "hers")), ("b", ("she",)), ("c", ("his",))])
+    assert matcher.labels_of(matcher.match("ushers")) == ["a", "b"]
+    assert matcher.labels_of(matcher.match("this")) == ["c"]
+    assert matcher.match("xyz") == 0
+
+
+def test_parse_line():
+    assert parse_line("Борьба Wrestling ЛВ С ЛВ-5") == ("Борьба", "DX", "A")
+    assert parse_line("Фехтование † Smallsword ЛВ С ЛВ-5") == ("Фехтование", "DX", "A")
+    assert parse_line("ИН-5 или Ловкость-4") is None
+    assert parse_line("умение Skill атрибут") is None
+    assert parse_line("   ") is None
+
+
+def test_streaming_matches_full_parse(tmp_path):
+    raw_path = tmp_path / "skills_raw.txt"
+    raw_path.write_text(RAW, encoding="utf-8")
+    with open(raw_path, encoding="utf-8") as raw:
+        streamed = list(iter_skills(raw))
+    assert streamed == parse_skills(RAW)
+    assert len(streamed) == 5
+
+
+def test_clean_skills_keeps_first_occurrence():
+    cleaned = list(clean_skills(parse_skills(RAW)))
+    assert cleaned == [
+        ("Борьба", "DX", "A"),
+        ("Фехтование", "DX", "A"),
+        ("Ритуальная магия", "IQ", "VH"),
+    ]
+
+
+def test_generate_writes_incrementally(tmp_path):
+    out_path = tmp_path / "data_skills_src.py"
+    count = generate_data_skills_py(iter(clean_skills(parse_skills(RAW))), out_path)
+    text = out_path.read_text(encoding="utf-8")
+    assert count == 3
+    assert text.count("    Skill(") == 3
+    assert 'name="Ритуальная магия"' in text and 'tags=["supernatural"]' in text
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_incremental_matches_full_rebuild(tmp_path):
+    lines = RAW.splitlines(keepends=True)
+    full = tmp_path / "full.py"
+    inc = tmp_path / "inc.py"
+    cache_path = tmp_path / "raw.cache"
+
+    generate_data_skills_py(clean_skills(iter_skills(lines)), full)
+    cache = LineCache.load(cache_path)
+    convert_incremental(lines, inc, cache)
+    cache.save(cache_path)
+    assert inc.read_bytes() == full.read_bytes()
+
+    # Правим одну строку: разбирается заново только она
+    lines[4] = "Акробатика Acrobatics ЛВ Т ЛВ-6\n"
+    cache = LineCache.load(cache_path)
+    convert_incremental(lines, inc, cache)
+    assert cache.misses == 1
+    generate_data_skills_py(clean_skills(iter_skills(lines)), full)
+    assert inc.read_bytes() == full.read_bytes()
+
+
+def test_cache_dropped_when_code_changes(tmp_path, monkeypatch):
+    cache_path = tmp_path / "raw.cache"
+    cache = LineCache()
+    convert_incremental(RAW.splitlines(), tmp_path / "out.py", cache)
+    cache.save(cache_path)
+    assert LineCache.load(cache_path).entries
+
+    monkeypatch.setattr(convert_skills, "_code_stamp", lambda: b"other")
+    assert not LineCache.load(cache_path).entries
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"not a marshal file",
+    pickle.dumps((convert_skills.CACHE_VERSION, b"stamp", {})),
+])
+def test_broken_cache_is_a_miss(tmp_path, data):
+    cache_path = tmp_path / "raw.cache"
+    cache_path.write_bytes(data)
+    cache = LineCache.load(cache_path)
+    assert not cache.entries
+    convert_incremental(RAW.splitlines(), tmp_path / "out.py", cache)
+    assert cache.misses
+
+
+def test_parallel_keeps_first_occurrence(tmp_path):
+    # Повторы имён разнесены по разным кускам
+    lines = RAW.splitlines(keepends=True) * 3 + [
+        "Борьба Sumo ЛВ Т нет\n",
+        "Карате Karate ЛВ Т нет\n",
+    ]
+    full = tmp_path / "full.py"
+    par = tmp_path / "par.py"
+    generate_data_skills_py(clean_skills(iter_skills(lines)), full)
+    count = convert_parallel(lines, par, jobs=2, chunk_lines=3)
+    assert count == 4
+    assert par.read_bytes() == full.read_bytes()
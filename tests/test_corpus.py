@@ -0,0 +1,69 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from app import data_skills
+from app.corpus import Corpus, write_corpus
+from app.generator import generate_characters
+from app.models import Character, CharacterSkill
+
+
+def make_chars(n=40):
+    return generate_characters(n, 180, 7, True, False, archetype="warrior", seed=3)
+
+
+def read_name_and_dx(args):
+    corpus, i = args
+    char = corpus[i]
+    return char.name, char.DX
+
+
+def test_random_access_and_iteration(tmp_path):
+    chars = make_chars()
+    path = tmp_path / "population.cor"
+
+    assert write_corpus(iter(chars), path) == len(chars)
+
+    with Corpus(path) as corpus:
+        assert len(corpus) == len(chars)
+        for i in (17, 0, 39, 5):
+            assert corpus[i] == chars[i]
+        assert corpus[-1] == chars[-1]
+        assert corpus[3:6] == chars[3:6]
+        assert list(corpus) == chars
+        assert corpus.attributes(8)["ST"] == chars[8].ST
+        with pytest.raises(IndexError):
+            corpus[len(chars)]
+
+
+def test_corpus_is_shared_between_processes(tmp_path):
+    chars = make_chars(10)
+    path = tmp_path / "population.cor"
+    write_corpus(chars, path)
+
+    with Corpus(path) as corpus:
+        assert pickle.loads(pickle.dumps(corpus)).path == corpus.path
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            got = list(pool.map(read_name_and_dx, [(corpus, i) for i in range(10)]))
+
+    assert got == [(c.name, c.DX) for c in chars]
+
+
+def test_indices_above_u16(tmp_path, monkeypatch):
+    base = data_skills.SKILLS
+    skills = [replace(base[i % len(base)], name=f"Навык {i}") for i in range(70_000)]
+    monkeypatch.setattr(data_skills, "SKILLS", skills)
+    chars = [
+        Character(name="Первый", skills=[CharacterSkill(skills[65_536], 2)]),
+        Character(name="Второй", skills=[CharacterSkill(skills[0], 1),
+                                         CharacterSkill(skills[-1], 8)]),
+    ]
+    path = tmp_path / "big.cor"
+    write_corpus(chars, path)
+
+    with Corpus(path) as corpus:
+        assert list(corpus) == chars
+        assert corpus[0].skills[0].template is skills[65_536]
+        assert corpus[1].skills[1].template is skills[-1]
@@ -0,0 +1,40 @@
+import random
+from collections import Counter
+
+from app.knapsack import SubsetSampler
+from app.models import Character
+from app.generator import pick_random_advantages, pick_random_disadvantages
+
+
+def test_subset_sampler_is_uniform_over_exact_subsets():
+    sampler = SubsetSampler([5, 10, 5, 15, 20], budget=20)
+    assert sampler.count(20) == 4  # {5,10,5}, {5,15} x2, {20}
+
+    rng = random.Random(0)
+    counts = Counter(tuple(sampler.sample(rng)) for _ in range(20000))
+
+    assert set(counts) == {(0, 1, 2), (0, 3), (2, 3), (4,)}
+    for n in counts.values():
+        assert abs(n - 5000) < 300
+
+
+def test_subset_sampler_falls_back_to_best_total():
+    sampler = SubsetSampler([10, 15], budget=20)
+
+    assert sampler.count(20) == 0
+    assert sampler.best_total() == 15
+    assert sampler.sample(random.Random(1)) == [1]
+
+
+def test_exact_budget_mode_hits_budget():
+    for seed in range(20):
+        char = Character(tl=8)
+        spent = pick_random_advantages(char, 8, True, True, 30,
+                                       rng=seed, exact_budget=True)
+        negative = pick_random_disadvantages(char, 8, True, True, -40,
+                                             rng=seed, exact_budget=True)
+
+        assert spent == 30
+        assert negative == -40
+        names = [a.name for a in char.advantages]
+        assert len(names) == len(set(names))
@@ -0,0 +1,42 @@
+import csv
+import gzip
+import io
+import json
+import lzma
+
+from app.export import CSV_COLUMNS, write_csv, write_jsonl
+from app.generator import generate_characters
+
+
+def make_chars(n=12):
+    return generate_characters(n, 150, 8, True, True, archetype="scout",
+                               seed=5, stream=True)
+
+
+def test_write_jsonl_gzip_roundtrip(tmp_path):
+    path = tmp_path / "npcs.jsonl.gz"
+
+    count = write_jsonl(make_chars(), path, chunk_size=5)
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    expected = list(make_chars())
+    assert count == len(records) == 12
+    for rec, char in zip(records, expected):
+        assert rec["name"] == char.name
+        assert rec["attributes"]["DX"] == char.DX
+        assert [s["name"] for s in rec["skills"]] == [s.name for s in char.skills]
+        assert sum(s["points"] for s in rec["skills"]) == sum(s.points for s in char.skills)
+
+
+def test_write_csv_lzma(tmp_path):
+    path = tmp_path / "npcs.csv"
+
+    count = write_csv(make_chars(7), path, compression="lzma", chunk_size=3)
+
+    text = lzma.decompress(path.read_bytes()).decode("utf-8")
+    rows = list(csv.reader(io.StringIO(text)))
+    assert count == 7
+    assert tuple(rows[0]) == CSV_COLUMNS
+    assert len(rows) == 8
+    assert all(row[CSV_COLUMNS.index("archetype")] == "scout" for row in rows[1:])
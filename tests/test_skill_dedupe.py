@@ -0,0 +1,109 @@
+import random
+
+from app.data_skills import SKILLS
+from app.convert_skills import clean_skills, convert_parallel, generate_data_skills_py, iter_skills
+from app.skill_dedupe import (
+    EXACT, NORMALIZED, SIMILAR, Deduplicator, DuplicatePair, TrigramIndex,
+    normalize_name, trigrams,
+)
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b)
+
+
+def test_normalize_name():
+    assert normalize_name("Боевой скафандр/ ТУ") == normalize_name("Боевой скафандр/ТУ")
+    assert normalize_name("Пилотирование (самолёт)") == "пилотирование(самолет)"
+    assert normalize_name("  Фехтование †  ") == "фехтование"
+    assert normalize_name("Вождение ( автомобиль )") == normalize_name("вождение(Автомобиль)")
+
+
+def test_index_matches_pairwise(monkeypatch):
+    # Частые перестройки индекса не должны терять пары
+    monkeypatch.setattr(TrigramIndex, "REBUILD_FROM", 16)
+    rng = random.Random(0)
+    base = [s.name for s in SKILLS]
+    names = []
+    for _ in range(1500):
+        name = rng.choice(base)
+        if rng.random() < 0.5:
+            i = rng.randrange(len(name))
+            name = name[:i] + rng.choice("аеио ") + name[i + 1:]
+        names.append(normalize_name(name))
+
+    for threshold in (0.6, 0.8, 0.9):
+        index = TrigramIndex(threshold)
+        accepted = []
+        for name in names:
+            grams = trigrams(name)
+            found = {i for i, _ in index.search(grams)}
+            expected = {i for i, g in enumerate(accepted) if jaccard(g, grams) >= threshold}
+            assert found == expected, name
+            index.add(grams)
+            accepted.append(grams)
+
+
+SAMPLE = [
+    ("Боевой скафандр/ТУ", "DX", "A"),
+    ("Боевой скафандр/ ТУ", "DX", "A"),
+    ("Боевой скафандр/ТУ", "DX", "A"),
+    ("Компьютерное программирование/ТУ", "IQ", "H"),
+    ("Компьютерное прогрммирование/ТУ", "IQ", "H"),
+    ("Компьютерное программированье/ТУ", "IQ", "A"),
+]
+
+
+def test_policies():
+    exact = Deduplicator(EXACT)
+    assert [s[0] for s in SAMPLE if exact.keep(s)] == [
+        "Боевой скафандр/ТУ", "Боевой скафандр/ ТУ", "Компьютерное программирование/ТУ",
+        "Компьютерное прогрммирование/ТУ", "Компьютерное программированье/ТУ",
+    ]
+    assert exact.report == []
+
+    normalized = Deduplicator(NORMALIZED)
+    assert len([s for s in SAMPLE if normalized.keep(s)]) == 4
+    assert normalized.report == [DuplicatePair(
+        "merged", 1.0, "Боевой скафандр/ТУ", "Боевой скафандр/ ТУ")]
+
+    # С отчётом похожие остаются, но попадают в него на проверку
+    review = Deduplicator(NORMALIZED, review=True)
+    assert len([s for s in SAMPLE if review.keep(s)]) == 4
+    assert [(p.action, p.kept, p.other) for p in review.report[1:]] == [
+        ("review", "Компьютерное программирование/ТУ", "Компьютерное прогрммирование/ТУ"),
+        ("review", "Компьютерное программирование/ТУ", "Компьютерное программированье/ТУ"),
+    ]
+
+    # Похожие сливаются только при тех же атрибуте и сложности
+    similar = Deduplicator(SIMILAR)
+    kept = [s[0] for s in SAMPLE if similar.keep(s)]
+    assert kept == ["Боевой скафандр/ТУ", "Компьютерное программирование/ТУ",
+                    "Компьютерное программированье/ТУ"]
+    assert similar.merged() == 2
+
+
+def test_clean_skills_merges_normalized_by_default():
+    assert [s[0] for s in clean_skills(SAMPLE[:3])] == ["Боевой скафандр/ТУ"]
+
+
+def test_parallel_same_result_and_report(tmp_path):
+    lines = [f"{name} Skill ЛВ С ЛВ-5\n" for name, _, _ in SAMPLE] * 2
+    lines += ["Боевой  скафандр/ТУ Battlesuit ЛВ С нет\n"]
+    serial, parallel = Deduplicator(SIMILAR), Deduplicator(SIMILAR)
+    generate_data_skills_py(clean_skills(iter_skills(lines), serial), tmp_path / "a.py")
+    convert_parallel(lines, tmp_path / "b.py", jobs=2, chunk_lines=4, dedupe=parallel)
+    assert (tmp_path / "a.py").read_bytes() == (tmp_path / "b.py").read_bytes()
+    assert parallel.report == serial.report
+
+
+def test_write_report(tmp_path):
+    dedupe = Deduplicator(review=True)
+    for s in SAMPLE:
+        dedupe.keep(s)
+    path = tmp_path / "dupes.tsv"
+    dedupe.write_report(path)
+    rows = path.read_text(encoding="utf-8").splitlines()
+    assert rows[0] == "action\tscore\tkept\tother"
+    assert rows[1] == "merged\t1.000\tБоевой скафандр/ТУ\tБоевой скафандр/ ТУ"
+    assert len(rows) == 1 + len(dedupe.report)
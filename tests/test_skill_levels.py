@@ -0,0 +1,69 @@
+import pytest
+
+from app.models import Character, CharacterSkill, Skill
+from app.generator import (
+    buy_skill_level,
+    compute_skill_level,
+    points_for_level,
+    relative_skill_level,
+)
+
+
+def reference_level(difficulty, attr_value, pts):
+    """Прежняя реализация compute_skill_level: поиск по порогам."""
+    if pts <= 0:
+        return attr_value - 4
+    tables = {
+        "E": {1: 0, 2: 1, 4: 2, 8: 3, 12: 4},
+        "A": {1: -1, 2: 0, 4: 1, 8: 2, 12: 3},
+        "H": {1: -2, 2: -1, 4: 0, 8: 1, 12: 2},
+        "VH": {1: -3, 2: -2, 4: -1, 8: 0, 12: 1},
+    }
+    tbl = tables.get(difficulty, tables["A"])
+    thresholds = sorted(tbl)
+    effective = max(t for t in thresholds if t <= pts)
+    if effective < thresholds[-1]:
+        return attr_value + tbl[effective]
+    return attr_value + tbl[effective] + (pts - thresholds[-1]) // 4
+
+
+def make_skill(difficulty, points):
+    template = Skill(name="Тест", base_attr="DX", difficulty=difficulty, tags=["mundane"])
+    return CharacterSkill(template, points)
+
+
+@pytest.mark.parametrize("difficulty", ["E", "A", "H", "VH", "??"])
+def test_lookup_matches_reference(difficulty):
+    char = Character(DX=12)
+    for pts in range(-1, 80):
+        expected = reference_level(difficulty, 12, pts)
+        assert compute_skill_level(make_skill(difficulty, pts), char) == expected
+
+
+@pytest.mark.parametrize("difficulty", ["E", "A", "H", "VH"])
+def test_points_for_level_is_minimal_inverse(difficulty):
+    for rel in range(-6, 15):
+        pts = points_for_level(difficulty, rel)
+        assert relative_skill_level(difficulty, pts) >= rel
+        if pts > 0:
+            assert relative_skill_level(difficulty, pts - 1) < rel
+
+
+def test_buy_skill_level_charges_character():
+    char = Character(DX=12, points_spent=10)
+    skill = make_skill("H", 2)  # DX-1 = 11
+
+    spent = buy_skill_level(char, skill, 14)
+
+    assert compute_skill_level(skill, char) == 14
+    assert spent == skill.points - 2
+    assert char.points_spent == 10 + spent
+    assert buy_skill_level(char, skill, 13) == 0
+
+
+def test_catalog_skill_is_rejected():
+    template = Skill(name="Тест", base_attr="DX", difficulty="A", tags=["mundane"])
+    with pytest.raises(TypeError):
+        buy_skill_level(Character(), template, 15)
+    with pytest.raises(TypeError):
+        compute_skill_level(template, Character())
@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+from dataclasses import fields
+from pathlib import Path
+
+from app.models import Skill
+from app import data_skills
+from app.data_skills import FIELDS, load_skills, read_snapshot
+from app.data_skills_src import SKILLS as SOURCE_SKILLS
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_fields_match_skill():
+    assert FIELDS == tuple(f.name for f in fields(Skill) if f.init)
+
+
+def test_snapshot_is_fresh():
+    # Если упало — после правки data_skills_src.py запусти python -m app.data_skills
+    assert read_snapshot() is not None
+
+
+def test_snapshot_matches_source():
+    assert load_skills() == SOURCE_SKILLS
+
+
+def test_stale_snapshot_falls_back_to_source(monkeypatch):
+    monkeypatch.setattr(data_skills, "_source_stamp", lambda: (0, 0))
+    assert read_snapshot() is None
+    assert load_skills() is SOURCE_SKILLS
+
+
+def test_headless_import_is_light():
+    code = (
+        "import sys, app.generator\n"
+        "heavy = [m for m in ('tkinter', 'concurrent.futures', 'multiprocessing', "
+        "'app.data_skills_src') if m in sys.modules]\n"
+        "print(heavy)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_importing_generator_does_not_build_skills():
+    code = (
+        "import app.generator, app.compact, app.table_cache, app.data_skills as d\n"
+        "print('SKILLS' in vars(d))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
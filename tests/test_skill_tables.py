@@ -0,0 +1,91 @@
+from dataclasses import replace
+
+import pytest
+
+from app import data_skills, generator
+from app.generator import get_skill_table, get_skill_weight, invalidate_skill_tables
+
+
+@pytest.fixture(autouse=True)
+def fresh_tables(monkeypatch):
+    # Без дискового кэша: таблицы каждый раз строятся в этом процессе
+    monkeypatch.setattr(generator, "_WARM_CACHE_PENDING", False)
+    invalidate_skill_tables()
+    yield
+    invalidate_skill_tables()
+
+
+def reference_table(tl, archetype, allow_super, allow_supernatural):
+    """Та же таблица без индексов и скомпилированных правил."""
+    pool, weights = [], []
+    for s in data_skills.SKILLS:
+        if not s.min_tl <= tl <= s.max_tl:
+            continue
+        if "super" in s.tags and not allow_super:
+            continue
+        if "supernatural" in s.tags and not allow_supernatural:
+            continue
+        w = get_skill_weight(s, tl, archetype)
+        if w > 0:
+            pool.append(s)
+            weights.append(w)
+    return pool, weights
+
+
+def test_same_key_returns_memoized_table():
+    table = get_skill_table(5, "warrior", False, False)
+    assert get_skill_table(5, "warrior", False, False) is table
+    assert get_skill_table(5, "scholar", False, False) is not table
+
+
+@pytest.mark.parametrize("key", [
+    (0, "warrior", False, False),
+    (3, "scholar", True, False),
+    (8, "negotiator", False, True),
+    (12, "scout", True, True),
+])
+def test_table_matches_reference(key):
+    table = get_skill_table(*key)
+    pool, weights = reference_table(*key)
+    assert list(table.pool) == pool
+    assert list(table.weights) == weights
+    assert table.total_weight == sum(weights)
+
+
+def test_rebinding_skills_resets_cache(monkeypatch):
+    table = get_skill_table(5, "warrior", False, False)
+    subset = [s for s in data_skills.SKILLS if "melee_blade" in s.categories]
+    monkeypatch.setattr(data_skills, "SKILLS", subset)
+    rebuilt = get_skill_table(5, "warrior", False, False)
+    assert rebuilt is not table
+    assert set(rebuilt.pool) <= set(subset)
+
+
+def test_length_change_resets_cache():
+    skills = data_skills.SKILLS
+    table = get_skill_table(5, "warrior", False, False)
+    extra = replace(table.pool[0], name="Лишний навык")
+    skills.append(extra)
+    try:
+        rebuilt = get_skill_table(5, "warrior", False, False)
+        assert rebuilt is not table
+        assert extra in rebuilt.pool
+    finally:
+        skills.remove(extra)
+
+
+def test_invalidate_after_in_place_edit():
+    skills = data_skills.SKILLS
+    table = get_skill_table(5, "warrior", False, False)
+    i = skills.index(table.pool[0])
+    original = skills[i]
+    skills[i] = replace(original, max_tl=0)
+    try:
+        # Длина та же — кэш сам не заметит правку
+        assert get_skill_table(5, "warrior", False, False) is table
+        invalidate_skill_tables()
+        rebuilt = get_skill_table(5, "warrior", False, False)
+        assert original not in rebuilt.pool
+        assert skills[i] not in rebuilt.pool
+    finally:
+        skills[i] = original
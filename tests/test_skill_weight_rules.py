@@ -0,0 +1,171 @@
+import itertools
+
+import pytest
+
+from app.models import Skill
+from app.data_skills import SKILLS
+from app.archetypes import ARCHETYPE_CATEGORY_WEIGHTS
+from app.weights import SKILL_WEIGHT_RULES, SkillWeightRules
+from app.generator import SKILL_WEIGHTS, build_skill_table, get_skill_weight
+
+
+# Прежняя цепочка if-блоков get_skill_weight — эталон для таблицы правил
+def reference_weight(skill, tl, archetype=None):
+    # Жёсткий срез по TL: этот навык недоступен вообще
+    if tl < skill.min_tl or tl > skill.max_tl:
+        return 0
+
+    w = skill.base_weight
+    cats = skill.categories
+
+    # === БЛИЖНИЙ БОЙ ===
+    if "melee_unarmed" in cats:
+        w *= 2  # рукопашка всегда актуальна
+
+    if "melee_blade" in cats:
+        if tl <= 3:
+            w *= 3
+        elif tl <= 5:
+            w *= 2
+        else:
+            w = max(1, w // 2)
+
+    # === ДИСТАНЦИОННОЕ ОРУЖИЕ ===
+    if "ranged_primitive" in cats:
+        if tl <= 3:
+            w *= 3
+        elif tl <= 5:
+            w *= 2
+        else:
+            w = max(1, w // 2)
+
+    if "firearms" in cats:
+        if tl >= 5:
+            w *= 3
+        else:
+            w = max(1, w // 3)
+
+    if "firearms_hi_tech" in cats:
+        if tl >= 9:
+            w *= 4
+        else:
+            w = max(1, w // 4)
+
+    # === ТРАНСПОРТ / СНАРЯГА ===
+    if "vehicle" in cats:
+        if tl >= 6:
+            w *= 2
+        else:
+            w = max(1, w // 2)
+
+    if "protective_suit" in cats:
+        if tl >= 8:
+            w *= 3
+        else:
+            w = max(1, w // 3)
+
+    # === HI-TECH ===
+    if "computer" in cats:
+        if tl >= 7:
+            w *= 4
+        else:
+            w = max(1, w // 3)
+
+    if "electronics" in cats:
+        if tl >= 6:
+            w *= 3
+        else:
+            w = max(1, w // 2)
+
+    # === НАУКА / МЕД ===
+    if "science" in cats:
+        if tl >= 5:
+            w *= 2
+
+    if "medicine" in cats:
+        if tl >= 6:
+            w *= 2
+
+    # === СОЦИАЛКА / СТЕЛС / ВЫЖИВАНИЕ / МАГИЯ ===
+    if "social" in cats:
+        w *= 2
+
+    if "survival" in cats:
+        if tl <= 4:
+            w *= 2
+
+    if "stealth" in cats:
+        w *= 2
+
+    if "magic" in cats:
+        if tl <= 4:
+            w *= 3
+        else:
+            w *= 2
+
+    if archetype:
+        arch_cfg = ARCHETYPE_CATEGORY_WEIGHTS.get(archetype, {})
+        # берём максимальный множитель среди категорий навыка
+        mult = 1
+        for c in cats:
+            mult = max(mult, arch_cfg.get(c, 1))
+        w *= mult
+
+
+    return max(w, 0)
+
+
+ARCHETYPES = [None, *ARCHETYPE_CATEGORY_WEIGHTS, "unknown"]
+TLS = range(-1, 15)
+
+
+def test_catalog_weights_match_reference():
+    for skill, tl, archetype in itertools.product(SKILLS, TLS, ARCHETYPES):
+        assert get_skill_weight(skill, tl, archetype) == \
+            reference_weight(skill, tl, archetype), (skill.name, tl, archetype)
+
+
+def test_pool_weights_match_reference():
+    for tl, archetype in itertools.product(TLS, ARCHETYPES):
+        expected = [reference_weight(s, tl, archetype) for s in SKILLS]
+        assert SKILL_WEIGHTS.weights(SKILLS, tl, archetype) == expected
+
+
+def test_rule_order_with_mixed_categories():
+    # Несколько категорий сразу: деление с округлением и умножения
+    # должны идти в том же порядке, что и if-блоки
+    categories = sorted({r[0] for r in SKILL_WEIGHT_RULES})
+    skills = [
+        Skill(f"Навык {i}", "IQ", "A", ["mundane"], categories=list(combo), base_weight=base)
+        for i, (combo, base) in enumerate(itertools.product(
+            itertools.combinations(categories, 3), (0, 1, 2, 5, 7)
+        ))
+    ]
+    for skill in skills:
+        for tl in TLS:
+            for archetype in ARCHETYPES:
+                assert get_skill_weight(skill, tl, archetype) == \
+                    reference_weight(skill, tl, archetype)
+
+
+def test_skill_table_weights():
+    table = build_skill_table(SKILLS, 8, "warrior", True, True)
+    assert list(table.weights) == [reference_weight(s, 8, "warrior") for s in table.pool]
+    assert all(w > 0 for w in table.weights)
+
+
+def test_matrix_shape():
+    rules = SkillWeightRules(SKILL_WEIGHT_RULES, ARCHETYPE_CATEGORY_WEIGHTS)
+    assert len(rules.matrix) == 13
+    assert all(len(row) == len(rules.categories) for row in rules.matrix)
+    melee = rules.categories.index("melee_blade")
+    assert [row[melee] for row in rules.matrix[2:7]] == [
+        ("mul", 3), ("mul", 3), ("mul", 2), ("mul", 2), ("div", 2),
+    ]
+
+
+def test_overlapping_bands_rejected():
+    with pytest.raises(ValueError):
+        SkillWeightRules([("vehicle", 0, 6, "mul", 2), ("vehicle", 6, None, "div", 2)], {})
+    with pytest.raises(ValueError):
+        SkillWeightRules([("vehicle", None, None, "pow", 2)], {})
@@ -0,0 +1,38 @@
+import random
+
+from app.data_skills import SKILLS
+from app.models import Character, CharacterSkill
+from app.generator import ATTR_COSTS, spend_remaining_points
+
+
+def test_spends_everything_and_respects_max_attr():
+    char = Character(total_points=5000, tl=8)
+
+    spend_remaining_points(char, 8, False, False, max_attr=14, rng=random.Random(5))
+
+    assert char.remaining_points() == 0
+    assert all(getattr(char, a) == 14 for a in ATTR_COSTS)
+    # Всё, что не ушло в атрибуты, лежит в навыках
+    attr_spent = sum(4 * c for c in ATTR_COSTS.values())
+    assert sum(s.points for s in char.skills) == 5000 - attr_spent
+
+
+def test_small_leftover_never_overspends():
+    for seed in range(50):
+        char = Character(total_points=100, points_spent=93)
+
+        spend_remaining_points(char, 3, False, False, rng=seed)
+
+        assert char.remaining_points() == 0
+        assert char.points_spent == 100
+
+
+def test_catalog_skills_in_sheet_become_character_skills():
+    # Лист, собранный вручную из шаблонов каталога
+    char = Character(total_points=5000, tl=8, skills=list(SKILLS[:3]))
+
+    spend_remaining_points(char, 8, False, False, max_attr=10, rng=1)
+
+    assert all(isinstance(s, CharacterSkill) for s in char.skills)
+    assert [s.template for s in char.skills] == SKILLS[:3]
+    assert sum(s.points for s in char.skills) == 5000
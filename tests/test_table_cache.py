@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app import table_cache
+from app.generator import generate_characters, get_skill_table, invalidate_skill_tables
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("GURPS_CACHE_DIR", str(tmp_path))
+    yield tmp_path
+    invalidate_skill_tables()
+
+
+def test_roundtrip_matches_built_tables(cache_dir):
+    path = table_cache.save_table_cache()
+    assert path.parent == cache_dir and path.exists()
+
+    built = {key: get_skill_table(*key) for key in table_cache.all_table_keys()}
+    invalidate_skill_tables()
+    assert table_cache.load_table_cache() == 260
+    for key, table in built.items():
+        assert get_skill_table(*key) == table
+
+
+def test_stale_or_broken_file_is_ignored(cache_dir, monkeypatch):
+    path = table_cache.save_table_cache()
+    monkeypatch.setattr(table_cache, "_SOURCE_HASH", ["другой каталог"])
+    assert table_cache.load_table_cache(path) == 0
+
+    path.write_bytes(b"not a pickle")
+    monkeypatch.undo()
+    assert table_cache.load_table_cache(path) == 0
+
+
+@pytest.mark.parametrize("value", [None, ""])
+def test_disabled_unless_dir_is_set(monkeypatch, value):
+    if value is None:
+        monkeypatch.delenv("GURPS_CACHE_DIR", raising=False)
+    else:
+        monkeypatch.setenv("GURPS_CACHE_DIR", value)
+    assert table_cache.cache_path() is None
+    assert table_cache.load_table_cache() == 0
+    with pytest.raises(ValueError):
+        table_cache.save_table_cache()
+
+
+def test_generation_unchanged_with_cache(cache_dir):
+    expected = generate_characters(5, 150, 8, True, True, archetype="scout", seed=3)
+    table_cache.save_table_cache()
+    invalidate_skill_tables()
+    table_cache.load_table_cache()
+    assert generate_characters(5, 150, 8, True, True, archetype="scout", seed=3) == expected
+
+
+def test_fresh_process_loads_cache_on_first_use(cache_dir):
+    table_cache.save_table_cache()
+    code = (
+        "from app import generator\n"
+        "generator.build_skill_table = None\n"  # сборка с нуля недоступна
+        "generator.get_skill_table(8, 'warrior', False, True)\n"
+        "print(len(generator._SKILL_TABLES))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "260"
+
+
+def test_disabled_cache_is_not_imported(monkeypatch):
+    monkeypatch.delenv("GURPS_CACHE_DIR", raising=False)
+    code = (
+        "import sys\n"
+        "from app import generator\n"
+        "generator.get_skill_table(8, 'warrior', False, True)\n"
+        "print('app.table_cache' in sys.modules)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
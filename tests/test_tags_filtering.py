@@ -14,7 +14,6 @@ def test_filter_block_supernatural_and_super():
         tags=["mundane"],
         min_tl=0,
         max_tl=12,
-        points=0,
         categories=["social"],
         base_weight=1,
     )
@@ -26,7 +25,6 @@ def test_filter_block_supernatural_and_super():
         tags=["supernatural"],
         min_tl=0,
         max_tl=12,
-        points=0,
         categories=["magic"],
         base_weight=2,
     )
@@ -38,7 +36,6 @@ def test_filter_block_supernatural_and_super():
         tags=["super"],
         min_tl=0,
         max_tl=12,
-        points=0,
         categories=["melee_unarmed"],
         base_weight=2,
     )
@@ -14,7 +14,6 @@ def test_get_skill_weight_respects_tl():
         tags=["mundane"],
         min_tl=7,
         max_tl=12,
-        points=0,
         categories=["electronics"],
         base_weight=2,
     )
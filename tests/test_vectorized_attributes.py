@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.models import Character
+from app.generator import increase_attribute_randomly
+from app.vectorized import ATTR_COLUMNS, allocate_attributes_batch
+
+
+def scalar_means(n, budget, archetype, seed):
+    rng = random.Random(seed)
+    totals = [0] * len(ATTR_COLUMNS)
+    spent_total = 0
+    for _ in range(n):
+        char = Character()
+        spent_total += increase_attribute_randomly(char, budget, archetype, rng)
+        for i, attr in enumerate(ATTR_COLUMNS):
+            totals[i] += getattr(char, attr)
+    return [t / n for t in totals], spent_total / n
+
+
+@pytest.mark.parametrize("archetype", ["warrior", "scholar"])
+def test_batch_matches_scalar_distribution(archetype):
+    n = 20000
+    budget = 120
+
+    values, spent = allocate_attributes_batch(n, budget, archetype, rng=1)
+    expected, expected_spent = scalar_means(n, budget, archetype, seed=2)
+
+    assert values.shape == (n, len(ATTR_COLUMNS))
+    assert (spent <= budget).all()
+    assert (values <= 16).all()
+    for got, exp in zip(values.mean(axis=0), expected):
+        assert got == pytest.approx(exp, abs=0.05)
+    assert spent.mean() == pytest.approx(expected_spent, rel=0.02)
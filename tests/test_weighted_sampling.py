@@ -0,0 +1,72 @@
+import random
+from collections import Counter
+
+import pytest
+
+from app.sampling import WeightedSampler
+
+
+WEIGHTS = [1, 3, 2, 6, 1, 1, 4, 2, 9, 1]
+
+
+def reference_draws(weights, k, rng):
+    """Старый алгоритм pick_random_skills: random.choices + pop из списков."""
+    pool = list(range(len(weights)))
+    weights = list(weights)
+    picked = []
+    for _ in range(k):
+        item = rng.choices(pool, weights=weights, k=1)[0]
+        idx = pool.index(item)
+        pool.pop(idx)
+        weights.pop(idx)
+        picked.append(item)
+    return picked
+
+
+def sampler_draws(weights, k, rng):
+    sampler = WeightedSampler(weights)
+    return [sampler.pop(rng) for _ in range(k)]
+
+
+def test_sampler_matches_reference_for_same_seed():
+    for seed in range(200):
+        expected = reference_draws(WEIGHTS, len(WEIGHTS), random.Random(seed))
+        got = sampler_draws(WEIGHTS, len(WEIGHTS), random.Random(seed))
+        assert got == expected
+
+
+def test_sampler_distribution_matches_reference():
+    # Частоты «кто выпал на i-м шаге» для независимых потоков ГСЧ
+    trials = 20000
+    k = 4
+    ref_rng = random.Random(1)
+    new_rng = random.Random(2)
+
+    ref_counts = [Counter() for _ in range(k)]
+    new_counts = [Counter() for _ in range(k)]
+    for _ in range(trials):
+        for step, item in enumerate(reference_draws(WEIGHTS, k, ref_rng)):
+            ref_counts[step][item] += 1
+        for step, item in enumerate(sampler_draws(WEIGHTS, k, new_rng)):
+            new_counts[step][item] += 1
+
+    for step in range(k):
+        for item in range(len(WEIGHTS)):
+            p_ref = ref_counts[step][item] / trials
+            p_new = new_counts[step][item] / trials
+            # ~5 сигм для биномиальной разницы двух долей
+            sigma = (2 * max(p_ref, 1e-3) * (1 - p_ref) / trials) ** 0.5
+            assert abs(p_ref - p_new) < 5 * sigma + 1e-3
+
+
+def test_sampler_exhausts_without_repeats():
+    sampler = WeightedSampler([5, 0, 2, 1])
+    assert len(sampler) == 3
+
+    rng = random.Random(0)
+    picked = [sampler.pop(rng) for _ in range(3)]
+
+    assert sorted(picked) == [0, 2, 3]
+    assert not sampler
+    with pytest.raises(IndexError):
+        sampler.sample(rng)